@@ -0,0 +1,78 @@
+"""
+Benchmark: `import agenticflow` startup cost
+
+Runs each import statement in fresh interpreters with `-X importtime` and
+reports the median cumulative time and the slowest modules. Exits non-zero
+when a statement exceeds its budget, so it can gate CI.
+
+No API keys or models required.
+
+Usage:
+    uv run python examples/advanced/import_time_benchmark.py
+    uv run python examples/advanced/import_time_benchmark.py --runs 11 --top 15
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+
+# statement -> budget in milliseconds (cumulative, median of runs)
+BUDGETS = {
+    "import agenticflow": 50.0,
+    "from agenticflow import run, tool": 600.0,
+    "from agenticflow import Agent": 600.0,
+}
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def measure(statement: str) -> tuple[float, list[tuple[int, str]]]:
+    """Run a statement once; return total ms and (self µs, module) pairs."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    modules: list[tuple[int, str]] = []
+    for match in _LINE.finditer(proc.stderr):
+        self_us, cumulative_us, indent, name = match.groups()
+        modules.append((int(self_us), name))
+        if len(indent) == 1:  # Top-level import
+            total_us += int(cumulative_us)
+    return total_us / 1000, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args()
+
+    over_budget = False
+    for statement, budget in BUDGETS.items():
+        samples = []
+        modules: list[tuple[int, str]] = []
+        for _ in range(args.runs):
+            total, modules = measure(statement)
+            samples.append(total)
+        median = statistics.median(samples)
+        loaded = sum(1 for _, name in modules if name.startswith("agenticflow"))
+
+        status = "ok" if median <= budget else "OVER BUDGET"
+        over_budget |= median > budget
+        print(
+            f"{statement:<36} {median:>8.1f} ms  (budget {budget:.0f} ms)"
+            f"  agenticflow modules={loaded:<4} {status}"
+        )
+        for self_us, name in sorted(modules, reverse=True)[: args.top]:
+            print(f"    {self_us / 1000:>7.1f} ms  {name}")
+
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
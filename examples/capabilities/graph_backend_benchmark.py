@@ -0,0 +1,91 @@
+"""
+Benchmark: in-memory knowledge graph backends at scale
+
+Bulk-loads a random graph into CompactGraph and into the networkx-backed
+InMemoryGraph, then reports build time, memory footprint (tracemalloc) and
+latency of neighbor lookups and find_path. The networkx run is skipped when
+networkx is not installed.
+
+No API keys or models required.
+
+Usage:
+    uv run python examples/capabilities/graph_backend_benchmark.py
+    uv run python examples/capabilities/graph_backend_benchmark.py --edges 200000
+"""
+
+import argparse
+import gc
+import random
+import statistics
+import time
+import tracemalloc
+
+from agenticflow.capabilities.knowledge_graph import CompactGraph, InMemoryGraph
+
+RELATIONS = ["calls", "imports", "contains", "flows_to", "depends_on"]
+
+
+def make_edges(n_edges: int, n_nodes: int, seed: int = 0) -> list[tuple[str, str, str]]:
+    rng = random.Random(seed)
+    return [
+        (f"node_{rng.randrange(n_nodes)}", rng.choice(RELATIONS), f"node_{rng.randrange(n_nodes)}")
+        for _ in range(n_edges)
+    ]
+
+
+def timed(fn, samples: int) -> float:
+    """Median seconds per call."""
+    times = []
+    for i in range(samples):
+        start = time.perf_counter()
+        fn(i)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def run(label: str, factory, edges, n_nodes: int, samples: int) -> None:
+    gc.collect()
+    start = time.perf_counter()
+    graph = factory()
+    graph.add_relationships_batch(edges)
+    build = time.perf_counter() - start
+
+    # Second load under tracemalloc, which slows allocation down
+    tracemalloc.start()
+    factory().add_relationships_batch(edges)
+    memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    rng = random.Random(1)
+    pairs = [(f"node_{rng.randrange(n_nodes)}", f"node_{rng.randrange(n_nodes)}") for _ in range(samples)]
+
+    neighbors = timed(lambda i: graph.get_relationships(pairs[i][0], direction="both"), samples)
+    path = timed(lambda i: graph.find_path(*pairs[i], max_depth=6), samples)
+
+    print(
+        f"{label:<26} build {build:>6.1f} s   memory {memory / 2**20:>7.0f} MiB"
+        f"   neighbors {neighbors * 1e6:>7.1f} µs   find_path {path * 1e3:>8.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--nodes", type=int, default=200_000)
+    parser.add_argument("--samples", type=int, default=50)
+    args = parser.parse_args()
+
+    edges = make_edges(args.edges, args.nodes)
+    print(f"{args.edges:,} edges over {args.nodes:,} nodes\n")
+
+    run("CompactGraph", CompactGraph, edges, args.nodes, args.samples)
+
+    graph = InMemoryGraph()
+    if graph._nx is None:
+        print("InMemoryGraph (networkx)   skipped: networkx not installed")
+    else:
+        run("InMemoryGraph (networkx)", InMemoryGraph, edges, args.nodes, args.samples)
+
+
+if __name__ == "__main__":
+    main()
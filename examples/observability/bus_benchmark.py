@@ -0,0 +1,67 @@
+"""
+Micro-benchmark: TraceBus publish throughput
+
+Measures events per second through TraceBus.publish with a full history
+ring buffer, comparing inline dispatch against background dispatch when a
+slow handler (e.g. websocket push or Observer formatting) is subscribed.
+
+No API keys or models required.
+
+Usage:
+    uv run python examples/observability/bus_benchmark.py
+"""
+
+import asyncio
+import time
+
+from agenticflow.observability.bus import TraceBus
+from agenticflow.observability.trace_record import Trace, TraceType
+
+N_EVENTS = 50_000
+MAX_HISTORY = 10_000
+
+
+async def run(label: str, bus: TraceBus, n: int = N_EVENTS) -> None:
+    events = [Trace(type=TraceType.AGENT_THINKING, data={"i": i}) for i in range(n)]
+
+    start = time.perf_counter()
+    for event in events:
+        await bus.publish(event)
+    publish_s = time.perf_counter() - start
+
+    await bus.flush()
+    total_s = time.perf_counter() - start
+    await bus.close()
+
+    print(
+        f"{label:<32} publish: {n / publish_s:>12,.0f} ev/s"
+        f"   delivered: {n / total_s:>12,.0f} ev/s"
+        f"   history={bus.history_size}"
+    )
+
+
+async def main() -> None:
+    def noop(trace: Trace) -> None:
+        pass
+
+    async def slow(trace: Trace) -> None:
+        await asyncio.sleep(0)
+
+    bus = TraceBus(max_history=MAX_HISTORY)
+    await run("no handlers", bus)
+
+    bus = TraceBus(max_history=MAX_HISTORY)
+    bus.subscribe_all(noop)
+    await run("sync handler", bus)
+
+    bus = TraceBus(max_history=MAX_HISTORY)
+    bus.subscribe_all(slow)
+    await run("slow handler (inline)", bus)
+
+    bus = TraceBus(max_history=MAX_HISTORY, background=True)
+    bus.subscribe_all(slow)
+    await run("slow handler (background)", bus)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
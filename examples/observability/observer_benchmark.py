@@ -0,0 +1,68 @@
+"""
+Micro-benchmark: Observer per-event overhead
+
+Feeds a realistic mix of agent, tool and streaming traces straight into
+Observer._handle_event and reports the cost per event, so observability
+can stay enabled under load. Output goes to an in-memory stream.
+
+No API keys or models required.
+
+Usage:
+    uv run python examples/observability/observer_benchmark.py
+"""
+
+import io
+import time
+
+from agenticflow.observability import ObservabilityLevel, Observer
+from agenticflow.observability.trace_record import Trace, TraceType
+
+N_ROUNDS = 5_000
+
+
+def make_traces(rounds: int) -> list[Trace]:
+    traces: list[Trace] = []
+    for i in range(rounds):
+        agent = f"agent_{i % 8}"
+        traces += [
+            Trace(type=TraceType.AGENT_INVOKED, data={"agent_name": agent, "input": "task"}),
+            Trace(type=TraceType.TOOL_CALLED, data={"agent_name": agent, "tool": "search", "args": {"q": i}}),
+            Trace(type=TraceType.TOOL_RESULT, data={"agent_name": agent, "tool": "search", "result": "ok"}),
+            Trace(type=TraceType.TOKEN_STREAMED, data={"agent_name": agent, "token": "hi"}),
+            Trace(type=TraceType.AGENT_RESPONDED, data={"agent_name": agent, "response": "done"}),
+        ]
+    return traces
+
+
+def run(label: str, observer: Observer, traces: list[Trace]) -> None:
+    start = time.perf_counter()
+    for trace in traces:
+        observer._handle_event(trace)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{label:<34} {elapsed / len(traces) * 1e6:>8.2f} µs/event"
+        f"   {len(traces) / elapsed:>12,.0f} ev/s"
+        f"   retained={len(observer._events)}"
+    )
+
+
+def main() -> None:
+    traces = make_traces(N_ROUNDS)
+
+    run("production (ring=10k, no output)", Observer.production(), traces)
+    run("off (unbounded history)", Observer.off(), traces)
+    run(
+        "progress (formatted output)",
+        Observer(level=ObservabilityLevel.PROGRESS, stream=io.StringIO(), use_colors=False),
+        traces,
+    )
+    run(
+        "debug (formatted output)",
+        Observer(level=ObservabilityLevel.DEBUG, stream=io.StringIO(), use_colors=False),
+        traces,
+    )
+
+
+if __name__ == "__main__":
+    main()
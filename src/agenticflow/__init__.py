@@ -100,363 +100,326 @@ Multi-Agent Topology:
 
 __version__ = "1.4.0"
 
-# Core enums and utilities
-# Graph API (unified visualization)
-from agenticflow import graph
+import importlib as _importlib
+from typing import Any as _Any
+
+# Public names are resolved lazily (PEP 562) so ``import agenticflow`` stays
+# cheap: a script that only needs ``run`` or ``tool`` doesn't pay for flows,
+# observability, reactors, documents and every model provider.
+
+# Module -> names re-exported from it
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "agenticflow.agent.base": ("Agent",),
+    "agenticflow.agent.config": ("AgentConfig",),
+    "agenticflow.agent.hitl": (
+        "AbortedException",
+        "DecisionRequiredException",
+        "DecisionType",
+        "GuidanceResult",
+        "HumanDecision",
+        "HumanResponse",
+        "InterruptedException",
+        "InterruptedState",
+        "InterruptReason",
+        "PendingAction",
+        "should_interrupt",
+    ),
+    "agenticflow.agent.memory": (
+        "AgentMemory",
+        "InMemoryCheckpointer",
+        "InMemorySaver",
+        "MemoryCheckpoint",
+        "MemorySnapshot",
+        "ThreadConfig",
+    ),
+    "agenticflow.agent.output": ("OutputMethod", "ResponseSchema", "StructuredResult"),
+    "agenticflow.agent.resilience": (
+        "CircuitBreaker",
+        "CircuitState",
+        "FallbackRegistry",
+        "ResilienceConfig",
+        "RetryPolicy",
+        "RetryStrategy",
+        "ToolResilience",
+    ),
+    "agenticflow.agent.roles": (
+        "AutonomousRole",
+        "CustomRole",
+        "ReviewerRole",
+        "RoleConfig",
+        "SupervisorRole",
+        "WorkerRole",
+    ),
+    "agenticflow.agent.state": ("AgentState",),
+    "agenticflow.agent.streaming": (
+        "CollectorStreamCallback",
+        "PrintStreamCallback",
+        "StreamCallback",
+        "StreamChunk",
+        "StreamConfig",
+        "StreamEvent",
+        "StreamTraceType",
+        "ToolCallChunk",
+        "chunk_from_message",
+        "collect_stream",
+        "extract_tool_calls",
+        "print_stream",
+    ),
+    "agenticflow.core.context": ("EMPTY_CONTEXT", "RunContext"),
+    "agenticflow.core.enums": (
+        "AgentRole",
+        "AgentStatus",
+        "Priority",
+        "TaskStatus",
+        "get_role_capabilities",
+    ),
+    "agenticflow.core.utils": ("generate_id", "now_utc"),
+    "agenticflow.events": (
+        "Event",
+        "EventBus",
+        "EventMatcher",
+        "EventStore",
+        "FileEventStore",
+        "InMemoryEventStore",
+        "create_event_store",
+        "matches",
+    ),
+    "agenticflow.executors": (
+        "ExecutionPlan",
+        "ExecutionStrategy",
+        "NativeExecutor",
+        "SequentialExecutor",
+        "ToolCall",
+        "TreeSearchExecutor",
+        "create_executor",
+        "run",
+    ),
+    "agenticflow.flow": (
+        "BaseFlow",
+        "ExecutionContext",
+        "Flow",
+        "FlowConfig",
+        "FlowContext",
+        "FlowProtocol",
+        "FlowResult",
+    ),
+    "agenticflow.graph": ("GraphConfig", "GraphDirection", "GraphTheme", "GraphView"),
+    "agenticflow.interceptors": (
+        "AuditEvent",
+        "Auditor",
+        "AuditTraceType",
+        "BudgetGuard",
+        "ContentFilter",
+        "ContextCompressor",
+        "ContextPrompt",
+        "ConversationGate",
+        "ConversationPrompt",
+        "Failover",
+        "InterceptContext",
+        "Interceptor",
+        "InterceptResult",
+        "LambdaPrompt",
+        "PermissionGate",
+        "Phase",
+        "PIIAction",
+        "PIIShield",
+        "PromptAdapter",
+        "RateLimiter",
+        "StopExecution",
+        "ThrottleInterceptor",
+        "TokenLimiter",
+        "ToolGate",
+        "ToolGuard",
+        "run_interceptors",
+    ),
+    "agenticflow.middleware": (
+        "AggressiveTimeoutMiddleware",
+        "BaseMiddleware",
+        "LoggingMiddleware",
+        "Middleware",
+        "MiddlewareChain",
+        "RetryMiddleware",
+        "SimpleRetryMiddleware",
+        "SimpleTracingMiddleware",
+        "TimeoutMiddleware",
+        "TracingMiddleware",
+        "VerboseMiddleware",
+    ),
+    "agenticflow.models": (
+        "ChatModel",
+        "EmbeddingModel",
+        "create_chat",
+        "create_embedding",
+    ),
+    "agenticflow.models.azure": ("AzureOpenAIChat", "AzureOpenAIEmbedding"),
+    "agenticflow.observability": (
+        "AgentInspector",
+        "Channel",
+        "Colors",
+        "Counter",
+        "Dashboard",
+        "DashboardConfig",
+        "EventInspector",
+        "Gauge",
+        "Histogram",
+        "LogEntry",
+        "LogLevel",
+        "MetricsCollector",
+        "ObservabilityLevel",
+        "ObservabilityLogger",
+        "Observer",
+        "OutputConfig",
+        "OutputFormat",
+        "ProgressEvent",
+        "ProgressStyle",
+        "ProgressTracker",
+        "Span",
+        "SpanContext",
+        "SpanKind",
+        "Styler",
+        "Symbols",
+        "SystemInspector",
+        "TaskInspector",
+        "Timer",
+        "Tracer",
+        "Verbosity",
+        "configure_output",
+        "create_executor_callback",
+        "create_on_step_callback",
+        "render_dag_ascii",
+    ),
+    "agenticflow.observability.bus": ("TraceBus", "get_trace_bus", "set_trace_bus"),
+    "agenticflow.observability.handlers": (
+        "ConsoleEventHandler",
+        "FileEventHandler",
+        "FilteringEventHandler",
+        "MetricsEventHandler",
+    ),
+    "agenticflow.observability.trace_record": ("Trace", "TraceType"),
+    "agenticflow.flow.reactive": (
+        "EventFlow",
+        "EventFlowConfig",
+        "EventFlowResult",
+        "ReactiveFlow",
+        "ReactiveFlowConfig",
+        "ReactiveFlowResult",
+    ),
+    "agenticflow.flow.triggers": (
+        "AgentTriggerConfig",
+        "Trigger",
+        "on",
+        "react_to",
+        "when",
+    ),
+    "agenticflow.flow.patterns": (
+        "chain",
+        "pipeline",
+        "coordinator",
+        "supervisor",
+        "brainstorm",
+        "collaborative",
+        "mesh",
+    ),
+    "agenticflow.flow.skills": ("Skill", "SkillBuilder", "skill"),
+    "agenticflow.reactors": (
+        "AgentReactor",
+        "Aggregator",
+        "BaseReactor",
+        "CallbackGateway",
+        "ConditionalRouter",
+        "ErrorPolicy",
+        "FanInMode",
+        "FirstWins",
+        "FunctionReactor",
+        "Gateway",
+        "HandoverStrategy",
+        "HttpGateway",
+        "LogGateway",
+        "MapTransform",
+        "Reactor",
+        "ReactorConfig",
+        "Transform",
+        "WaitAll",
+        "function_reactor",
+        "wrap_agent",
+    ),
+    "agenticflow.tasks.manager": ("TaskManager",),
+    "agenticflow.tasks.task": ("Task",),
+    "agenticflow.tools.base": ("BaseTool", "tool"),
+    "agenticflow.tools.deferred": (
+        "DeferredManager",
+        "DeferredResult",
+        "DeferredRetry",
+        "DeferredStatus",
+        "is_deferred",
+    ),
+    "agenticflow.tools.registry": ("ToolRegistry", "create_tool_from_function"),
+    "agenticflow.capabilities": ("BaseCapability", "KnowledgeGraph"),
+    "agenticflow.core.messages": (
+        "AIMessage",
+        "BaseMessage",
+        "HumanMessage",
+        "SystemMessage",
+        "ToolMessage",
+    ),
+}
+
+# Names exported under a different name, and submodules (attribute None)
+_ALIASES: dict[str, tuple[str, str | None]] = {
+    "graph": ("agenticflow.graph", None),
+    "agent": ("agenticflow.agent", None),
+    "capabilities": ("agenticflow.capabilities", None),
+    "core": ("agenticflow.core", None),
+    "events": ("agenticflow.events", None),
+    "executors": ("agenticflow.executors", None),
+    "flow": ("agenticflow.flow", None),
+    "interceptors": ("agenticflow.interceptors", None),
+    "middleware": ("agenticflow.middleware", None),
+    "models": ("agenticflow.models", None),
+    "observability": ("agenticflow.observability", None),
+    "reactors": ("agenticflow.reactors", None),
+    "tasks": ("agenticflow.tasks", None),
+    "tools": ("agenticflow.tools", None),
+    "flow_brainstorm": ("agenticflow.flow", "brainstorm"),
+    "flow_chain": ("agenticflow.flow", "chain"),
+    "flow_collaborative": ("agenticflow.flow", "collaborative"),
+    "flow_coordinator": ("agenticflow.flow", "coordinator"),
+    "flow_mesh": ("agenticflow.flow", "mesh"),
+    "flow_pipeline": ("agenticflow.flow", "pipeline"),
+    "flow_supervisor": ("agenticflow.flow", "supervisor"),
+    "MiddlewareSpan": ("agenticflow.middleware", "Span"),
+    "EventRouter": ("agenticflow.reactors", "Router"),
+    "document": ("agenticflow.document", None),
+    "MermaidConfig": ("agenticflow.graph", "GraphConfig"),
+    "MermaidTheme": ("agenticflow.graph", "GraphTheme"),
+    "MermaidDirection": ("agenticflow.graph", "GraphDirection"),
+    "MermaidRenderer": ("agenticflow.graph", "GraphView"),
+    "AgentDiagram": ("agenticflow.graph", "GraphView"),
+    "TopologyDiagram": ("agenticflow.graph", "GraphView"),
+}
+
+_LAZY_IMPORTS: dict[str, tuple[str, str | None]] = {
+    name: (module, name) for module, names in _EXPORTS.items() for name in names
+}
+_LAZY_IMPORTS.update(_ALIASES)
+
+
+def __getattr__(name: str) -> _Any:
+    """Import public names on first access."""
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    module = _importlib.import_module(module_name)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value  # Cache so __getattr__ isn't hit again
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
 
-# Agents (THIS IS WHERE WE ADD VALUE)
-from agenticflow.agent.base import Agent
-from agenticflow.agent.config import AgentConfig
-from agenticflow.agent.hitl import (
-    AbortedException,
-    DecisionRequiredException,
-    DecisionType,
-    GuidanceResult,
-    HumanDecision,
-    HumanResponse,
-    InterruptedException,
-    InterruptedState,
-    InterruptReason,
-    PendingAction,
-    should_interrupt,
-)
-from agenticflow.agent.memory import (
-    AgentMemory,
-    InMemoryCheckpointer,  # Backward compat alias
-    InMemorySaver,
-    MemoryCheckpoint,  # Backward compat alias
-    MemorySnapshot,
-    ThreadConfig,
-)
-from agenticflow.agent.output import (
-    OutputMethod,
-    ResponseSchema,
-    StructuredResult,
-)
-from agenticflow.agent.resilience import (
-    CircuitBreaker,
-    CircuitState,
-    FallbackRegistry,
-    ResilienceConfig,
-    RetryPolicy,
-    RetryStrategy,
-    ToolResilience,
-)
-from agenticflow.agent.roles import (
-    AutonomousRole,
-    CustomRole,
-    ReviewerRole,
-    RoleConfig,
-    SupervisorRole,
-    WorkerRole,
-)
-from agenticflow.agent.state import AgentState
-from agenticflow.agent.streaming import (
-    CollectorStreamCallback,
-    PrintStreamCallback,
-    StreamCallback,
-    StreamChunk,
-    StreamConfig,
-    StreamEvent,
-    StreamTraceType,
-    ToolCallChunk,
-    chunk_from_message,
-    collect_stream,
-    extract_tool_calls,
-    print_stream,
-)
-
-# Context - invocation-scoped data
-from agenticflow.core.context import EMPTY_CONTEXT, RunContext
-from agenticflow.core.enums import (
-    AgentRole,
-    AgentStatus,
-    Priority,
-    TaskStatus,
-    get_role_capabilities,
-)
-from agenticflow.core.utils import generate_id, now_utc
-
-# Core Events (event-driven primitives)
-from agenticflow.events import (
-    Event,
-    EventBus,
-    EventMatcher,
-    EventStore,
-    FileEventStore,
-    InMemoryEventStore,
-    create_event_store,
-    matches,
-)
-
-# Core orchestration events (separate from observability)
-# Graphs - Execution strategies
-from agenticflow.executors import (
-    ExecutionPlan,
-    ExecutionStrategy,
-    NativeExecutor,
-    SequentialExecutor,
-    ToolCall,
-    TreeSearchExecutor,
-    create_executor,
-    run,
-)
-
-# Flow - THE MAIN ENTRY POINT
-from agenticflow.flow import (
-    # Base classes
-    BaseFlow,
-    ExecutionContext,
-    # Core Flow (unified event-driven orchestration)
-    Flow,
-    FlowConfig,
-    # Context
-    FlowContext,
-    FlowProtocol,
-    FlowResult,
-)
-from agenticflow.flow import (
-    brainstorm as flow_brainstorm,
-)
-from agenticflow.flow import (
-    chain as flow_chain,
-)
-from agenticflow.flow import (
-    collaborative as flow_collaborative,
-)
-from agenticflow.flow import (
-    coordinator as flow_coordinator,
-)
-from agenticflow.flow import (
-    mesh as flow_mesh,
-)
-from agenticflow.flow import (
-    # Patterns (imported with aliases to avoid shadowing by legacy topologies)
-    pipeline as flow_pipeline,
-)
-from agenticflow.flow import (
-    supervisor as flow_supervisor,
-)
-
-from agenticflow.graph import (
-    GraphConfig,
-    GraphDirection,
-    GraphTheme,
-    GraphView,
-)
-
-# Interceptors (execution flow control)
-from agenticflow.interceptors import (
-    AuditEvent,
-    Auditor,
-    AuditTraceType,
-    BudgetGuard,
-    ContentFilter,
-    ContextCompressor,
-    ContextPrompt,
-    ConversationGate,
-    ConversationPrompt,
-    Failover,
-    InterceptContext,
-    Interceptor,
-    InterceptResult,
-    LambdaPrompt,
-    PermissionGate,
-    Phase,
-    PIIAction,
-    PIIShield,
-    PromptAdapter,
-    RateLimiter,
-    StopExecution,
-    ThrottleInterceptor,
-    TokenLimiter,
-    # Context Layer
-    ToolGate,
-    ToolGuard,
-    run_interceptors,
-)
-
-# Middleware (cross-cutting concerns)
-from agenticflow.middleware import (
-    AggressiveTimeoutMiddleware,
-    BaseMiddleware,
-    LoggingMiddleware,
-    Middleware,
-    MiddlewareChain,
-    RetryMiddleware,
-    SimpleRetryMiddleware,
-    SimpleTracingMiddleware,
-    TimeoutMiddleware,
-    TracingMiddleware,
-    VerboseMiddleware,
-)
-from agenticflow.middleware import (
-    Span as MiddlewareSpan,  # Renamed to avoid conflict with observability.Span
-)
-
-# LLM & Embedding Models (native)
-from agenticflow.models import (
-    ChatModel,
-    EmbeddingModel,
-    create_chat,
-    create_embedding,
-)
-
-# Provider-specific model imports for convenience
-from agenticflow.models.azure import AzureOpenAIChat, AzureOpenAIEmbedding
-
-# Observability (THIS IS WHERE WE ADD VALUE)
-from agenticflow.observability import (
-    AgentInspector,
-    Channel,
-    Colors,
-    Counter,
-    Dashboard,
-    DashboardConfig,
-    EventInspector,
-    Gauge,
-    Histogram,
-    LogEntry,
-    LogLevel,
-    MetricsCollector,
-    ObservabilityLevel,
-    ObservabilityLogger,
-    # Observer (unified observability for agents, flows, teams)
-    Observer,
-    # Progress & Output system
-    OutputConfig,
-    OutputFormat,
-    ProgressEvent,
-    ProgressStyle,
-    ProgressTracker,
-    Span,
-    SpanContext,
-    SpanKind,
-    Styler,
-    Symbols,
-    SystemInspector,
-    TaskInspector,
-    Timer,
-    Tracer,
-    Verbosity,
-    configure_output,
-    create_executor_callback,
-    create_on_step_callback,
-    render_dag_ascii,
-)
-
-# Events (THIS IS WHERE WE ADD VALUE)
-from agenticflow.observability.bus import TraceBus, get_trace_bus, set_trace_bus
-from agenticflow.observability.handlers import (
-    ConsoleEventHandler,
-    FileEventHandler,
-    FilteringEventHandler,
-    MetricsEventHandler,
-)
-
-# Models
-from agenticflow.observability.trace_record import Trace, TraceType
-
-# Reactive Flow (event-driven multi-agent orchestration)
-from agenticflow.flow.reactive import (
-    EventFlow,
-    EventFlowConfig,
-    EventFlowResult,
-    ReactiveFlow,
-    ReactiveFlowConfig,
-    ReactiveFlowResult,
-)
-from agenticflow.flow.triggers import (
-    AgentTriggerConfig,
-    Trigger,
-    on,  # Backward compat alias
-    react_to,
-    when,
-)
-from agenticflow.flow.patterns import (
-    # Pipeline
-    chain,
-    pipeline,
-    # Supervisor
-    coordinator,
-    supervisor,
-    # Mesh
-    brainstorm,
-    collaborative,
-    mesh,
-)
-from agenticflow.flow.skills import (
-    Skill,
-    SkillBuilder,
-    skill,
-)
-
-# Reactors (event handlers for flows)
-from agenticflow.reactors import (
-    AgentReactor,
-    Aggregator,
-    BaseReactor,
-    CallbackGateway,
-    ConditionalRouter,
-    ErrorPolicy,
-    FanInMode,
-    FirstWins,
-    FunctionReactor,
-    Gateway,
-    HandoverStrategy,
-    HttpGateway,
-    LogGateway,
-    MapTransform,
-    Reactor,
-    ReactorConfig,
-    Transform,
-    WaitAll,
-    function_reactor,
-    wrap_agent,
-)
-from agenticflow.reactors import (
-    Router as EventRouter,  # Renamed to avoid conflict with reactive.Router
-)
-
-# Tasks
-from agenticflow.tasks.manager import TaskManager
-from agenticflow.tasks.task import Task
-from agenticflow.tools.base import BaseTool, tool
-from agenticflow.tools.deferred import (
-    DeferredManager,
-    DeferredResult,
-    DeferredRetry,
-    DeferredStatus,
-    is_deferred,
-)
-
-# Tools (THIS IS WHERE WE ADD VALUE)
-from agenticflow.tools.registry import ToolRegistry, create_tool_from_function
-
-# Backwards-compatible aliases for visualization module
-MermaidConfig = GraphConfig
-MermaidTheme = GraphTheme
-MermaidDirection = GraphDirection
-MermaidRenderer = GraphView  # Closest equivalent
-AgentDiagram = GraphView  # Use GraphView.from_agent() instead
-TopologyDiagram = GraphView  # Use GraphView.from_topology() instead
-
-# Capabilities (composable tools for agents)
-# Document processing module
-from agenticflow import document
-from agenticflow.capabilities import (
-    BaseCapability,
-    KnowledgeGraph,
-)
-
-# Native message types (from core.messages)
-from agenticflow.core.messages import (
-    AIMessage,
-    BaseMessage,
-    HumanMessage,
-    SystemMessage,
-    ToolMessage,
-)
 
 # All public exports
 __all__ = [
@@ -339,6 +339,11 @@ class Agent:
         # Extract tool names and store tool objects
         tool_names: list[str] = []
         self._direct_tools: list[BaseTool] = []
+        # Tool index (ordered list + name map), rebuilt when tools change
+        self._tools_version = 0
+        self._tool_index_key: tuple[Any, ...] | None = None
+        self._tool_list: list[BaseTool] = []
+        self._tool_index: dict[str, BaseTool] = {}
 
         if tools:
             for tool in tools:
@@ -1213,17 +1218,50 @@ class Agent:
         1. Direct tools (passed to Agent constructor)
         2. Registry tools (if tool_registry is set)
         """
+        return list(self._refresh_tool_index())
+
+    def _refresh_tool_index(self) -> list[BaseTool]:
+        """Rebuild the tool list and name index if tools changed.
+
+        The index is keyed on the agent's tool version, the direct tool
+        and configured name counts, and the registry's change counter, so
+        lookups cost a tuple comparison instead of a rebuild.
+
+        Returns:
+            Ordered tool list (shared; do not mutate).
+        """
+        registry = self.tool_registry
+        key = (
+            self._tools_version,
+            len(self._direct_tools),
+            id(self.config),
+            len(self.config.tools),
+            id(registry),
+            # Registries without a change counter are never cached
+            getattr(registry, "version", None) if registry is not None else 0,
+        )
+        if key == self._tool_index_key and key[-1] is not None:
+            return self._tool_list
+
         tools: list[BaseTool] = list(self._direct_tools)
+        index: dict[str, BaseTool] = {}
+        for tool in tools:
+            # First direct tool with a name wins
+            index.setdefault(tool.name, tool)
 
         # Add registry tools that aren't already in direct tools
-        if self.tool_registry:
-            direct_names = {t.name for t in tools}
+        if registry:
+            direct_names = set(index)
             for name in self.config.tools:
                 if name not in direct_names:
-                    tool = self.tool_registry.get(name)
+                    tool = registry.get(name)
                     if tool:
                         tools.append(tool)
+                        index.setdefault(name, tool)
 
+        self._tool_list = tools
+        self._tool_index = index
+        self._tool_index_key = key
         return tools
 
     def _get_tool(self, tool_name: str) -> BaseTool | None:
@@ -1235,12 +1273,12 @@ class Agent:
         Returns:
             The tool object, or None if not found.
         """
-        # Check direct tools first (higher priority)
-        for tool in self._direct_tools:
-            if tool.name == tool_name:
-                return tool
+        self._refresh_tool_index()
+        tool = self._tool_index.get(tool_name)
+        if tool is not None:
+            return tool
 
-        # Fall back to registry
+        # Fall back to registry (tools not listed in config.tools)
         if self.tool_registry:
             return self.tool_registry.get(tool_name)
 
@@ -1269,6 +1307,7 @@ class Agent:
 
     def invalidate_caches(self) -> None:
         """Invalidate all performance caches. Call when tools change."""
+        self._tools_version += 1
         self._cached_tool_descriptions = None
         self._cached_system_prompt = None
         self._cached_bound_model = None
@@ -513,23 +513,30 @@ class CodebaseAnalyzer(BaseCapability):
             List of usage information
         """
         usages = []
+        graph = self._kg.graph
 
         # Check various entity types
-        for prefix in ["class:", "function:", "method:", "callable:", "import:"]:
-            entity_id = f"{prefix}{name}"
-            entity = self._kg.get_entity(entity_id)
-            if entity:
-                # Get all relationships pointing to this entity
-                rels = self._kg.get_relationships(entity_id, direction="incoming")
-                for rel in rels:
-                    source = self._kg.get_entity(rel.source)
-                    if source:
-                        usages.append({
-                            "used_in": source.id,
-                            "type": source.type,
-                            "relationship": rel.relation,
-                            "file": source.attributes.get("file_path", "unknown"),
-                        })
+        candidates = [
+            f"{prefix}{name}"
+            for prefix in ["class:", "function:", "method:", "callable:", "import:"]
+        ]
+        found = graph.get_entities_batch(candidates)
+        targets = [eid for eid in candidates if eid in found]
+
+        # Get all relationships pointing to these entities in one pass
+        rels = graph.get_relationships_batch(targets, direction="incoming")
+        rels.sort(key=lambda rel: targets.index(rel.target_id))
+        sources = graph.get_entities_batch([rel.source_id for rel in rels])
+
+        for rel in rels:
+            source = sources.get(rel.source_id)
+            if source:
+                usages.append({
+                    "used_in": source.id,
+                    "type": source.type,
+                    "relationship": rel.relation,
+                    "file": source.attributes.get("file_path", "unknown"),
+                })
 
         return usages
 
@@ -3,6 +3,7 @@ KnowledgeGraph capability for persistent entity/relationship memory.
 
 This module provides a knowledge graph capability with multiple storage backends:
 - In-memory graph (uses networkx if available)
+- Compact in-memory graph for millions of edges
 - SQLite database for persistence and large graphs
 - JSON file for simple persistence with auto-save
 
@@ -22,6 +23,7 @@ Example:
 """
 
 from agenticflow.capabilities.knowledge_graph.backends import (
+    CompactGraph,
     GraphBackend,
     InMemoryGraph,
     JSONFileGraph,
@@ -39,6 +41,7 @@ __all__ = [
     # Backends
     "GraphBackend",
     "InMemoryGraph",
+    "CompactGraph",
     "SQLiteGraph",
     "JSONFileGraph",
 ]
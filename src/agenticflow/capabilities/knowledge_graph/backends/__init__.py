@@ -2,12 +2,14 @@
 
 This module provides different storage backends for the KnowledgeGraph:
 - InMemoryGraph: Fast in-memory storage using networkx (if available)
+- CompactGraph: Memory-efficient in-memory storage for large graphs
 - SQLiteGraph: Persistent storage using SQLite for large graphs
 - JSONFileGraph: Simple JSON file persistence with auto-save
 - Neo4jGraph: Production graph database with Cypher queries
 """
 
 from agenticflow.capabilities.knowledge_graph.backends.base import GraphBackend
+from agenticflow.capabilities.knowledge_graph.backends.compact import CompactGraph
 from agenticflow.capabilities.knowledge_graph.backends.json_file import JSONFileGraph
 from agenticflow.capabilities.knowledge_graph.backends.memory import InMemoryGraph
 from agenticflow.capabilities.knowledge_graph.backends.sqlite import SQLiteGraph
@@ -23,6 +25,7 @@ except ImportError:
 __all__ = [
     "GraphBackend",
     "InMemoryGraph",
+    "CompactGraph",
     "SQLiteGraph",
     "JSONFileGraph",
     "Neo4jGraph",
@@ -7,6 +7,7 @@ Defines the interface all storage backends must implement.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
@@ -108,6 +109,57 @@ class GraphBackend(ABC):
             self.add_relationship(src, rel, tgt)
         return len(relationships)
 
+    def get_entities_batch(self, entity_ids: Sequence[str]) -> dict[str, Entity]:
+        """Get many entities by ID (missing IDs are omitted). Override for better performance."""
+        entities: dict[str, Entity] = {}
+        for eid in dict.fromkeys(entity_ids):
+            entity = self.get_entity(eid)
+            if entity is not None:
+                entities[eid] = entity
+        return entities
+
+    def get_relationships_batch(
+        self,
+        entity_ids: Sequence[str],
+        relation: str | None = None,
+        direction: str = "outgoing",
+    ) -> list[Relationship]:
+        """Get relationships for many entities at once.
+
+        Order across entities is backend-specific. Override for better
+        performance.
+        """
+        results: list[Relationship] = []
+        for eid in dict.fromkeys(entity_ids):
+            results.extend(self.get_relationships(eid, relation, direction))
+        return results
+
+    def neighborhood(
+        self,
+        entity_id: str,
+        depth: int = 1,
+        relation: str | None = None,
+        direction: str = "outgoing",
+    ) -> dict[str, int]:
+        """Get entities within ``depth`` hops, mapped to their hop distance.
+
+        Expands one level per batched relationship lookup. Override for
+        better performance.
+        """
+        distances = {entity_id: 0}
+        frontier = [entity_id]
+        for hop in range(1, depth + 1):
+            if not frontier:
+                break
+            next_frontier: list[str] = []
+            for rel in self.get_relationships_batch(frontier, relation, direction):
+                for node in (rel.source_id, rel.target_id):
+                    if node not in distances:
+                        distances[node] = hop
+                        next_frontier.append(node)
+            frontier = next_frontier
+        return distances
+
     def save(self, path: str | Path | None = None) -> None:
         """Save graph to persistent storage (optional)."""
         pass
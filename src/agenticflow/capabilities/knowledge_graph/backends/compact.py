@@ -0,0 +1,590 @@
+"""Compact in-memory graph backend with interned IDs and adjacency arrays."""
+
+from __future__ import annotations
+
+import json
+import sys
+from array import array
+from collections import deque
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from agenticflow.capabilities.knowledge_graph.backends.base import GraphBackend
+from agenticflow.capabilities.knowledge_graph.models import Entity, Relationship
+
+# Node, relation and edge IDs are stored as C ints
+_ID = "i"
+
+
+def _key(src: int, rel: int, tgt: int) -> int:
+    """Pack an edge's (source, relation, target) into one int."""
+    return (src << 64) | (tgt << 32) | rel
+
+
+class CompactGraph(GraphBackend):
+    """In-memory graph storage built for large graphs, no networkx needed.
+
+    Entity and relation names are interned to ints. Edges live in parallel
+    arrays and every node keeps one outgoing and one incoming edge-ID
+    array, so neighbor lookups touch only the node's own edges; relation
+    filters read the edge's relation from the shared array. A relation-type
+    index serves ``"? -relation-> ?"`` queries. Attributes and provenance
+    are stored only when set.
+
+    Example:
+        ```python
+        graph = CompactGraph()
+        graph.add_relationships_batch(edges)  # Bulk load
+        graph.find_path("a", "z", max_depth=6)  # Bidirectional BFS
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        # Nodes: interned IDs; type None means "only referenced by edges"
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._types: list[str | None] = []
+        self._created = array("d")
+        self._updated = array("d")
+        self._attributes: dict[int, dict[str, Any]] = {}
+        self._sources: dict[int, str] = {}
+        self._entity_count = 0
+
+        # Adjacency: node -> edge IDs (None until the node has edges)
+        self._out: list[array | None] = []
+        self._in: list[array | None] = []
+
+        # Relations: interned names plus relation -> edge IDs index
+        self._relation_ids: dict[str, int] = {}
+        self._relation_names: list[str] = []
+        self._by_relation: dict[int, array] = {}
+
+        # Edges: parallel arrays indexed by edge ID; removed edges have src -1
+        self._edge_src = array(_ID)
+        self._edge_rel = array(_ID)
+        self._edge_tgt = array(_ID)
+        self._edge_created = array("d")
+        self._edge_keys: set[int] = set()  # _key(...) of live edges
+        self._edge_attributes: dict[int, dict[str, Any]] = {}
+        self._edge_sources: dict[int, str] = {}
+
+    # -- interning -------------------------------------------------------
+
+    def _node(self, name: str) -> int:
+        node = self._ids.get(name)
+        if node is None:
+            node = self._ids[name] = len(self._names)
+            self._names.append(name)
+            self._types.append(None)
+            self._created.append(0.0)
+            self._updated.append(0.0)
+            self._out.append(None)
+            self._in.append(None)
+        return node
+
+    def _relation(self, name: str) -> int:
+        rel = self._relation_ids.get(name)
+        if rel is None:
+            rel = self._relation_ids[name] = len(self._relation_names)
+            self._relation_names.append(sys.intern(name))
+            self._by_relation[rel] = array(_ID)
+        return rel
+
+    def _link(self, src: int, rel: int, tgt: int, created: float) -> int:
+        """Append a new edge and index it; returns the edge ID."""
+        edge = len(self._edge_src)
+        self._edge_src.append(src)
+        self._edge_rel.append(rel)
+        self._edge_tgt.append(tgt)
+        self._edge_created.append(created)
+        self._edge_keys.add(_key(src, rel, tgt))
+        self._by_relation[rel].append(edge)
+
+        out = self._out[src]
+        if out is None:
+            out = self._out[src] = array(_ID)
+        out.append(edge)
+        incoming = self._in[tgt]
+        if incoming is None:
+            incoming = self._in[tgt] = array(_ID)
+        incoming.append(edge)
+        return edge
+
+    def _find_edge(self, src: int, rel: int, tgt: int) -> int | None:
+        if _key(src, rel, tgt) not in self._edge_keys:
+            return None
+        edge_rel, edge_tgt = self._edge_rel, self._edge_tgt
+        for edge in self._out[src]:  # type: ignore[union-attr]
+            if edge_tgt[edge] == tgt and edge_rel[edge] == rel:
+                return edge
+        return None
+
+    def _edges(self, node: int, relation: str | None, outgoing: bool) -> list[int]:
+        edges = (self._out if outgoing else self._in)[node]
+        if not edges:
+            return []
+        if relation is None:
+            return list(edges)
+        rel = self._relation_ids.get(relation)
+        edge_rel = self._edge_rel
+        return [e for e in edges if edge_rel[e] == rel] if rel is not None else []
+
+    def _relationship(self, edge: int) -> Relationship:
+        return Relationship(
+            source_id=self._names[self._edge_src[edge]],
+            relation=self._relation_names[self._edge_rel[edge]],
+            target_id=self._names[self._edge_tgt[edge]],
+            attributes=self._edge_attributes.get(edge, {}),
+            created_at=datetime.fromtimestamp(self._edge_created[edge], UTC),
+            source=self._edge_sources.get(edge),
+        )
+
+    def _entity(self, node: int) -> Entity:
+        return Entity(
+            id=self._names[node],
+            type=self._types[node],  # type: ignore[arg-type]
+            attributes=self._attributes.get(node, {}),
+            created_at=datetime.fromtimestamp(self._created[node], UTC),
+            updated_at=datetime.fromtimestamp(self._updated[node], UTC),
+            source=self._sources.get(node),
+        )
+
+    # -- entities --------------------------------------------------------
+
+    def add_entity(
+        self,
+        entity_id: str,
+        entity_type: str,
+        attributes: dict[str, Any] | None = None,
+        source: str | None = None,
+    ) -> Entity:
+        """Add or update an entity."""
+        now = datetime.now(UTC).timestamp()
+        node = self._node(entity_id)
+
+        if self._types[node] is None:
+            self._entity_count += 1
+            self._created[node] = now
+        self._types[node] = sys.intern(entity_type)
+        self._updated[node] = now
+        if attributes:
+            self._attributes[node] = {**self._attributes.get(node, {}), **attributes}
+        if source:
+            self._sources[node] = source
+
+        return self._entity(node)
+
+    def add_entities_batch(
+        self,
+        entities: list[tuple[str, str, dict[str, Any] | None]],
+    ) -> int:
+        """
+        Bulk insert entities, replacing existing ones.
+
+        Args:
+            entities: List of (entity_id, entity_type, attributes) tuples
+
+        Returns:
+            Number of entities inserted
+        """
+        now = datetime.now(UTC).timestamp()
+        node_of, types, stored = self._node, self._types, self._attributes
+        created, updated, sources = self._created, self._updated, self._sources
+
+        for eid, etype, attrs in entities:
+            node = node_of(eid)
+            if types[node] is None:
+                self._entity_count += 1
+            types[node] = sys.intern(etype)
+            created[node] = updated[node] = now
+            sources.pop(node, None)
+            if attrs:
+                stored[node] = dict(attrs)
+            else:
+                stored.pop(node, None)
+
+        return len(entities)
+
+    def get_entity(self, entity_id: str) -> Entity | None:
+        """Get an entity by ID."""
+        node = self._ids.get(entity_id)
+        if node is None or self._types[node] is None:
+            return None
+        return self._entity(node)
+
+    def get_all_entities(
+        self,
+        entity_type: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[Entity]:
+        """Get all entities, optionally filtered by type with pagination."""
+        nodes = [
+            node
+            for node, node_type in enumerate(self._types)
+            if node_type is not None and (entity_type is None or node_type == entity_type)
+        ]
+        end = None if limit is None else offset + limit
+        return [self._entity(node) for node in nodes[offset:end]]
+
+    def remove_entity(self, entity_id: str) -> bool:
+        """Remove an entity and its relationships."""
+        node = self._ids.get(entity_id)
+        if node is None or self._types[node] is None:
+            return False
+
+        self._types[node] = None
+        self._attributes.pop(node, None)
+        self._sources.pop(node, None)
+        self._entity_count -= 1
+
+        edges = set(self._edges(node, None, True)) | set(self._edges(node, None, False))
+        for edge in edges:
+            src, rel, tgt = self._edge_src[edge], self._edge_rel[edge], self._edge_tgt[edge]
+            for adjacency, end in ((self._in, tgt), (self._out, src)):
+                if end != node:
+                    adjacency[end].remove(edge)  # type: ignore[union-attr]
+            self._edge_keys.discard(_key(src, rel, tgt))
+            self._edge_attributes.pop(edge, None)
+            self._edge_sources.pop(edge, None)
+            # Tombstone; the relation index skips it on read
+            self._edge_src[edge] = -1
+        self._out[node] = self._in[node] = None
+
+        return True
+
+    # -- relationships ---------------------------------------------------
+
+    def add_relationship(
+        self,
+        source_id: str,
+        relation: str,
+        target_id: str,
+        attributes: dict[str, Any] | None = None,
+        source: str | None = None,
+    ) -> Relationship:
+        """Add a relationship between entities, replacing an existing one."""
+        now = datetime.now(UTC).timestamp()
+        src, rel, tgt = self._node(source_id), self._relation(relation), self._node(target_id)
+
+        edge = self._find_edge(src, rel, tgt)
+        if edge is None:
+            edge = self._link(src, rel, tgt, now)
+        else:
+            self._edge_created[edge] = now
+
+        if attributes:
+            self._edge_attributes[edge] = attributes
+        else:
+            self._edge_attributes.pop(edge, None)
+        if source:
+            self._edge_sources[edge] = source
+        else:
+            self._edge_sources.pop(edge, None)
+
+        return self._relationship(edge)
+
+    def add_relationships_batch(
+        self,
+        relationships: list[tuple[str, str, str]],
+    ) -> int:
+        """
+        Bulk insert relationships, skipping existing ones.
+
+        Args:
+            relationships: List of (source_id, relation, target_id) tuples
+
+        Returns:
+            Number of relationships inserted
+        """
+        now = datetime.now(UTC).timestamp()
+        node_of, relation_of = self._node, self._relation
+        edge_keys, link = self._edge_keys, self._link
+
+        for source_id, relation, target_id in relationships:
+            src, rel, tgt = node_of(source_id), relation_of(relation), node_of(target_id)
+            if ((src << 64) | (tgt << 32) | rel) not in edge_keys:
+                link(src, rel, tgt, now)
+
+        return len(relationships)
+
+    def get_relationships(
+        self,
+        entity_id: str,
+        relation: str | None = None,
+        direction: str = "outgoing",
+    ) -> list[Relationship]:
+        """Get relationships for an entity."""
+        node = self._ids.get(entity_id)
+        if node is None:
+            return []
+
+        edges: list[int] = []
+        if direction in ("outgoing", "both"):
+            edges += self._edges(node, relation, True)
+        if direction in ("incoming", "both"):
+            edges += self._edges(node, relation, False)
+        return [self._relationship(edge) for edge in edges]
+
+    def get_relationships_by_relation(self, relation: str) -> list[Relationship]:
+        """Get every relationship of one type, in insertion order."""
+        rel = self._relation_ids.get(relation)
+        if rel is None:
+            return []
+        src = self._edge_src
+        return [self._relationship(e) for e in self._by_relation[rel] if src[e] >= 0]
+
+    def query(self, pattern: str) -> list[dict[str, Any]]:
+        """
+        Query the graph with a simple pattern.
+
+        Patterns:
+        - "entity_id" - Get entity and its relationships
+        - "entity_id -relation-> ?" - Find targets of relation
+        - "? -relation-> entity_id" - Find sources of relation
+        - "? -relation-> ?" - Find all relationships of a type
+        - "entity_id -?-> ?" - Find all outgoing relationships
+        """
+        results: list[dict[str, Any]] = []
+        pattern = pattern.strip()
+
+        # Pattern: ? -relation-> ?
+        if pattern.startswith("? -") and pattern.endswith("-> ?"):
+            relation = pattern[3:-4].strip()
+            for rel in self.get_relationships_by_relation(relation):
+                results.append(
+                    {
+                        "source": rel.source_id,
+                        "relation": rel.relation,
+                        "target": rel.target_id,
+                    }
+                )
+
+        # Pattern: entity_id -relation-> ?
+        elif " -" in pattern and "-> ?" in pattern:
+            parts = pattern.split(" -")
+            source = parts[0].strip()
+            relation = parts[1].replace("-> ?", "").strip()
+            relation = None if relation == "?" else relation
+
+            for rel in self.get_relationships(source, relation, "outgoing"):
+                target = self.get_entity(rel.target_id)
+                results.append(
+                    {
+                        "source": source,
+                        "relation": rel.relation,
+                        "target": rel.target_id,
+                        "target_type": target.type if target else "unknown",
+                        "target_attributes": target.attributes if target else {},
+                    }
+                )
+
+        # Pattern: ? -relation-> entity_id
+        elif "? -" in pattern and "-> " in pattern:
+            parts = pattern.split("-> ")
+            target = parts[1].strip()
+            relation = parts[0].replace("? -", "").strip()
+            relation = None if relation == "?" else relation
+
+            for rel in self.get_relationships(target, relation, "incoming"):
+                source_entity = self.get_entity(rel.source_id)
+                results.append(
+                    {
+                        "source": rel.source_id,
+                        "source_type": source_entity.type if source_entity else "unknown",
+                        "relation": rel.relation,
+                        "target": target,
+                    }
+                )
+
+        # Pattern: just entity_id - return entity + relationships
+        else:
+            entity = self.get_entity(pattern)
+            if entity:
+                results.append(
+                    {
+                        "entity": entity.to_dict(),
+                        "outgoing": [
+                            r.to_dict()
+                            for r in self.get_relationships(pattern, direction="outgoing")
+                        ],
+                        "incoming": [
+                            r.to_dict()
+                            for r in self.get_relationships(pattern, direction="incoming")
+                        ],
+                    }
+                )
+
+        return results
+
+    # -- traversal -------------------------------------------------------
+
+    def _neighbors(self, node: int, outgoing: bool, rel: int | None = None) -> list[int]:
+        edges = (self._out if outgoing else self._in)[node]
+        if not edges:
+            return []
+        ends = self._edge_tgt if outgoing else self._edge_src
+        if rel is not None:
+            edge_rel = self._edge_rel
+            return [ends[e] for e in edges if edge_rel[e] == rel]
+        return [ends[e] for e in edges]
+
+    def find_path(
+        self, source_id: str, target_id: str, max_depth: int = 3
+    ) -> list[list[str]] | None:
+        """Find the shortest path between two entities.
+
+        Bidirectional BFS: each round expands one full level of the smaller
+        frontier, forward along outgoing edges from the source or backward
+        along incoming edges from the target. ``max_depth`` is in hops.
+        """
+        if source_id == target_id:
+            return [[source_id]]
+        start, goal = self._ids.get(source_id), self._ids.get(target_id)
+        if start is None or goal is None:
+            return None
+
+        # node -> (parent, depth) for each side
+        forward: dict[int, tuple[int, int]] = {start: (start, 0)}
+        backward: dict[int, tuple[int, int]] = {goal: (goal, 0)}
+        forward_queue, backward_queue = deque([start]), deque([goal])
+        forward_depth = backward_depth = 0
+
+        while forward_queue and backward_queue and forward_depth + backward_depth < max_depth:
+            outgoing = len(forward_queue) <= len(backward_queue)
+            queue, seen, other = (
+                (forward_queue, forward, backward)
+                if outgoing
+                else (backward_queue, backward, forward)
+            )
+            depth = (forward_depth if outgoing else backward_depth) + 1
+
+            best: tuple[int, int] | None = None  # (total hops, meeting node)
+            for _ in range(len(queue)):
+                node = queue.popleft()
+                for neighbor in self._neighbors(node, outgoing):
+                    if neighbor in seen:
+                        continue
+                    seen[neighbor] = (node, depth)
+                    queue.append(neighbor)
+                    if neighbor in other:
+                        hops = depth + other[neighbor][1]
+                        if best is None or hops < best[0]:
+                            best = (hops, neighbor)
+
+            if outgoing:
+                forward_depth = depth
+            else:
+                backward_depth = depth
+
+            if best is not None:
+                return [self._join(best[1], forward, backward)]
+
+        return None
+
+    def _join(
+        self,
+        meet: int,
+        forward: dict[int, tuple[int, int]],
+        backward: dict[int, tuple[int, int]],
+    ) -> list[str]:
+        """Stitch the two BFS trees together at the meeting node."""
+        path = [meet]
+        while forward[path[0]][1]:
+            path.insert(0, forward[path[0]][0])
+        while backward[path[-1]][1]:
+            path.append(backward[path[-1]][0])
+        return [self._names[node] for node in path]
+
+    def neighborhood(
+        self,
+        entity_id: str,
+        depth: int = 1,
+        relation: str | None = None,
+        direction: str = "outgoing",
+    ) -> dict[str, int]:
+        """Get entities within ``depth`` hops, mapped to their hop distance."""
+        start = self._ids.get(entity_id)
+        if start is None:
+            return {entity_id: 0}
+        rel = None
+        if relation is not None:
+            rel = self._relation_ids.get(relation)
+            if rel is None:
+                return {entity_id: 0}
+
+        sides = []  # True = follow outgoing edges, False = incoming
+        if direction in ("outgoing", "both"):
+            sides.append(True)
+        if direction in ("incoming", "both"):
+            sides.append(False)
+        distances = {start: 0}
+        frontier = [start]
+        for hops in range(1, depth + 1):
+            next_frontier = []
+            for node in frontier:
+                for outgoing in sides:
+                    for neighbor in self._neighbors(node, outgoing, rel):
+                        if neighbor not in distances:
+                            distances[neighbor] = hops
+                            next_frontier.append(neighbor)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        return {self._names[node]: hops for node, hops in distances.items()}
+
+    # -- bookkeeping -----------------------------------------------------
+
+    def stats(self) -> dict[str, int]:
+        """Get graph statistics."""
+        return {
+            "entities": self._entity_count,
+            "relationships": len(self._edge_keys),
+        }
+
+    def clear(self) -> None:
+        """Clear all entities and relationships."""
+        self._reset()
+
+    def save(self, path: str | Path | None = None) -> None:
+        """Save graph to JSON file (same format as InMemoryGraph)."""
+        if path is None:
+            raise ValueError("Path required for CompactGraph.save()")
+
+        src = self._edge_src
+        data = {
+            "entities": [entity.to_dict() for entity in self.get_all_entities()],
+            "relationships": [
+                self._relationship(e).to_dict()
+                for e in range(len(src))
+                if src[e] >= 0
+            ],
+        }
+        Path(path).write_text(json.dumps(data, indent=2, default=str))
+
+    def load(self, path: str | Path | None = None) -> None:
+        """Load graph from JSON file."""
+        if path is None:
+            raise ValueError("Path required for CompactGraph.load()")
+
+        path = Path(path)
+        if not path.exists():
+            return  # Nothing to load
+
+        data = json.loads(path.read_text())
+        self.clear()
+
+        for e in data.get("entities", []):
+            self.add_entity(e["id"], e["type"], e.get("attributes"), e.get("source"))
+        for r in data.get("relationships", []):
+            self.add_relationship(
+                r["source"],
+                r["relation"],
+                r["target"],
+                r.get("attributes"),
+            )
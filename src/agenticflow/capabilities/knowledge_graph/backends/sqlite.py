@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import sqlite3
 import threading
+from collections.abc import Iterator, Sequence
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -12,9 +13,55 @@ from typing import Any
 from agenticflow.capabilities.knowledge_graph.backends.base import GraphBackend
 from agenticflow.capabilities.knowledge_graph.models import Entity, Relationship
 
+# Max bound parameters per IN (...) clause (SQLite's historic limit is 999)
+_IN_CHUNK = 500
+
+
+def _chunks(ids: Sequence[str]) -> Iterator[Sequence[str]]:
+    """Split IDs into IN (...)-sized chunks."""
+    for i in range(0, len(ids), _IN_CHUNK):
+        yield ids[i:i + _IN_CHUNK]
+
+
+def _placeholders(n: int) -> str:
+    return ",".join("?" * n)
+
+
+def _attributes(raw: str | None) -> dict[str, Any]:
+    """Decode an attributes column, skipping the JSON parser for empty ones."""
+    return json.loads(raw) if raw and raw != "{}" else {}
+
+
+def _entity_from_row(row: sqlite3.Row) -> Entity:
+    return Entity(
+        id=row["id"],
+        type=row["type"],
+        attributes=_attributes(row["attributes"]),
+        created_at=datetime.fromisoformat(row["created_at"]),
+        updated_at=datetime.fromisoformat(row["updated_at"]),
+        source=row["source"],
+    )
+
+
+def _relationship_from_row(row: sqlite3.Row) -> Relationship:
+    return Relationship(
+        source_id=row["source_id"],
+        relation=row["relation"],
+        target_id=row["target_id"],
+        attributes=_attributes(row["attributes"]),
+        created_at=datetime.fromisoformat(row["created_at"]),
+        source=row["source"],
+    )
+
 
 class SQLiteGraph(GraphBackend):
-    """SQLite-backed graph storage for persistence and large graphs."""
+    """SQLite-backed graph storage for persistence and large graphs.
+
+    Multi-hop queries run inside SQLite: ``neighborhood`` is a single
+    ``WITH RECURSIVE`` query, and ``find_path`` / batch lookups expand a
+    whole BFS frontier per ``IN (...)`` query instead of one query per
+    node.
+    """
 
     def __init__(self, path: str | Path) -> None:
         self._path = Path(path)
@@ -170,14 +217,19 @@ class SQLiteGraph(GraphBackend):
         if not row:
             return None
 
-        return Entity(
-            id=row["id"],
-            type=row["type"],
-            attributes=json.loads(row["attributes"]),
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"]),
-            source=row["source"],
-        )
+        return _entity_from_row(row)
+
+    def get_entities_batch(self, entity_ids: Sequence[str]) -> dict[str, Entity]:
+        """Get many entities by ID with one query per chunk of IDs."""
+        entities: dict[str, Entity] = {}
+        for chunk in _chunks(list(dict.fromkeys(entity_ids))):
+            rows = self._conn.execute(
+                f"SELECT * FROM entities WHERE id IN ({_placeholders(len(chunk))})",
+                tuple(chunk),
+            )
+            for row in rows:
+                entities[row["id"]] = _entity_from_row(row)
+        return entities
 
     def add_relationship(
         self,
@@ -217,52 +269,38 @@ class SQLiteGraph(GraphBackend):
         direction: str = "outgoing",
     ) -> list[Relationship]:
         """Get relationships for an entity."""
+        return self.get_relationships_batch([entity_id], relation, direction)
+
+    def get_relationships_batch(
+        self,
+        entity_ids: Sequence[str],
+        relation: str | None = None,
+        direction: str = "outgoing",
+    ) -> list[Relationship]:
+        """Get relationships for many entities with one query per chunk of IDs.
+
+        Outgoing relationships come first, then incoming; each group is in
+        insertion order.
+        """
         results: list[Relationship] = []
+        ids = list(dict.fromkeys(entity_ids))
         conn = self._conn
 
+        columns = []
         if direction in ("outgoing", "both"):
-            if relation:
-                rows = conn.execute(
-                    "SELECT * FROM relationships WHERE source_id = ? AND relation = ?",
-                    (entity_id, relation),
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    "SELECT * FROM relationships WHERE source_id = ?", (entity_id,)
-                ).fetchall()
-
-            for row in rows:
-                results.append(
-                    Relationship(
-                        source_id=row["source_id"],
-                        relation=row["relation"],
-                        target_id=row["target_id"],
-                        attributes=json.loads(row["attributes"]),
-                        created_at=datetime.fromisoformat(row["created_at"]),
-                    )
-                )
-
+            columns.append("source_id")
         if direction in ("incoming", "both"):
-            if relation:
-                rows = conn.execute(
-                    "SELECT * FROM relationships WHERE target_id = ? AND relation = ?",
-                    (entity_id, relation),
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    "SELECT * FROM relationships WHERE target_id = ?", (entity_id,)
-                ).fetchall()
-
-            for row in rows:
-                results.append(
-                    Relationship(
-                        source_id=row["source_id"],
-                        relation=row["relation"],
-                        target_id=row["target_id"],
-                        attributes=json.loads(row["attributes"]),
-                        created_at=datetime.fromisoformat(row["created_at"]),
-                    )
-                )
+            columns.append("target_id")
+
+        for column in columns:
+            for chunk in _chunks(ids):
+                sql = f"SELECT * FROM relationships WHERE {column} IN ({_placeholders(len(chunk))})"
+                params: tuple = tuple(chunk)
+                if relation:
+                    sql += " AND relation = ?"
+                    params += (relation,)
+                rows = conn.execute(sql + " ORDER BY id", params)
+                results.extend(_relationship_from_row(row) for row in rows)
 
         return results
 
@@ -331,28 +369,81 @@ class SQLiteGraph(GraphBackend):
     def find_path(
         self, source_id: str, target_id: str, max_depth: int = 3
     ) -> list[list[str]] | None:
-        """Find paths between two entities using BFS."""
-        visited: set[str] = set()
-        queue: list[list[str]] = [[source_id]]
-
-        while queue:
-            path = queue.pop(0)
-            node = path[-1]
-
-            if node == target_id:
-                return [path]
-
-            if node in visited or len(path) > max_depth:
-                continue
+        """Find the shortest path between two entities.
 
-            visited.add(node)
-
-            for rel in self.get_relationships(node, direction="outgoing"):
-                new_path = path + [rel.target_id]
-                queue.append(new_path)
+        Breadth-first, one batched query per depth level; only ID columns
+        are read.
+        """
+        if source_id == target_id:
+            return [[source_id]]
+
+        parents: dict[str, str] = {source_id: source_id}
+        frontier = [source_id]
+
+        for _ in range(max_depth):
+            if not frontier:
+                break
+
+            # Visit edges in frontier order, then insertion order, like a FIFO BFS
+            order = {node: i for i, node in enumerate(frontier)}
+            edges: list[tuple[str, str]] = []
+            for chunk in _chunks(frontier):
+                edges.extend(self._conn.execute(
+                    "SELECT source_id, target_id FROM relationships "
+                    f"WHERE source_id IN ({_placeholders(len(chunk))}) ORDER BY id",
+                    tuple(chunk),
+                ))
+            edges.sort(key=lambda edge: order[edge[0]])
+
+            next_frontier: list[str] = []
+            for src, tgt in edges:
+                if tgt in parents:
+                    continue
+                parents[tgt] = src
+                if tgt == target_id:
+                    path = [tgt]
+                    while path[-1] != source_id:
+                        path.append(parents[path[-1]])
+                    return [path[::-1]]
+                next_frontier.append(tgt)
+            frontier = next_frontier
 
         return None
 
+    def neighborhood(
+        self,
+        entity_id: str,
+        depth: int = 1,
+        relation: str | None = None,
+        direction: str = "outgoing",
+    ) -> dict[str, int]:
+        """Get entities within ``depth`` hops in a single recursive query."""
+        if direction == "outgoing":
+            join, step = "r.source_id = reach.node", "r.target_id"
+        elif direction == "incoming":
+            join, step = "r.target_id = reach.node", "r.source_id"
+        else:
+            join = "(r.source_id = reach.node OR r.target_id = reach.node)"
+            step = "CASE WHEN r.source_id = reach.node THEN r.target_id ELSE r.source_id END"
+
+        relation_filter = " AND r.relation = ?" if relation else ""
+        params: tuple = (entity_id, depth) + ((relation,) if relation else ())
+
+        rows = self._conn.execute(
+            f"""
+            WITH RECURSIVE reach(node, depth) AS (
+                SELECT ?, 0
+                UNION
+                SELECT {step}, reach.depth + 1
+                FROM reach JOIN relationships r ON {join}
+                WHERE reach.depth < ?{relation_filter}
+            )
+            SELECT node, MIN(depth) FROM reach GROUP BY node
+            """,
+            params,
+        )
+        return dict(rows)
+
     def get_all_entities(
         self,
         entity_type: str | None = None,
@@ -374,17 +465,7 @@ class SQLiteGraph(GraphBackend):
 
         rows = conn.execute(query, params).fetchall()
 
-        return [
-            Entity(
-                id=row["id"],
-                type=row["type"],
-                attributes=json.loads(row["attributes"]),
-                created_at=datetime.fromisoformat(row["created_at"]),
-                updated_at=datetime.fromisoformat(row["updated_at"]),
-                source=row["source"],
-            )
-            for row in rows
-        ]
+        return [_entity_from_row(row) for row in rows]
 
     def remove_entity(self, entity_id: str) -> bool:
         """Remove an entity and its relationships."""
@@ -8,6 +8,7 @@ from typing import Any
 
 from agenticflow.capabilities.base import BaseCapability
 from agenticflow.capabilities.knowledge_graph.backends import (
+    CompactGraph,
     GraphBackend,
     InMemoryGraph,
     JSONFileGraph,
@@ -80,6 +81,7 @@ class KnowledgeGraph(BaseCapability):
         Args:
             backend: Storage backend:
                 - "memory": In-memory graph (uses networkx if available)
+                - "compact": Compact in-memory graph for large graphs
                 - "sqlite": SQLite database for persistence
                 - "json": JSON file with auto-save
             path: Path to storage file (required for sqlite/json backends)
@@ -93,6 +95,8 @@ class KnowledgeGraph(BaseCapability):
 
         if backend == "memory":
             self.graph: GraphBackend = InMemoryGraph()
+        elif backend == "compact":
+            self.graph = CompactGraph()
         elif backend == "sqlite":
             if not path:
                 raise ValueError("Path required for sqlite backend")
@@ -107,7 +111,7 @@ class KnowledgeGraph(BaseCapability):
             self._backend = "custom"
         else:
             raise ValueError(
-                f"Unknown backend: {backend}. Supported: 'memory', 'sqlite', 'json', or GraphBackend instance"
+                f"Unknown backend: {backend}. Supported: 'memory', 'compact', 'sqlite', 'json', or GraphBackend instance"
             )
 
     @classmethod
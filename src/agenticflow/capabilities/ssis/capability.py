@@ -775,28 +775,40 @@ class SSISAnalyzer(BaseCapability):
             List of lineage paths (source → ... → target)
         """
         paths: list[list[str]] = []
+        graph = self._kg.graph
+        lineage_relations = {"flows_to", "outputs_column", "contains"}
+
+        # Fetch data flow sources level by level, one batched query per level
+        sources_of: dict[str, list[str]] = {}
+        frontier = [target]
+        for _ in range(max_depth + 1):
+            if not frontier:
+                break
+            for entity_id in frontier:
+                sources_of[entity_id] = []
+            for rel in graph.get_relationships_batch(frontier, direction="incoming"):
+                if rel.relation in lineage_relations:
+                    sources_of[rel.target_id].append(rel.source_id)
+            frontier = list(dict.fromkeys(
+                src for eid in frontier for src in sources_of[eid] if src not in sources_of
+            ))
 
         def trace_back(entity_id: str, current_path: list[str], depth: int) -> None:
             if depth > max_depth:
                 return
 
-            # Get incoming relationships
-            incoming = self._kg.graph.get_relationships(entity_id, direction="incoming")
-
-            # Filter for data flow relationships
-            lineage_relations = {"flows_to", "outputs_column", "contains"}
-            sources = [r for r in incoming if r.relation in lineage_relations]
+            sources = sources_of[entity_id]
 
             if not sources:
                 # This is a source node
                 paths.append(list(reversed(current_path)))
                 return
 
-            for rel in sources:
-                if rel.source_id not in current_path:
+            for source_id in sources:
+                if source_id not in current_path:
                     trace_back(
-                        rel.source_id,
-                        current_path + [rel.source_id],
+                        source_id,
+                        current_path + [source_id],
                         depth + 1,
                     )
 
@@ -3,16 +3,61 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import mimetypes
+import multiprocessing
+import os
+import pickle
 import re
-from collections.abc import Callable, Sequence
+from collections.abc import AsyncIterator, Callable, Sequence
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from agenticflow.document.loaders.base import BaseLoader
 from agenticflow.document.loaders.registry import get_loader, register_loader
 from agenticflow.document.types import Document
 
+if TYPE_CHECKING:
+    from agenticflow.document.splitters.base import BaseSplitter
+
+
+def _load_file(
+    loader: BaseLoader | Callable[..., Any],
+    path: Path,
+    kwargs: dict[str, Any],
+    splitter: BaseSplitter | None,
+) -> list[Document]:
+    """Load (and optionally split) one file synchronously.
+
+    Runs inside a pool worker, so it must stay a picklable module-level
+    function.
+    """
+    if isinstance(loader, BaseLoader):
+        documents = loader.load_sync(path, **kwargs)
+    else:
+        documents = loader(path, **kwargs)
+        if inspect.isawaitable(documents):
+            documents = asyncio.run(documents)
+
+    if splitter is not None:
+        documents = splitter.split_documents(documents)
+    return documents
+
+
+def _picklable(obj: Any) -> bool:
+    """Check whether an object can be sent to a worker process."""
+    try:
+        pickle.dumps(obj)
+    except Exception:
+        return False
+    return True
+
 
 class DocumentLoader:
     """Universal document loader supporting multiple file types.
@@ -34,6 +79,10 @@ class DocumentLoader:
         >>>
         >>> # Load directory with glob pattern
         >>> docs = await loader.load_directory("./docs", glob="**/*.md")
+        >>>
+        >>> # Stream a large tree through a process pool, split as it loads
+        >>> async for doc in loader.aiter_directory("./repo", splitter=splitter):
+        ...     ...
     """
 
     def __init__(self, encoding: str = "utf-8") -> None:
@@ -100,7 +149,31 @@ class DocumentLoader:
             ValueError: If file type is not supported.
         """
         path = Path(path)
+        loader = self._resolve_loader(path)
+
+        # Handle both BaseLoader instances and callable functions
+        if isinstance(loader, BaseLoader):
+            return await loader.load(path, **kwargs)
+        else:
+            # It's a callable (custom function loader)
+            if inspect.iscoroutinefunction(loader):
+                return await loader(path, **kwargs)
+            else:
+                return loader(path, **kwargs)
+
+    def _resolve_loader(self, path: Path) -> BaseLoader | Callable:
+        """Find the loader for a file.
 
+        Args:
+            path: Path to file.
+
+        Returns:
+            Loader instance or callable.
+
+        Raises:
+            FileNotFoundError: If file doesn't exist.
+            ValueError: If file type is not supported.
+        """
         if not path.exists():
             raise FileNotFoundError(f"File not found: {path}")
 
@@ -125,16 +198,7 @@ class DocumentLoader:
                     f"Supported: {', '.join(list_supported_extensions())}"
                 )
 
-        # Handle both BaseLoader instances and callable functions
-        if isinstance(loader, BaseLoader):
-            return await loader.load(path, **kwargs)
-        else:
-            # It's a callable (custom function loader)
-            import inspect
-            if inspect.iscoroutinefunction(loader):
-                return await loader(path, **kwargs)
-            else:
-                return loader(path, **kwargs)
+        return loader
 
     def load_sync(
         self,
@@ -155,18 +219,26 @@ class DocumentLoader:
     async def load_many(
         self,
         paths: Sequence[str | Path],
+        max_concurrency: int = 64,
         **kwargs: Any,
     ) -> list[Document]:
         """Load multiple files concurrently.
 
         Args:
             paths: List of file paths.
+            max_concurrency: Maximum files loading at once.
             **kwargs: Additional arguments passed to loaders.
 
         Returns:
             Combined list of all documents.
         """
-        tasks = [self.load(p, **kwargs) for p in paths]
+        limit = asyncio.Semaphore(max_concurrency)
+
+        async def load_one(path: str | Path) -> list[Document]:
+            async with limit:
+                return await self.load(path, **kwargs)
+
+        tasks = [load_one(p) for p in paths]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         documents = []
@@ -198,8 +270,25 @@ class DocumentLoader:
         Returns:
             List of all loaded documents.
         """
-        directory = Path(directory)
+        files = self._collect_files(Path(directory), glob, exclude)
+        return await self.load_many(files, **kwargs)
+
+    def _collect_files(
+        self,
+        directory: Path,
+        glob: str,
+        exclude: Sequence[str] | None,
+    ) -> list[Path]:
+        """List loadable files in a directory.
+
+        Args:
+            directory: Directory path.
+            glob: Glob pattern for file matching.
+            exclude: Regex patterns to exclude.
 
+        Returns:
+            Matching file paths.
+        """
         if not directory.exists():
             raise FileNotFoundError(f"Directory not found: {directory}")
 
@@ -224,7 +313,148 @@ class DocumentLoader:
             if get_loader(path.suffix.lower()) is not None:
                 files.append(path)
 
-        return await self.load_many(files, **kwargs)
+        return files
+
+    async def aiter_directory(
+        self,
+        directory: str | Path,
+        glob: str = "**/*",
+        exclude: Sequence[str] | None = None,
+        *,
+        splitter: BaseSplitter | None = None,
+        max_workers: int | None = None,
+        use_processes: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator[Document]:
+        """Stream documents from a directory as files finish loading.
+
+        Files are loaded (and split, if ``splitter`` is given) in a process
+        pool, so parsing scales with cores and never blocks the event loop.
+        Loaders or splitters that cannot be pickled (e.g. lambdas, splitters
+        holding an embedding client) run in a thread pool instead. At most
+        ``2 * max_workers`` files are in flight, so memory stays bounded
+        however large the tree is. Documents arrive in completion order;
+        files that fail to load are skipped, as in :meth:`load_many`.
+
+        Args:
+            directory: Directory path.
+            glob: Glob pattern for file matching (default: all files).
+            exclude: Regex patterns to exclude.
+            splitter: Optional splitter applied to each file's documents
+                inside the worker.
+            max_workers: Worker count (default: CPU count).
+            use_processes: Use a process pool (False = threads only).
+            **kwargs: Additional arguments passed to loaders.
+
+        Yields:
+            Documents (or chunks, with ``splitter``) as they are produced.
+
+        Example:
+            >>> splitter = RecursiveCharacterSplitter(chunk_size=1000)
+            >>> async for chunk in loader.aiter_directory("./repo", splitter=splitter):
+            ...     print(chunk.metadata["source"])
+        """
+        files = await asyncio.to_thread(
+            self._collect_files, Path(directory), glob, exclude
+        )
+        if not files:
+            return
+
+        workers = max_workers or os.cpu_count() or 1
+        loop = asyncio.get_running_loop()
+        threads = ThreadPoolExecutor(max_workers=workers)
+        processes = None
+        if use_processes:
+            # The loop already runs threads, so forking it directly is unsafe
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            processes = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(method),
+            )
+        # Per-loader decision, made once: can it (and the splitter) cross processes?
+        process_safe: dict[int, bool] = {}
+
+        def submit(path: Path) -> asyncio.Future[list[Document]]:
+            try:
+                loader = self._resolve_loader(path)
+            except Exception as e:
+                future = loop.create_future()
+                future.set_exception(e)
+                return future
+
+            pool: Executor = threads
+            if processes is not None:
+                key = id(loader)
+                if key not in process_safe:
+                    process_safe[key] = _picklable((loader, splitter, kwargs))
+                if process_safe[key]:
+                    pool = processes
+            return loop.run_in_executor(pool, _load_file, loader, path, kwargs, splitter)
+
+        pending_files = iter(files)
+        in_flight: set[asyncio.Future[list[Document]]] = set()
+        try:
+            for path in pending_files:
+                in_flight.add(submit(path))
+                if len(in_flight) >= 2 * workers:
+                    break
+
+            while in_flight:
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    path = next(pending_files, None)
+                    if path is not None:
+                        in_flight.add(submit(path))
+
+                    error = future.exception()
+                    if isinstance(error, BrokenExecutor):
+                        raise error
+                    if error is not None:
+                        # Log error but continue with other files
+                        continue
+                    for document in future.result():
+                        yield document
+        finally:
+            for future in in_flight:
+                future.cancel()
+            threads.shutdown(wait=False, cancel_futures=True)
+            if processes is not None:
+                processes.shutdown(wait=False, cancel_futures=True)
+
+    async def aiter_batches(
+        self,
+        directory: str | Path,
+        batch_size: int = 100,
+        **kwargs: Any,
+    ) -> AsyncIterator[list[Document]]:
+        """Stream documents from a directory in fixed-size batches.
+
+        Convenience wrapper over :meth:`aiter_directory` for feeding
+        embedding calls or ``VectorStore.add_documents`` while loading
+        continues in the background.
+
+        Args:
+            directory: Directory path.
+            batch_size: Documents per batch (the last may be smaller).
+            **kwargs: Arguments passed to :meth:`aiter_directory`.
+
+        Yields:
+            Lists of up to ``batch_size`` documents.
+
+        Example:
+            >>> async for batch in loader.aiter_batches("./docs", splitter=splitter):
+            ...     await store.add_documents(batch)
+        """
+        batch: list[Document] = []
+        async for document in self.aiter_directory(directory, **kwargs):
+            batch.append(document)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
 
 
 __all__ = ["DocumentLoader"]
@@ -100,9 +100,11 @@ class BaseSplitter(ABC):
         """
         chunks: list[Document] = []
         current_chunk: list[str] = []
+        current_lengths: list[int] = []
         current_length = 0
         current_start = 0
         position = 0
+        separator_length = self.length_function(separator)
 
         for split in splits:
             split_length = self.length_function(split)
@@ -110,7 +112,7 @@ class BaseSplitter(ABC):
             # Check if adding this split exceeds chunk size
             total = current_length + split_length
             if current_chunk:
-                total += self.length_function(separator)
+                total += separator_length
 
             if total > self.chunk_size and current_chunk:
                 # Save current chunk
@@ -130,19 +132,21 @@ class BaseSplitter(ABC):
                 # Handle overlap
                 overlap_start = current_start
                 while current_chunk and current_length > self.chunk_overlap:
-                    popped = current_chunk.pop(0)
-                    current_length -= self.length_function(popped)
+                    current_chunk.pop(0)
+                    popped_length = current_lengths.pop(0)
+                    current_length -= popped_length
                     if current_chunk:
-                        current_length -= self.length_function(separator)
-                    overlap_start += self.length_function(popped) + self.length_function(separator)
+                        current_length -= separator_length
+                    overlap_start += popped_length + separator_length
 
                 current_start = overlap_start
 
             current_chunk.append(split)
+            current_lengths.append(split_length)
             current_length += split_length
             if len(current_chunk) > 1:
-                current_length += self.length_function(separator)
-            position += split_length + self.length_function(separator)
+                current_length += separator_length
+            position += split_length + separator_length
 
         # Add final chunk
         if current_chunk:
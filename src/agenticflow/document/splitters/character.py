@@ -85,7 +85,9 @@ class RecursiveCharacterSplitter(BaseSplitter):
         # Process splits
         chunks: list[Document] = []
         current_parts: list[str] = []
+        current_lengths: list[int] = []
         current_length = 0
+        separator_length = self.length_function(separator)
 
         for split in splits:
             split_length = self.length_function(split)
@@ -98,6 +100,7 @@ class RecursiveCharacterSplitter(BaseSplitter):
                         self._merge_splits(current_parts, separator if self.keep_separator else "")
                     )
                     current_parts = []
+                    current_lengths = []
                     current_length = 0
 
                 # Recursively split the large piece
@@ -115,7 +118,7 @@ class RecursiveCharacterSplitter(BaseSplitter):
             # Check if we need to start a new chunk
             total_length = current_length + split_length
             if current_parts:
-                total_length += self.length_function(separator)
+                total_length += separator_length
 
             if total_length > self.chunk_size and current_parts:
                 # Create chunk from accumulated parts
@@ -123,21 +126,22 @@ class RecursiveCharacterSplitter(BaseSplitter):
                     self._merge_splits(current_parts, separator if self.keep_separator else "")
                 )
 
-                # Start new chunk with overlap
-                overlap_parts = []
+                # Start new chunk with overlap (lengths reused, not re-measured)
+                keep = 0
                 overlap_length = 0
-                for part in reversed(current_parts):
-                    part_len = self.length_function(part)
+                for part_len in reversed(current_lengths):
                     if overlap_length + part_len <= self.chunk_overlap:
-                        overlap_parts.insert(0, part)
+                        keep += 1
                         overlap_length += part_len
                     else:
                         break
 
-                current_parts = overlap_parts
+                current_parts = current_parts[len(current_parts) - keep:]
+                current_lengths = current_lengths[len(current_lengths) - keep:]
                 current_length = overlap_length
 
             current_parts.append(split)
+            current_lengths.append(split_length)
             current_length += split_length
 
         # Handle remaining parts
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Any
 
 from agenticflow.document.splitters.base import BaseSplitter
@@ -12,12 +14,16 @@ from agenticflow.document.types import Document
 class TokenSplitter(BaseSplitter):
     """Split text by token count.
 
-    Uses tiktoken for accurate OpenAI token counting.
+    Uses tiktoken for accurate OpenAI token counting. The document is
+    encoded once; chunks are cut at token offsets, preferring the last
+    paragraph, line, sentence or word boundary that fits, so splitting is
+    linear in document size.
 
     Args:
         chunk_size: Target chunk size in tokens.
         chunk_overlap: Overlap in tokens.
         model_name: Model name for tiktoken encoding.
+        separators: Preferred break points, in priority order.
 
     Example:
         >>> splitter = TokenSplitter(chunk_size=500, model_name="gpt-4")
@@ -29,10 +35,16 @@ class TokenSplitter(BaseSplitter):
         chunk_size: int = 500,
         chunk_overlap: int = 50,
         model_name: str = "gpt-4",
+        separators: list[str] | None = None,
         **kwargs: Any,
     ):
         self._tokenizer = None
         self._model_name = model_name
+        self.separators = [
+            s for s in (separators or RecursiveCharacterSplitter.DEFAULT_SEPARATORS) if s
+        ]
+        # Memoized so repeated measurements of the same fragment are free
+        self._token_length = lru_cache(maxsize=4096)(self._count_tokens)
 
         # Initialize parent with token length function
         super().__init__(
@@ -59,25 +71,84 @@ class TokenSplitter(BaseSplitter):
                 self._tokenizer = tiktoken.get_encoding("cl100k_base")
         return self._tokenizer
 
-    def _token_length(self, text: str) -> int:
+    def _count_tokens(self, text: str) -> int:
         """Count tokens in text."""
         return len(self.tokenizer.encode(text))
 
     def split_text(self, text: str) -> list[Document]:
         """Split text by token count."""
-        # Use recursive character splitting with token length function
-        splitter = RecursiveCharacterSplitter(
-            chunk_size=self.chunk_size,
-            chunk_overlap=self.chunk_overlap,
-            length_function=self._token_length,
-        )
-        chunks = splitter.split_text(text)
+        tokens = self.tokenizer.encode(text)
+        text, offsets = self.tokenizer.decode_with_offsets(tokens)
+        # bounds[i] is the character offset where token i starts
+        bounds = [*offsets, len(text)]
+        total = len(tokens)
+
+        chunks: list[Document] = []
+        start = 0
+        while start < total:
+            end = min(start + self.chunk_size, total)
+            if end < total:
+                end = self._break_point(text, bounds, start, end)
 
-        # Add token count metadata
-        for chunk in chunks:
-            chunk.metadata["token_count"] = self._token_length(chunk.text)
+            self._add_chunk(chunks, text, bounds[start], bounds[end], end - start)
+
+            if end >= total:
+                break
+            start = max(end - self.chunk_overlap, start + 1) if self.chunk_overlap else end
 
         return chunks
 
+    def _break_point(self, text: str, bounds: list[int], start: int, end: int) -> int:
+        """Move a chunk end back to the best separator inside the window.
+
+        Args:
+            text: Decoded document.
+            bounds: Token start offsets plus the document length.
+            start: First token of the chunk.
+            end: Hard token limit (exclusive).
+
+        Returns:
+            Token index to end the chunk at (exclusive). Cuts that would
+            leave no more than ``chunk_overlap`` tokens are skipped, so the
+            next chunk always ends past this one.
+        """
+        lo, hi = bounds[start], bounds[end]
+        for separator in self.separators:
+            pos = text.rfind(separator, lo, hi)
+            if pos == -1:
+                continue
+            # Last token boundary at or before the end of the separator
+            cut = bisect_right(bounds, pos + len(separator), start + 1, end + 1) - 1
+            if cut > start + self.chunk_overlap:
+                return cut
+        return end
+
+    def _add_chunk(
+        self,
+        chunks: list[Document],
+        text: str,
+        start_index: int,
+        end_index: int,
+        token_count: int,
+    ) -> None:
+        """Append the chunk covering ``text[start_index:end_index]``."""
+        content = text[start_index:end_index]
+        if self.strip_whitespace:
+            stripped = content.lstrip()
+            start_index += len(content) - len(stripped)
+            content = stripped.rstrip()
+            end_index = start_index + len(content)
+        if not content:
+            return
+        chunks.append(Document(
+            text=content,
+            metadata={
+                "chunk_index": len(chunks),
+                "start_index": start_index,
+                "end_index": end_index,
+                "token_count": token_count,
+            },
+        ))
+
 
 __all__ = ["TokenSplitter"]
@@ -9,6 +9,7 @@ Includes:
 - EventBus: Core pub/sub for orchestration events
 - EventStore: Persistent event storage for sourcing and replay
 - Pattern matching: Utilities for event filtering
+- SubscriptionRouter: Indexed pattern lookup for dispatch
 - Sources: External event sources (webhooks, file watchers, queues)
 - Sinks: Outbound event sinks (webhooks, queues)
 """
@@ -28,6 +29,7 @@ from agenticflow.events.patterns import (
     matches_event,
     not_,
 )
+from agenticflow.events.router import SubscriptionRouter
 from agenticflow.events.sinks import (
     EventSink,
     WebhookSink,
@@ -68,6 +70,7 @@ __all__ = [
     "all_of",
     "any_of",
     "not_",
+    "SubscriptionRouter",
     # Sources
     "EventSource",
     "WebhookSource",
@@ -16,6 +16,7 @@ from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 
 from agenticflow.events.event import Event
+from agenticflow.events.router import SubscriptionRouter
 
 if TYPE_CHECKING:
     from agenticflow.events.transport import Transport
@@ -53,6 +54,8 @@ class EventBus:
         transport: Transport | None = None,
     ) -> None:
         self._handlers: dict[EventPattern, list[EventHandler]] = defaultdict(list)
+        self._route_ids: dict[EventPattern, list[int]] = defaultdict(list)
+        self._router: SubscriptionRouter[EventHandler] = SubscriptionRouter(_compile_glob)
         self._global_handlers: list[EventHandler] = []
         self._event_history: list[Event] = []
         self._lock = asyncio.Lock()
@@ -72,6 +75,7 @@ class EventBus:
     def subscribe(self, event: EventPattern, handler: EventHandler) -> None:
         if handler not in self._handlers[event]:
             self._handlers[event].append(handler)
+            self._route_ids[event].append(self._router.add(handler, event))
 
             # Subscribe via transport if available
             if self._transport and event not in self._transport_subscriptions:
@@ -97,7 +101,9 @@ class EventBus:
 
     def unsubscribe(self, event: EventPattern, handler: EventHandler) -> None:
         if handler in self._handlers.get(event, []):
-            self._handlers[event].remove(handler)
+            index = self._handlers[event].index(handler)
+            del self._handlers[event][index]
+            self._router.remove(self._route_ids[event].pop(index))
 
     def unsubscribe_all(self, handler: EventHandler) -> None:
         if handler in self._global_handlers:
@@ -105,6 +111,8 @@ class EventBus:
 
     def clear_subscriptions(self) -> None:
         self._handlers.clear()
+        self._route_ids.clear()
+        self._router.clear()
         self._global_handlers.clear()
 
     async def publish(self, event: Event | str, data: dict[str, Any] | None = None) -> Event:
@@ -133,10 +141,8 @@ class EventBus:
                 pass
 
         # Pattern handlers
-        for pattern, handlers in list(self._handlers.items()):
-            if _matches(pattern, event.name):
-                for handler in list(handlers):
-                    await _call_handler(handler, event)
+        for handler in self._router.match(event.name):
+            await _call_handler(handler, event)
 
         # Global handlers
         for handler in list(self._global_handlers):
@@ -145,14 +151,9 @@ class EventBus:
         return event
 
 
-def _matches(pattern: EventPattern, event_name: str) -> bool:
-    if isinstance(pattern, re.Pattern):
-        return pattern.match(event_name) is not None
-    # glob support
-    if "*" in pattern:
-        regex = pattern.replace(".", r"\.").replace("*", ".*")
-        return re.match(regex, event_name) is not None
-    return pattern == event_name
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    # "*" matches any run of characters, including dots
+    return re.compile(re.escape(pattern).replace(r"\*", ".*"))
 
 
 async def _call_handler(handler: EventHandler, event: Event) -> None:
@@ -8,6 +8,7 @@ Provides pattern matching for event subscriptions:
 
 from __future__ import annotations
 
+import functools
 import re
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -44,16 +45,22 @@ def matches(pattern: EventPattern, event_name: str) -> bool:
     if "*" not in pattern:
         return pattern == event_name
 
-    # Glob-style wildcards
-    # ** matches multiple segments, * matches single segment
+    return compile_pattern(pattern).match(event_name) is not None
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a glob-style event pattern to an anchored regex.
+
+    ``**`` matches multiple segments, ``*`` matches a single segment.
+    Results are cached, so repeated matching does not rebuild the regex.
+    """
     regex = pattern
     regex = regex.replace(".", r"\.")  # Escape dots
     regex = regex.replace("**", "§§")  # Temp placeholder for **
     regex = regex.replace("*", r"[^.]*")  # * = single segment
     regex = regex.replace("§§", r".*")  # ** = any segments
-    regex = f"^{regex}$"
-
-    return re.match(regex, event_name) is not None
+    return re.compile(f"^{regex}$")
 
 
 def matches_event(pattern: EventPattern, event: Event) -> bool:
@@ -0,0 +1,177 @@
+"""Subscription routing index for event dispatch.
+
+Maps event names to the subscribers whose patterns match them without
+scanning every subscription on every event:
+
+- Exact names live in a hash map
+- Glob patterns are compiled once and stored in a trie keyed by their
+  literal leading segments ("task.*" sits under "task"), so only patterns
+  that share a prefix with the event name are tested
+- Regex patterns are kept in a short list and tested directly
+- Matches are memoized per event name until the subscriptions change
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+from agenticflow.events.patterns import EventPattern, compile_pattern
+
+PatternCompiler = Callable[[str], re.Pattern[str]]
+
+
+@dataclass(slots=True)
+class _Node:
+    """Trie node holding glob routes anchored at a literal segment prefix."""
+
+    children: dict[str, _Node] = field(default_factory=dict)
+    routes: list[tuple[int, re.Pattern[str]]] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _Route[T]:
+    value: T
+    patterns: tuple[EventPattern, ...]
+
+
+class SubscriptionRouter[T]:
+    """Pattern-indexed lookup from event names to subscribers.
+
+    Each route pairs a value (handler, binding, ...) with one or more
+    patterns. ``match`` returns the values of all routes with at least one
+    matching pattern, each once, in the order the routes were added.
+
+    Args:
+        compile: Turns a glob string into a regex used with ``.match``.
+            Defaults to :func:`compile_pattern` (``*`` = one segment,
+            ``**`` = any number of segments).
+        wildcards: Characters that make a string pattern a glob rather than
+            an exact name.
+        cache_size: Maximum number of memoized event names.
+
+    Example:
+        ```python
+        router: SubscriptionRouter[str] = SubscriptionRouter()
+        router.add("a", "task.created")
+        router.add("b", ["task.*", "agent.done"])
+
+        router.match("task.created")  # ("a", "b")
+        ```
+    """
+
+    def __init__(
+        self,
+        compile: PatternCompiler = compile_pattern,
+        *,
+        wildcards: str = "*",
+        cache_size: int = 4096,
+    ) -> None:
+        self._compile = compile
+        self._wildcards = wildcards
+        self._cache_size = cache_size
+        self._routes: dict[int, _Route[T]] = {}
+        self._next_id = 0
+        self._exact: dict[str, list[int]] = {}
+        self._root = _Node()
+        self._regex: list[tuple[int, re.Pattern[str]]] = []
+        self._cache: dict[str, tuple[T, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    def add(self, value: T, patterns: EventPattern | Iterable[EventPattern]) -> int:
+        """Add a route and return its id (used by ``remove``)."""
+        if isinstance(patterns, (str, re.Pattern)):
+            patterns = (patterns,)
+        route_id = self._next_id
+        self._next_id += 1
+        route = _Route(value=value, patterns=tuple(patterns))
+        self._routes[route_id] = route
+
+        for pattern in route.patterns:
+            if isinstance(pattern, re.Pattern):
+                self._regex.append((route_id, pattern))
+            elif not self._is_glob(pattern):
+                self._exact.setdefault(pattern, []).append(route_id)
+            else:
+                node = self._root
+                for segment in self._literal_prefix(pattern):
+                    node = node.children.setdefault(segment, _Node())
+                node.routes.append((route_id, self._compile(pattern)))
+
+        self._cache.clear()
+        return route_id
+
+    def remove(self, route_id: int) -> None:
+        """Remove a route by id. Unknown ids are ignored."""
+        route = self._routes.pop(route_id, None)
+        if route is None:
+            return
+
+        for pattern in route.patterns:
+            if isinstance(pattern, re.Pattern):
+                self._regex = [r for r in self._regex if r[0] != route_id]
+            elif not self._is_glob(pattern):
+                ids = self._exact.get(pattern, [])
+                if route_id in ids:
+                    ids.remove(route_id)
+                if not ids:
+                    self._exact.pop(pattern, None)
+            else:
+                node: _Node | None = self._root
+                for segment in self._literal_prefix(pattern):
+                    node = node.children.get(segment) if node else None
+                if node is not None:
+                    node.routes = [r for r in node.routes if r[0] != route_id]
+
+        self._cache.clear()
+
+    def clear(self) -> None:
+        """Remove all routes."""
+        self._routes.clear()
+        self._exact.clear()
+        self._root = _Node()
+        self._regex.clear()
+        self._cache.clear()
+
+    def match(self, event_name: str) -> tuple[T, ...]:
+        """Return the values of all routes matching ``event_name``."""
+        cached = self._cache.get(event_name)
+        if cached is not None:
+            return cached
+
+        hits: set[int] = set(self._exact.get(event_name, ()))
+
+        node: _Node | None = self._root
+        segments = iter(event_name.split("."))
+        while node is not None:
+            for route_id, regex in node.routes:
+                if route_id not in hits and regex.match(event_name) is not None:
+                    hits.add(route_id)
+            segment = next(segments, None)
+            node = node.children.get(segment) if segment is not None else None
+
+        for route_id, regex in self._regex:
+            if route_id not in hits and regex.match(event_name) is not None:
+                hits.add(route_id)
+
+        result = tuple(self._routes[route_id].value for route_id in sorted(hits))
+        if len(self._cache) >= self._cache_size:
+            self._cache.clear()
+        self._cache[event_name] = result
+        return result
+
+    def _is_glob(self, pattern: str) -> bool:
+        return any(c in pattern for c in self._wildcards)
+
+    def _literal_prefix(self, pattern: str) -> list[str]:
+        """Leading segments that every matching name must share exactly."""
+        prefix: list[str] = []
+        # The last segment is never a full literal segment of a glob
+        for segment in pattern.split(".")[:-1]:
+            if self._is_glob(segment):
+                break
+            prefix.append(segment)
+        return prefix
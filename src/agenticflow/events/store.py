@@ -6,12 +6,15 @@ rebuild state from event history.
 
 from __future__ import annotations
 
+import itertools
 import json
+import os
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from collections.abc import AsyncIterator
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import BinaryIO
 
 from agenticflow.events.event import Event
 
@@ -198,96 +201,338 @@ class InMemoryEventStore(EventStore):
         self._flow_order.clear()
 
 
+@dataclass
+class _FlowLog:
+    """Open writers and offset index for one flow's JSONL segment."""
+
+    data: BinaryIO
+    index: BinaryIO
+    offsets: dict[str, int] = field(default_factory=dict)
+    pending: int = 0
+
+
 class FileEventStore(EventStore):
-    """File-based event store using JSONL format.
+    """File-based event store using append-only JSONL segments.
+
+    Each flow gets its own file: {base_dir}/{flow_id}.jsonl, plus a sidecar
+    index {flow_id}.idx mapping event IDs to byte offsets. Reads seek to the
+    requested position and parse only the events they return. The index is
+    rebuilt from the segment if it is missing or behind (e.g. after a crash
+    or for files written by older versions).
+
+    Flow IDs are recorded in {base_dir}/.manifest so ``get_flow_ids`` does
+    not need to scan the directory. The manifest is rewritten once it grows
+    well beyond the number of flows, so interleaved writers don't make it
+    grow without bound.
+
+    Args:
+        base_dir: Directory holding the segments
+        fsync_every: fsync segments every N appends (0 = leave it to the OS,
+            1 = every append). Writes are always flushed to the OS, so other
+            readers see them immediately.
+        max_open_flows: Maximum number of flows with open writers
+
+    Example:
+        ```python
+        store = FileEventStore("./events", fsync_every=100)
+        await store.append(event, flow_id="flow-123")
 
-    Each flow gets its own file: {base_dir}/{flow_id}.jsonl
+        async for event in store.stream_events("flow-123"):
+            ...
+
+        store.close()
+        ```
     """
 
-    def __init__(self, base_dir: str | Path) -> None:
+    _MANIFEST = ".manifest"
+
+    def __init__(
+        self,
+        base_dir: str | Path,
+        *,
+        fsync_every: int = 0,
+        max_open_flows: int = 64,
+    ) -> None:
         self._base_dir = Path(base_dir)
         self._base_dir.mkdir(parents=True, exist_ok=True)
+        self._fsync_every = fsync_every
+        self._max_open_flows = max_open_flows
+        self._logs: dict[str, _FlowLog] = {}
+        self._read_offsets: dict[str, tuple[dict[str, int], int]] = {}
+        self._flows: dict[str, None] = {}  # Ordered, most recent last
+        self._manifest_size = -1
+        self._manifest_inode = -1
+        self._manifest_lines = 0
+        self._manifest: BinaryIO | None = None
 
     def _flow_path(self, flow_id: str) -> Path:
         # Sanitize flow_id for filesystem
         safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in flow_id)
         return self._base_dir / f"{safe_id}.jsonl"
 
-    async def append(self, event: Event, flow_id: str) -> None:
+    # ------------------------------------------------------------------
+    # Offset index
+    # ------------------------------------------------------------------
+
+    def _load_offsets(self, flow_id: str) -> tuple[dict[str, int], int]:
+        """Load the offset index, indexing any records it has not seen yet.
+
+        Returns the index and the byte length of the complete records in
+        the segment.
+        """
         path = self._flow_path(flow_id)
-        with open(path, "a") as f:
-            f.write(json.dumps(event.to_dict()) + "\n")
+        index_path = path.with_suffix(".idx")
+        offsets: dict[str, int] = {}
+        last = -1
+        if index_path.exists():
+            with open(index_path, "rb") as f:
+                for line in f:
+                    offset, _, event_id = line.rstrip(b"\n").partition(b"\t")
+                    if event_id:
+                        last = int(offset)
+                        offsets.setdefault(event_id.decode(), last)
 
-    async def get_events(
+        if not path.exists():
+            if index_path.exists():
+                index_path.unlink()
+            return {}, 0
+
+        with open(path, "rb") as f:
+            start = 0
+            if last >= 0:
+                f.seek(last)
+                if f.readline().endswith(b"\n"):
+                    start = f.tell()
+            rebuild = last >= 0 and start == 0  # Index points past the segment
+            if rebuild:
+                offsets = {}
+
+            missing: list[tuple[int, str]] = []
+            end = start
+            f.seek(start)
+            for offset, line in _iter_lines(f):
+                end = offset + len(line)
+                if line.strip():
+                    missing.append((offset, json.loads(line)["id"]))
+
+        if missing or rebuild:
+            with open(index_path, "wb" if rebuild else "ab") as idx:
+                for offset, event_id in missing:
+                    offsets.setdefault(event_id, offset)
+                    idx.write(f"{offset}\t{event_id}\n".encode())
+
+        return offsets, end
+
+    def _offsets(self, flow_id: str) -> dict[str, int]:
+        log = self._logs.get(flow_id)
+        if log is not None:
+            return log.offsets
+        # Flows read but not written here: reuse the index until the segment grows
+        size = self._flow_path(flow_id).stat().st_size
+        cached = self._read_offsets.get(flow_id)
+        if cached is None or cached[1] != size:
+            cached = self._load_offsets(flow_id)
+            self._read_offsets[flow_id] = cached
+        return cached[0]
+
+    def _open_log(self, flow_id: str) -> _FlowLog:
+        log = self._logs.pop(flow_id, None)
+        if log is None:
+            self._read_offsets.pop(flow_id, None)
+            offsets, end = self._load_offsets(flow_id)
+            path = self._flow_path(flow_id)
+            data = open(path, "ab")  # noqa: SIM115 - held open for appends
+            if data.tell() > end:
+                # Drop a partial record left by an interrupted write
+                data.truncate(end)
+                data.seek(end)
+            log = _FlowLog(
+                data=data,
+                index=open(path.with_suffix(".idx"), "ab"),  # noqa: SIM115
+                offsets=offsets,
+            )
+            if len(self._logs) >= self._max_open_flows:
+                oldest = next(iter(self._logs))
+                self._close_log(self._logs.pop(oldest))
+        self._logs[flow_id] = log  # Most recently used last
+        return log
+
+    def _close_log(self, log: _FlowLog) -> None:
+        for f in (log.data, log.index):
+            f.flush()
+            if self._fsync_every and log.pending:
+                os.fsync(f.fileno())
+            f.close()
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    def _load_manifest(self) -> dict[str, None]:
+        """Return known flows, reading manifest lines appended since last time."""
+        manifest = self._base_dir / self._MANIFEST
+        if not manifest.exists():
+            # Directory written before manifests existed: seed from mtimes
+            paths = sorted(self._base_dir.glob("*.jsonl"), key=lambda p: p.stat().st_mtime)
+            with open(manifest, "wb") as f:
+                for path in paths:
+                    f.write(f"{path.stem}\n".encode())
+
+        stat = manifest.stat()
+        if stat.st_ino != self._manifest_inode:
+            # First load, or the manifest was compacted: read it from the top
+            self._flows = {}
+            self._manifest_size = 0
+            self._manifest_lines = 0
+            self._manifest_inode = stat.st_ino
+        if stat.st_size != self._manifest_size:
+            with open(manifest, "rb") as f:
+                f.seek(self._manifest_size)
+                for line in f:
+                    self._manifest_lines += 1
+                    flow_id = line.rstrip(b"\n").decode()
+                    if flow_id:
+                        self._flows.pop(flow_id, None)
+                        self._flows[flow_id] = None
+            self._manifest_size = stat.st_size
+        return self._flows
+
+    def _compact_manifest(self) -> None:
+        """Rewrite the manifest with one line per flow, in recency order."""
+        if self._manifest is not None:
+            self._manifest.close()
+            self._manifest = None
+        manifest = self._base_dir / self._MANIFEST
+        tmp = manifest.with_name(f"{self._MANIFEST}.{os.getpid()}.tmp")
+        data = "".join(f"{flow_id}\n" for flow_id in self._flows).encode()
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, manifest)
+        self._manifest_inode = manifest.stat().st_ino
+        self._manifest_size = len(data)
+        self._manifest_lines = len(self._flows)
+
+    def _touch_flow(self, flow_id: str) -> None:
+        """Mark a flow as most recently written, recording it in the manifest."""
+        flows = self._load_manifest()
+        if next(reversed(flows), None) == flow_id:
+            return
+        flows.pop(flow_id, None)
+        flows[flow_id] = None
+        if self._manifest_lines >= 2 * len(flows) + 64:
+            self._compact_manifest()
+            return
+        if self._manifest is None:
+            self._manifest = open(self._base_dir / self._MANIFEST, "ab")  # noqa: SIM115
+        self._manifest.write(f"{flow_id}\n".encode())
+        self._manifest.flush()
+
+    # ------------------------------------------------------------------
+    # EventStore API
+    # ------------------------------------------------------------------
+
+    async def append(self, event: Event, flow_id: str) -> None:
+        log = self._open_log(flow_id)
+        offset = log.data.tell()
+        log.data.write(json.dumps(event.to_dict()).encode() + b"\n")
+        log.data.flush()
+        log.index.write(f"{offset}\t{event.id}\n".encode())
+        log.index.flush()
+        log.offsets.setdefault(event.id, offset)
+
+        log.pending += 1
+        if self._fsync_every and log.pending >= self._fsync_every:
+            os.fsync(log.data.fileno())
+            os.fsync(log.index.fileno())
+            log.pending = 0
+
+        self._touch_flow(flow_id)
+
+    def _read(
         self,
         flow_id: str,
         *,
         after: str | None = None,
         before: str | None = None,
-        limit: int | None = None,
-    ) -> list[Event]:
+        until: str | None = None,
+    ) -> Iterator[Event]:
+        """Yield events lazily, seeking straight to the requested range."""
         path = self._flow_path(flow_id)
         if not path.exists():
-            return []
-
-        events = []
-        with open(path) as f:
-            for line in f:
-                if line.strip():
-                    events.append(Event.from_dict(json.loads(line)))
+            return
 
-        # Apply filters (same logic as InMemoryEventStore)
+        offsets = self._offsets(flow_id)
+        start = 0
         if after:
-            found = False
-            filtered = []
-            for e in events:
-                if found:
-                    filtered.append(e)
-                elif e.id == after:
-                    found = True
-            events = filtered
-
-        if before:
-            filtered = []
-            for e in events:
-                if e.id == before:
-                    break
-                filtered.append(e)
-            events = filtered
+            if after not in offsets:
+                return
+            start = offsets[after]
+        stop = offsets.get(before) if before else None
+
+        with open(path, "rb") as f:
+            f.seek(start)
+            if after:
+                f.readline()  # Skip the "after" event itself
+            for offset, line in _iter_lines(f):
+                if offset == stop:
+                    return
+                if not line.strip():
+                    continue
+                event = Event.from_dict(json.loads(line))
+                yield event
+                if until is not None and event.id == until:
+                    return
 
+    async def get_events(
+        self,
+        flow_id: str,
+        *,
+        after: str | None = None,
+        before: str | None = None,
+        limit: int | None = None,
+    ) -> list[Event]:
+        events = self._read(flow_id, after=after, before=before)
         if limit:
-            events = events[:limit]
-
-        return events
+            return list(itertools.islice(events, limit))
+        return list(events)
 
     async def replay(
         self,
         flow_id: str,
         to_event_id: str | None = None,
     ) -> list[Event]:
-        events = await self.get_events(flow_id)
-
-        if to_event_id is None:
-            return events
-
-        result = []
-        for e in events:
-            result.append(e)
-            if e.id == to_event_id:
-                break
+        return list(self._read(flow_id, until=to_event_id))
 
-        return result
+    async def stream_events(
+        self,
+        flow_id: str,
+    ) -> AsyncIterator[Event]:
+        """Stream events for a flow, parsing one record at a time."""
+        for event in self._read(flow_id):
+            yield event
 
     async def get_flow_ids(self, *, limit: int = 100) -> list[str]:
-        flows = []
-        for path in self._base_dir.glob("*.jsonl"):
-            # Get modification time for sorting
-            mtime = path.stat().st_mtime
-            flows.append((mtime, path.stem))
-
-        # Sort by modification time, most recent first
-        flows.sort(reverse=True)
-        return [flow_id for _, flow_id in flows[:limit]]
+        # Most recently written first
+        return list(itertools.islice(reversed(self._load_manifest()), limit))
+
+    def close(self) -> None:
+        """Flush (and fsync, if enabled) and close all open writers."""
+        while self._logs:
+            _, log = self._logs.popitem()
+            self._close_log(log)
+        if self._manifest is not None:
+            self._manifest.close()
+            self._manifest = None
+
+
+def _iter_lines(f: BinaryIO) -> Iterator[tuple[int, bytes]]:
+    """Yield (byte offset, line) pairs from the current position."""
+    offset = f.tell()
+    for line in f:
+        if not line.endswith(b"\n"):
+            return  # Partial trailing record from an interrupted write
+        yield offset, line
+        offset += len(line)
 
 
 @dataclass
@@ -39,6 +39,7 @@ from agenticflow.core.utils import model_identifier
 from agenticflow.interceptors.base import (
     InterceptContext,
     Interceptor,
+    MessageLog,
     Phase,
     StopExecution,
     run_interceptors,
@@ -48,6 +49,8 @@ from agenticflow.models.openai import OpenAIChat
 from agenticflow.tools.base import BaseTool
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from agenticflow.agent import Agent
 
 
@@ -693,6 +696,9 @@ class NativeExecutor(BaseExecutor):
         # Current system prompt (can be modified by PromptAdapter interceptors)
         current_prompt = self.agent.config.system_prompt
 
+        # Shared message cache: each phase gets a view instead of a copy
+        message_log = MessageLog(messages)
+
         # Helper to create context for a phase
         def make_ctx(
             phase: Phase,
@@ -702,7 +708,7 @@ class NativeExecutor(BaseExecutor):
                 agent=self.agent,
                 phase=phase,
                 task=task,
-                messages=[{"role": getattr(m, "role", "unknown"), "content": getattr(m, "content", "")} for m in messages],
+                messages=message_log.view(),
                 state=intercept_state,
                 run_context=run_context,
                 tools=current_tools,
@@ -728,6 +734,7 @@ class NativeExecutor(BaseExecutor):
                         messages[0] = SystemMessage(content=current_prompt)
                     elif current_prompt:
                         messages.insert(0, SystemMessage(content=current_prompt))
+                    message_log.reset()
             except StopExecution as e:
                 return e.response
 
@@ -752,6 +759,7 @@ class NativeExecutor(BaseExecutor):
                             else:  # user or unknown
                                 new_messages.append(HumanMessage(content=content))
                         messages = new_messages
+                        message_log.reset(messages)
                     # Apply tool filtering if modified
                     if result.modified_tools is not None:
                         current_tools = result.modified_tools
@@ -765,6 +773,7 @@ class NativeExecutor(BaseExecutor):
                         current_prompt = result.modified_prompt
                         if messages and isinstance(messages[0], SystemMessage):
                             messages[0] = SystemMessage(content=current_prompt)
+                            message_log.reset()
                 except StopExecution as e:
                     return e.response
 
@@ -1017,12 +1026,15 @@ class NativeExecutor(BaseExecutor):
             # Execute the tool
             tool = self._tool_map.get(tool_name)
             if tool:
-                try:
+                async def invoke(tool: Any = tool, tool_args: dict[str, Any] = tool_args) -> str:
                     if hasattr(tool, "ainvoke"):
                         result = await tool.ainvoke(tool_args, ctx=run_context)
                     else:
                         result = tool.invoke(tool_args, ctx=run_context)
-                    result_str = str(result) if result is not None else ""
+                    return str(result) if result is not None else ""
+
+                try:
+                    result_str = await self._call_tool(tool, tool_name, tool_args, invoke)
                 except Exception as e:
                     result_str = f"Error: {e}"
             else:
@@ -1242,6 +1254,43 @@ class NativeExecutor(BaseExecutor):
 
         return messages
 
+    async def _call_tool(
+        self,
+        tool: Any,
+        tool_name: str,
+        args: dict[str, Any],
+        invoke: Callable[[], Awaitable[str]],
+    ) -> str:
+        """Run a tool call, going through the tool's result cache if it has one.
+
+        Args:
+            tool: The tool being called.
+            tool_name: Tool name.
+            args: Call arguments.
+            invoke: Coroutine function that executes the tool.
+
+        Returns:
+            Tool output as a string.
+        """
+        cache = getattr(tool, "cache", None)
+        if cache is None:
+            return await invoke()
+
+        content, hit = await cache.get_or_call(tool_name, args, invoke)
+
+        event_bus = getattr(self.agent, "event_bus", None)
+        if event_bus:
+            from agenticflow.observability.trace_record import TraceType
+
+            event_type = TraceType.TOOL_CACHE_HIT if hit else TraceType.TOOL_CACHE_MISS
+            await event_bus.publish(event_type.value, {
+                "agent_name": self.agent.name or "agent",
+                "tool": tool_name,
+                "hits": cache.hits,
+                "misses": cache.misses,
+            })
+        return content
+
     async def _run_single_tool(
         self,
         tool_call: dict[str, Any],
@@ -1271,18 +1320,22 @@ class NativeExecutor(BaseExecutor):
                 tool_call_id=tool_id,
             )
 
-        try:
+        async def invoke() -> str:
             # Direct invocation with context support
             if asyncio.iscoroutinefunction(getattr(tool, "func", None)):
                 result = await tool.ainvoke(args, ctx=run_context)
             else:
                 # Run sync tools in thread pool to not block
                 result = await asyncio.to_thread(tool.invoke, args, run_context)
+            return str(result) if result is not None else ""
+
+        try:
+            content = await self._call_tool(tool, tool_name, args, invoke)
 
-            self._track_tool_result(tool_name, result, 0)
+            self._track_tool_result(tool_name, content, 0)
 
             return ToolMessage(
-                content=str(result) if result is not None else "",
+                content=content,
                 tool_call_id=tool_id,
             )
 
@@ -10,8 +10,12 @@ Used by both imperative (Flow) and reactive (EventFlow) orchestration.
 
 from __future__ import annotations
 
+import asyncio
 import json
+import sqlite3
+import threading
 import uuid
+import zlib
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -314,6 +318,212 @@ class FileCheckpointer:
             await self.delete(checkpoint_id)
 
 
+class SQLiteCheckpointer:
+    """SQLite-backed checkpointer with indexed per-flow lookup.
+
+    Checkpoints live in a single WAL-mode database indexed on
+    (flow_id, timestamp), so ``save``, ``load_latest`` and pruning touch
+    only the rows of one flow regardless of how many flows are stored.
+    States are stored as zlib-compressed compact JSON.
+
+    With ``delta=True``, a checkpoint stores only the top-level FlowState
+    fields that changed since the previous checkpoint of the same flow,
+    plus a full snapshot every ``full_every`` saves to bound the chain
+    that ``load`` has to walk.
+
+    Example:
+        ```python
+        checkpointer = SQLiteCheckpointer("./checkpoints.db", delta=True)
+        flow = ReactiveFlow(checkpointer=checkpointer)
+        ```
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        max_checkpoints_per_flow: int = 100,
+        delta: bool = False,
+        full_every: int = 20,
+    ) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_per_flow = max_checkpoints_per_flow
+        self._delta = delta
+        self._full_every = max(1, full_every)
+        # flow_id -> (checkpoint_id, JSON of each state field, deltas since
+        # last full). Serialized so callers mutating the context they passed
+        # in (as ReactiveFlow does) can't change the delta base.
+        self._last: dict[str, tuple[str, dict[str, str], int]] = {}
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            "checkpoint_id TEXT PRIMARY KEY, "
+            "flow_id TEXT NOT NULL, "
+            "timestamp REAL NOT NULL, "
+            "base_id TEXT, "
+            "payload BLOB NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_checkpoints_flow "
+            "ON checkpoints (flow_id, timestamp)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_checkpoints_base ON checkpoints (base_id)"
+        )
+        self._conn.commit()
+
+    async def save(self, state: FlowState) -> None:
+        """Save checkpoint, pruning the flow's oldest beyond the limit."""
+        await asyncio.to_thread(self._save, state)
+
+    async def load(self, checkpoint_id: str) -> FlowState | None:
+        """Load checkpoint by ID, applying deltas if needed."""
+        return await asyncio.to_thread(self._load, checkpoint_id)
+
+    async def load_latest(self, flow_id: str) -> FlowState | None:
+        """Load most recent checkpoint for a flow."""
+        return await asyncio.to_thread(self._load_latest, flow_id)
+
+    async def list_checkpoints(self, flow_id: str) -> list[str]:
+        """List checkpoints for a flow (newest first)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT checkpoint_id FROM checkpoints WHERE flow_id = ? "
+                "ORDER BY timestamp DESC, rowid DESC",
+                (flow_id,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    async def delete(self, checkpoint_id: str) -> bool:
+        """Delete a checkpoint, materializing any deltas based on it."""
+        return await asyncio.to_thread(self._delete, checkpoint_id)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _save(self, state: FlowState) -> None:
+        data = state.to_dict()
+        base_id: str | None = None
+        payload = data
+        encoded: dict[str, str] = {}
+        if self._delta:
+            encoded = {
+                k: json.dumps(v, sort_keys=True, separators=(",", ":"), default=str)
+                for k, v in data.items()
+            }
+        last = self._last.get(state.flow_id)
+        chain = 0
+        if self._delta and last is not None and last[2] + 1 < self._full_every:
+            base_id, previous, chain = last[0], last[1], last[2] + 1
+            payload = {k: data[k] for k, v in encoded.items() if previous.get(k) != v}
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints "
+                "(checkpoint_id, flow_id, timestamp, base_id, payload) VALUES (?, ?, ?, ?, ?)",
+                (
+                    state.checkpoint_id,
+                    state.flow_id,
+                    state.timestamp.timestamp(),
+                    base_id,
+                    _pack(payload),
+                ),
+            )
+            stale = self._conn.execute(
+                "SELECT checkpoint_id FROM checkpoints WHERE flow_id = ? "
+                "ORDER BY timestamp DESC, rowid DESC LIMIT -1 OFFSET ?",
+                (state.flow_id, self._max_per_flow),
+            ).fetchall()
+            for (old_id,) in stale:
+                self._delete_row(old_id)
+            self._conn.commit()
+
+        if self._delta:
+            self._last[state.flow_id] = (state.checkpoint_id, encoded, chain)
+
+    def _load(self, checkpoint_id: str) -> FlowState | None:
+        with self._lock:
+            data = self._resolve(checkpoint_id)
+        if data is None:
+            return None
+        try:
+            return FlowState.from_dict(data)
+        except KeyError:
+            return None
+
+    def _load_latest(self, flow_id: str) -> FlowState | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT checkpoint_id FROM checkpoints WHERE flow_id = ? "
+                "ORDER BY timestamp DESC, rowid DESC LIMIT 1",
+                (flow_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return self._load(row[0])
+
+    def _delete(self, checkpoint_id: str) -> bool:
+        with self._lock:
+            deleted = self._delete_row(checkpoint_id)
+            self._conn.commit()
+        for flow_id, last in list(self._last.items()):
+            if last[0] == checkpoint_id:
+                del self._last[flow_id]
+        return deleted
+
+    def _resolve(self, checkpoint_id: str) -> dict[str, Any] | None:
+        """Rebuild a full state dict by walking back to the nearest snapshot."""
+        layers: list[dict[str, Any]] = []
+        current: str | None = checkpoint_id
+        while current is not None:
+            row = self._conn.execute(
+                "SELECT base_id, payload FROM checkpoints WHERE checkpoint_id = ?",
+                (current,),
+            ).fetchone()
+            if row is None:
+                return None
+            current = row[0]
+            layers.append(_unpack(row[1]))
+
+        data: dict[str, Any] = {}
+        for layer in reversed(layers):
+            data.update(layer)
+        return data
+
+    def _delete_row(self, checkpoint_id: str) -> bool:
+        """Delete one row, first turning deltas that depend on it into snapshots."""
+        dependents = self._conn.execute(
+            "SELECT checkpoint_id FROM checkpoints WHERE base_id = ?",
+            (checkpoint_id,),
+        ).fetchall()
+        for (child_id,) in dependents:
+            data = self._resolve(child_id)
+            if data is not None:
+                self._conn.execute(
+                    "UPDATE checkpoints SET base_id = NULL, payload = ? WHERE checkpoint_id = ?",
+                    (_pack(data), child_id),
+                )
+        cursor = self._conn.execute(
+            "DELETE FROM checkpoints WHERE checkpoint_id = ?", (checkpoint_id,)
+        )
+        return cursor.rowcount > 0
+
+
+def _pack(data: dict[str, Any]) -> bytes:
+    return zlib.compress(json.dumps(data, separators=(",", ":"), default=str).encode())
+
+
+def _unpack(blob: bytes) -> dict[str, Any]:
+    return json.loads(zlib.decompress(blob))
+
+
 def generate_checkpoint_id() -> str:
     """Generate a unique checkpoint ID."""
     return f"cp_{uuid.uuid4().hex[:12]}"
@@ -19,7 +19,7 @@ class FlowConfig:
 
     Attributes:
         max_rounds: Maximum event processing rounds (prevents infinite loops)
-        max_concurrent: Maximum concurrent reactor executions
+        max_concurrent: Maximum concurrent reactor executions (1 = sequential)
         event_timeout: Timeout for waiting on events (seconds)
         enable_history: Whether to record all events for debugging
         stop_on_idle: Stop when no more events to process
@@ -12,12 +12,15 @@ from __future__ import annotations
 
 import asyncio
 import fnmatch
+import re
 import uuid
+from collections import deque
 from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from agenticflow.events import Event, EventBus
+from agenticflow.events.router import SubscriptionRouter
 from agenticflow.flow.config import FlowConfig, FlowResult, ReactorBinding
 from agenticflow.reactors.base import Reactor
 
@@ -45,9 +48,9 @@ def _normalize_patterns(on: str | list[str] | None) -> frozenset[str]:
     return frozenset(on)
 
 
-def _matches_pattern(event_type: str, pattern: str) -> bool:
-    """Check if event type matches a pattern (supports * wildcard)."""
-    return fnmatch.fnmatch(event_type, pattern)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a reactor pattern (fnmatch-style: *, ?, [seq])."""
+    return re.compile(fnmatch.translate(pattern))
 
 
 @dataclass
@@ -57,6 +60,7 @@ class _PendingReaction:
     event: Event
     binding: ReactorBinding
     task: asyncio.Task[Event | list[Event] | None] | None = None
+    dispatch: int = 0  # Sequence number of the event dispatch it belongs to
 
 
 class Flow:
@@ -153,6 +157,7 @@ class Flow:
 
         # Bindings: how reactors connect to events
         self._bindings: list[ReactorBinding] = []
+        self._router: SubscriptionRouter[ReactorBinding] | None = None
 
         # Middleware stack
         self._middleware: list[Middleware] = []
@@ -235,6 +240,7 @@ class Flow:
             self._bindings.append(binding)
             # Sort by priority (descending)
             self._bindings.sort(key=lambda b: b.priority, reverse=True)
+            self._router = None
 
         return reactor_id
 
@@ -284,16 +290,17 @@ class Flow:
         return self
 
     def _find_matching_bindings(self, event: Event) -> list[ReactorBinding]:
-        """Find all bindings that match an event type."""
-        matches = []
-        for binding in self._bindings:
-            for pattern in binding.patterns:
-                if _matches_pattern(event.name, pattern):
-                    # Check condition if present
-                    if binding.condition is None or binding.condition(event):
-                        matches.append(binding)
-                        break  # Don't add same binding twice
-        return matches
+        """Find all bindings that match an event type, in priority order."""
+        if self._router is None:
+            # Rebuilt after registration so routes follow priority order
+            self._router = SubscriptionRouter(_compile_pattern, wildcards="*?[")
+            for binding in self._bindings:
+                self._router.add(binding, binding.patterns)
+        return [
+            binding
+            for binding in self._router.match(event.name)
+            if binding.condition is None or binding.condition(event)
+        ]
 
     async def emit(self, event: Event | str, data: dict[str, Any] | None = None) -> None:
         """Emit an event into the flow.
@@ -378,61 +385,125 @@ class Flow:
         # Emit initial event
         await self.emit(initial)
 
-        # Event processing loop
+        # Event processing loop. Events are dispatched in FIFO order and
+        # their reactions run concurrently up to max_concurrent. Reactions
+        # of one event start in binding priority order; events sharing a
+        # correlation ID are handled one at a time, in emission order. The
+        # next event is only dequeued once a reaction slot is free, and a
+        # stop event lets reactions dispatched before it finish, so
+        # max_concurrent=1 processes events strictly one after another.
         rounds = 0
         events_processed = 0
         final_output: Any = None
+        limit = max(1, self.config.max_concurrent)
+
+        ready: deque[_PendingReaction] = deque()
+        running: dict[asyncio.Task[Any], _PendingReaction] = {}
+        outstanding: dict[int, int] = {}  # dispatch -> unfinished reactions
+        chains: dict[str, deque[tuple[Event, list[ReactorBinding]]]] = {}
+        dispatches = 0
+        getter: asyncio.Task[Event] | None = None
+        stopped = False
+
+        def start(event: Event, bindings: list[ReactorBinding]) -> None:
+            nonlocal dispatches
+            dispatches += 1
+            outstanding[dispatches] = len(bindings)
+            ready.extend(
+                _PendingReaction(b.reactor_id, event, b, dispatch=dispatches)
+                for b in bindings
+            )
 
-        try:
-            while rounds < self.config.max_rounds:
-                rounds += 1
+        def dispatch(event: Event, bindings: list[ReactorBinding]) -> None:
+            key = event.correlation_id
+            if key:
+                chain = chains.setdefault(key, deque())
+                chain.append((event, bindings))
+                if len(chain) > 1:
+                    return  # Waits for the earlier event of this correlation
+            if bindings:
+                start(event, bindings)
+            else:
+                release(event)
+
+        def release(event: Event) -> None:
+            """Unblock the next event with the same correlation ID."""
+            key = event.correlation_id
+            if not key:
+                return
+            chain = chains[key]
+            chain.popleft()
+            while chain:
+                next_event, bindings = chain[0]
+                if bindings:
+                    start(next_event, bindings)
+                    return
+                chain.popleft()
+            del chains[key]
+
+        def failed(error: Exception) -> FlowResult:
+            return FlowResult(
+                success=False,
+                error=str(error),
+                events_processed=events_processed,
+                event_history=self._event_history if self.config.enable_history else [],
+                flow_id=self._flow_id,
+            )
 
-                # Get next event (with timeout)
-                try:
-                    event = await asyncio.wait_for(
-                        self._event_queue.get(),
-                        timeout=self.config.event_timeout,
+        try:
+            while True:
+                while ready and len(running) < limit:
+                    reaction = ready.popleft()
+                    reaction.task = asyncio.create_task(
+                        self._execute_reactor(
+                            self._reactors[reaction.reactor_id],
+                            reaction.event,
+                            reaction.binding,
+                        )
                     )
-                except TimeoutError:
-                    if self.config.stop_on_idle:
-                        break
-                    continue
-
-                events_processed += 1
+                    running[reaction.task] = reaction
 
-                # Check for stop event
-                if event.name in self.config.stop_events:
-                    self._stop_event = event
-                    final_output = event.data.get("output", event.data)
+                accepting = not stopped and rounds < self.config.max_rounds
+                if not accepting and not running:
                     break
+                if accepting and getter is None and not ready and len(running) < limit:
+                    getter = asyncio.ensure_future(self._event_queue.get())
+
+                waiting: set[asyncio.Future[Any]] = set(running)
+                if accepting and getter is not None:
+                    waiting.add(getter)
+                done, _ = await asyncio.wait(
+                    waiting,
+                    timeout=None if running else self.config.event_timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
 
-                # Find matching reactors
-                bindings = self._find_matching_bindings(event)
-
-                if not bindings and self.config.stop_on_idle:
-                    # No reactors matched and queue is empty
-                    if self._event_queue.empty():
+                if not done:
+                    # Idle: nothing running and no event within event_timeout
+                    if self.config.stop_on_idle:
                         break
+                    rounds += 1
+                    continue
 
-                # Execute matching reactors
-                for binding in bindings:
-                    reactor = self._reactors[binding.reactor_id]
+                # Finished reactions, in start order
+                for task in [t for t in running if t in done]:
+                    reaction = running.pop(task)
+                    event, binding = reaction.event, reaction.binding
 
                     try:
-                        # Execute reactor
-                        result_events = await self._execute_reactor(
-                            reactor, event, binding
-                        )
+                        result_events = task.result()
 
                         # Emit result events
                         if result_events:
                             if isinstance(result_events, Event):
                                 await self.emit(result_events)
-                                final_output = result_events.data.get("output", result_events.data)
+                                if not stopped:
+                                    final_output = result_events.data.get("output", result_events.data)
                             elif isinstance(result_events, list):
                                 for e in result_events:
                                     await self.emit(e)
-                                    final_output = e.data.get("output", e.data)
+                                    if not stopped:
+                                        final_output = e.data.get("output", e.data)
 
                         # Auto-emit if configured
                         if binding.emits and result_events:
@@ -447,15 +518,39 @@ class Flow:
 
                     except Exception as e:
                         if self.config.error_policy == "fail_fast":
-                            return FlowResult(
-                                success=False,
-                                error=str(e),
-                                events_processed=events_processed,
-                                event_history=self._event_history if self.config.enable_history else [],
-                                flow_id=self._flow_id,
-                            )
+                            return failed(e)
                         # continue or retry handled by middleware
-                        pass
+
+                    outstanding[reaction.dispatch] -= 1
+                    if not outstanding[reaction.dispatch]:
+                        del outstanding[reaction.dispatch]
+                        release(event)
+
+                if getter is None or getter not in done:
+                    continue
+
+                event = getter.result()
+                getter = None
+                rounds += 1
+                events_processed += 1
+
+                # Check for stop event: accept no more events, but let
+                # reactions already dispatched finish
+                if event.name in self.config.stop_events:
+                    self._stop_event = event
+                    final_output = event.data.get("output", event.data)
+                    stopped = True
+                    continue
+
+                # Find matching reactors
+                bindings = self._find_matching_bindings(event)
+
+                if not bindings and self.config.stop_on_idle:
+                    # No reactors matched, nothing in flight and queue is empty
+                    if not running and not ready and self._event_queue.empty():
+                        break
+
+                dispatch(event, bindings)
 
             return FlowResult(
                 success=True,
@@ -467,13 +562,15 @@ class Flow:
             )
 
         except Exception as e:
-            return FlowResult(
-                success=False,
-                error=str(e),
-                events_processed=events_processed,
-                event_history=self._event_history if self.config.enable_history else [],
-                flow_id=self._flow_id,
-            )
+            return failed(e)
+
+        finally:
+            # Failures end the flow with reactions in flight
+            pending = [*running, *([getter] if getter is not None else [])]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
     async def _execute_reactor(
         self,
@@ -10,6 +10,7 @@ import asyncio
 import contextlib
 import inspect
 import json
+from collections import deque
 from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
@@ -46,6 +47,10 @@ class ReactiveFlowConfig:
         stop_events: Event types that signal flow completion
         flow_id: Optional fixed flow ID (auto-generated if None)
         checkpoint_every: Checkpoint after every N rounds (0 = disabled)
+        pipelined: Dispatch events as they arrive instead of finishing each
+            event's agents before taking the next one
+        max_pending_events: Pending-queue size at which ``emit()`` waits for
+            the flow to catch up (0 = unbounded)
     """
 
     max_rounds: int = 100
@@ -56,6 +61,8 @@ class ReactiveFlowConfig:
     stop_events: frozenset[str] = frozenset({"flow.completed", "flow.failed"})
     flow_id: str | None = None
     checkpoint_every: int = 0  # 0 = disabled, 1 = every round, etc.
+    pipelined: bool = False
+    max_pending_events: int = 0
 
 
 
@@ -170,6 +177,7 @@ class ReactiveFlow(BaseFlow):
         self.events = CoreEventBus()
         self._agents_registry: dict[str, tuple[Agent, AgentTriggerConfig]] = {}
         self._pending_events: asyncio.Queue[CoreEvent] = asyncio.Queue()
+        self._queue_space = asyncio.Event()  # Set whenever an event is taken
         self._stop_event: CoreEvent | None = None
         self._thread_id_resolver = thread_id_resolver
         self._checkpointer = checkpointer
@@ -497,77 +505,87 @@ class ReactiveFlow(BaseFlow):
         error: Exception | None = None
 
         try:
-            while self._running and rounds < self.config.max_rounds:
-                rounds += 1
-
-                self._observe(
-                    TraceType.REACTIVE_ROUND_STARTED,
-                    {"round": rounds, "pending_events": self._pending_events.qsize()},
-                )
-
-                # Get next event (with timeout)
-                try:
-                    event = await asyncio.wait_for(
-                        self._pending_events.get(),
-                        timeout=self.config.event_timeout,
-                    )
-                except TimeoutError:
-                    if self.config.stop_on_idle:
-                        break
-                    continue
-
-                events_processed += 1
-                event_name = event.name
-
-                self._observe(
-                    TraceType.REACTIVE_EVENT_PROCESSED,
-                    {"event_name": event_name, "event_id": event.id, "round": rounds},
-                )
-
-                # Check for stop events
-                if event_name in self.config.stop_events:
-                    self._stop_event = event
-                    break
-
-                # Find and execute matching agents
-                agent_reactions = await self._process_event(
-                    event=event,
+            if self.config.pipelined:
+                rounds, events_processed, last_output = await self._run_pipelined(
                     task=task,
                     context=context,
+                    reactions=reactions,
+                    rounds=rounds,
+                    events_processed=events_processed,
+                    last_output=last_output,
                 )
-                reactions.extend(agent_reactions)
+            else:
+                while self._running and rounds < self.config.max_rounds:
+                    rounds += 1
 
-                # Track last successful output
-                for reaction in agent_reactions:
-                    if reaction.output and not reaction.error:
-                        last_output = reaction.output
+                    self._observe(
+                        TraceType.REACTIVE_ROUND_STARTED,
+                        {"round": rounds, "pending_events": self._pending_events.qsize()},
+                    )
 
-                # Checkpoint if enabled
-                if self._checkpointer and self.config.checkpoint_every > 0:
-                    if rounds % self.config.checkpoint_every == 0:
-                        await self._save_checkpoint(
-                            task=task,
-                            rounds=rounds,
-                            events_processed=events_processed,
-                            last_output=last_output,
-                            context=context,
-                            reactions=reactions,
+                    # Get next event (with timeout)
+                    try:
+                        event = await asyncio.wait_for(
+                            self._next_event(),
+                            timeout=self.config.event_timeout,
                         )
+                    except TimeoutError:
+                        if self.config.stop_on_idle:
+                            break
+                        continue
 
-                self._observe(
-                    TraceType.REACTIVE_ROUND_COMPLETED,
-                    {
-                        "round": rounds,
-                        "reactions": len(agent_reactions),
-                        "total_reactions": len(reactions),
-                    },
-                )
+                    events_processed += 1
+                    event_name = event.name
 
-                # If no agents matched and queue is empty, we're done
-                if not agent_reactions and self._pending_events.empty():
-                    if self.config.stop_on_idle:
+                    self._observe(
+                        TraceType.REACTIVE_EVENT_PROCESSED,
+                        {"event_name": event_name, "event_id": event.id, "round": rounds},
+                    )
+
+                    # Check for stop events
+                    if event_name in self.config.stop_events:
+                        self._stop_event = event
                         break
 
+                    # Find and execute matching agents
+                    agent_reactions = await self._process_event(
+                        event=event,
+                        task=task,
+                        context=context,
+                    )
+                    reactions.extend(agent_reactions)
+
+                    # Track last successful output
+                    for reaction in agent_reactions:
+                        if reaction.output and not reaction.error:
+                            last_output = reaction.output
+
+                    # Checkpoint if enabled
+                    if self._checkpointer and self.config.checkpoint_every > 0:
+                        if rounds % self.config.checkpoint_every == 0:
+                            await self._save_checkpoint(
+                                task=task,
+                                rounds=rounds,
+                                events_processed=events_processed,
+                                last_output=last_output,
+                                context=context,
+                                reactions=reactions,
+                            )
+
+                    self._observe(
+                        TraceType.REACTIVE_ROUND_COMPLETED,
+                        {
+                            "round": rounds,
+                            "reactions": len(agent_reactions),
+                            "total_reactions": len(reactions),
+                        },
+                    )
+
+                    # If no agents matched and queue is empty, we're done
+                    if not agent_reactions and self._pending_events.empty():
+                        if self.config.stop_on_idle:
+                            break
+
         except Exception as e:
             error = e
             self._observe(
@@ -578,6 +596,7 @@ class ReactiveFlow(BaseFlow):
 
         finally:
             self._running = False
+            self._queue_space.set()
             await self.cancel_spawned()
 
         elapsed_ms = (time.perf_counter() - start_time) * 1000
@@ -598,7 +617,7 @@ class ReactiveFlow(BaseFlow):
             output=last_output,
             events_processed=events_processed,
             reactions=reactions,
-            event_history=self._bus._event_history.copy() if self.config.enable_history else [],
+            event_history=list(self._bus._event_history) if self.config.enable_history else [],
             final_event=self._stop_event,
             execution_time_ms=elapsed_ms,
             checkpoint_id=self._last_checkpoint_id,
@@ -614,8 +633,13 @@ class ReactiveFlow(BaseFlow):
         last_output: str,
         context: dict[str, Any],
         reactions: list[Reaction],
+        in_flight: list[CoreEvent] | None = None,
     ) -> None:
-        """Save current flow state to checkpoint."""
+        """Save current flow state to checkpoint.
+
+        ``in_flight`` events (taken from the queue but not finished) are
+        stored ahead of the queued ones so a resume processes them again.
+        """
         if not self._checkpointer or not self._flow_id:
             return
 
@@ -625,7 +649,9 @@ class ReactiveFlow(BaseFlow):
         self._last_checkpoint_id = checkpoint_id
 
         # Drain pending events to list (and re-queue)
-        pending_list: list[dict[str, Any]] = []
+        pending_list: list[dict[str, Any]] = [
+            {"id": ev.id, "name": ev.name, "data": ev.data} for ev in in_flight or []
+        ]
         temp_events: list[CoreEvent] = []
         while not self._pending_events.empty():
             try:
@@ -736,77 +762,86 @@ class ReactiveFlow(BaseFlow):
         error: Exception | None = None
 
         try:
-            while self._running and rounds < self.config.max_rounds:
-                rounds += 1
-
-                self._observe(
-                    TraceType.REACTIVE_ROUND_STARTED,
-                    {"round": rounds, "pending_events": self._pending_events.qsize()},
-                )
-
-                # Get next event (with timeout)
-                try:
-                    event = await asyncio.wait_for(
-                        self._pending_events.get(),
-                        timeout=self.config.event_timeout,
-                    )
-                except TimeoutError:
-                    if self.config.stop_on_idle:
-                        break
-                    continue
-
-                events_processed += 1
-                event_name = event.name
-
-                self._observe(
-                    TraceType.REACTIVE_EVENT_PROCESSED,
-                    {"event_name": event_name, "event_id": event.id, "round": rounds},
-                )
-
-                # Check for stop events
-                if event_name in self.config.stop_events:
-                    self._stop_event = event
-                    break
-
-                # Find and execute matching agents
-                agent_reactions = await self._process_event(
-                    event=event,
+            if self.config.pipelined:
+                rounds, events_processed, last_output = await self._run_pipelined(
                     task=task,
                     context=context,
+                    reactions=reactions,
+                    rounds=rounds,
+                    events_processed=events_processed,
+                    last_output=last_output,
                 )
-                reactions.extend(agent_reactions)
+            else:
+                while self._running and rounds < self.config.max_rounds:
+                    rounds += 1
 
-                # Track last successful output
-                for reaction in agent_reactions:
-                    if reaction.output and not reaction.error:
-                        last_output = reaction.output
+                    self._observe(
+                        TraceType.REACTIVE_ROUND_STARTED,
+                        {"round": rounds, "pending_events": self._pending_events.qsize()},
+                    )
 
-                # Checkpoint if enabled
-                if self._checkpointer and self.config.checkpoint_every > 0:
-                    if rounds % self.config.checkpoint_every == 0:
-                        await self._save_checkpoint(
-                            task=task,
-                            rounds=rounds,
-                            events_processed=events_processed,
-                            last_output=last_output,
-                            context=context,
-                            reactions=reactions,
+                    # Get next event (with timeout)
+                    try:
+                        event = await asyncio.wait_for(
+                            self._next_event(),
+                            timeout=self.config.event_timeout,
                         )
+                    except TimeoutError:
+                        if self.config.stop_on_idle:
+                            break
+                        continue
 
-                self._observe(
-                    TraceType.REACTIVE_ROUND_COMPLETED,
-                    {
-                        "round": rounds,
-                        "reactions": len(agent_reactions),
-                        "total_reactions": len(reactions),
-                    },
-                )
+                    events_processed += 1
+                    event_name = event.name
 
-                # If no agents matched and queue is empty, we're done
-                if not agent_reactions and self._pending_events.empty():
-                    if self.config.stop_on_idle:
+                    self._observe(
+                        TraceType.REACTIVE_EVENT_PROCESSED,
+                        {"event_name": event_name, "event_id": event.id, "round": rounds},
+                    )
+
+                    # Check for stop events
+                    if event_name in self.config.stop_events:
+                        self._stop_event = event
                         break
 
+                    # Find and execute matching agents
+                    agent_reactions = await self._process_event(
+                        event=event,
+                        task=task,
+                        context=context,
+                    )
+                    reactions.extend(agent_reactions)
+
+                    # Track last successful output
+                    for reaction in agent_reactions:
+                        if reaction.output and not reaction.error:
+                            last_output = reaction.output
+
+                    # Checkpoint if enabled
+                    if self._checkpointer and self.config.checkpoint_every > 0:
+                        if rounds % self.config.checkpoint_every == 0:
+                            await self._save_checkpoint(
+                                task=task,
+                                rounds=rounds,
+                                events_processed=events_processed,
+                                last_output=last_output,
+                                context=context,
+                                reactions=reactions,
+                            )
+
+                    self._observe(
+                        TraceType.REACTIVE_ROUND_COMPLETED,
+                        {
+                            "round": rounds,
+                            "reactions": len(agent_reactions),
+                            "total_reactions": len(reactions),
+                        },
+                    )
+
+                    # If no agents matched and queue is empty, we're done
+                    if not agent_reactions and self._pending_events.empty():
+                        if self.config.stop_on_idle:
+                            break
 
         except Exception as e:
             error = e
@@ -818,6 +853,7 @@ class ReactiveFlow(BaseFlow):
 
         finally:
             self._running = False
+            self._queue_space.set()
             await self.cancel_spawned()
 
         elapsed_ms = (time.perf_counter() - start_time) * 1000
@@ -841,7 +877,7 @@ class ReactiveFlow(BaseFlow):
             output=last_output,
             events_processed=events_processed,
             reactions=reactions,
-            event_history=self._bus._event_history.copy() if self.config.enable_history else [],
+            event_history=list(self._bus._event_history) if self.config.enable_history else [],
             final_event=self._stop_event,
             execution_time_ms=elapsed_ms,
             checkpoint_id=self._last_checkpoint_id,
@@ -931,7 +967,7 @@ class ReactiveFlow(BaseFlow):
                 # Get next event
                 try:
                     event = await asyncio.wait_for(
-                        self._pending_events.get(),
+                        self._next_event(),
                         timeout=self.config.event_timeout,
                     )
                 except TimeoutError:
@@ -977,6 +1013,7 @@ class ReactiveFlow(BaseFlow):
 
         finally:
             self._running = False
+            self._queue_space.set()
             await self.cancel_spawned()
 
         self._observe(
@@ -1003,10 +1040,7 @@ class ReactiveFlow(BaseFlow):
         """
 
         # Find matching agents
-        matching: list[tuple[Agent, Trigger]] = []
-        for agent, trigger_config in self._agents_registry.values():
-            for trigger in trigger_config.get_matching_triggers(event):
-                matching.append((agent, trigger))
+        matching = self._matching_agents(event)
 
         if not matching:
             self._observe(
@@ -1062,12 +1096,7 @@ class ReactiveFlow(BaseFlow):
         )
 
         try:
-            thread_id: str | None = None
-            if self._thread_id_resolver is not None:
-                try:
-                    thread_id = self._thread_id_resolver(event, context)
-                except TypeError:
-                    thread_id = self._thread_id_resolver(event)  # type: ignore[misc]
+            thread_id = self._resolve_thread_id(event, context)
 
             # Skill injection (same as non-streaming)
             matching_skills = self._get_matching_skills(event)
@@ -1131,6 +1160,212 @@ class ReactiveFlow(BaseFlow):
                 metadata={"error": str(e)},
             )
 
+    async def _run_pipelined(
+        self,
+        *,
+        task: str,
+        context: dict[str, Any],
+        reactions: list[Reaction],
+        rounds: int = 0,
+        events_processed: int = 0,
+        last_output: str = "",
+    ) -> tuple[int, int, str]:
+        """
+        Process events without a barrier between them.
+
+        Each event is dispatched as soon as it is taken from the pending
+        queue, and its agents run on one flow-wide pool of
+        ``max_concurrent_agents`` workers, so a slow agent only holds up
+        events that wait on it. Events with the same thread ID (see
+        ``thread_by_data``) are processed one at a time, in arrival order.
+        The next event is only taken once a worker is free, so events wait
+        in the pending queue (bounded by ``max_pending_events``) rather than
+        in memory. A stop event ends intake; agents already dispatched
+        finish first.
+
+        Args:
+            task: Original task
+            context: Shared context
+            reactions: Reaction list to append to
+            rounds: Rounds already run (when resuming)
+            events_processed: Events already processed (when resuming)
+            last_output: Last output so far (when resuming)
+
+        Returns:
+            Updated (rounds, events_processed, last_output)
+        """
+        limit = max(1, self.config.max_concurrent_agents)
+        ready: deque[tuple[int, Agent, Trigger]] = deque()  # Waiting for a worker
+        running: dict[asyncio.Task[Reaction], int] = {}  # task -> round
+        remaining: dict[int, int] = {}  # round -> unfinished reactions
+        in_flight: dict[int, tuple[CoreEvent, str | None, int]] = {}  # round -> (event, thread, agents)
+        threads: dict[str, deque[tuple[int, list[tuple[Agent, Trigger]]]]] = {}
+        getter: asyncio.Task[CoreEvent] | None = None
+        stopped = False
+        completed = 0
+
+        def start(round_no: int, matching: list[tuple[Agent, Trigger]]) -> None:
+            remaining[round_no] = len(matching)
+            ready.extend((round_no, agent, trigger) for agent, trigger in matching)
+
+        def finish(round_no: int) -> None:
+            _, thread_id, agents = in_flight.pop(round_no)
+            self._observe(
+                TraceType.REACTIVE_ROUND_COMPLETED,
+                {"round": round_no, "reactions": agents, "total_reactions": len(reactions)},
+            )
+            if thread_id is None:
+                return
+            # Start the next event waiting on this thread
+            waiting = threads[thread_id]
+            waiting.popleft()
+            if waiting:
+                start(*waiting[0])
+            else:
+                del threads[thread_id]
+
+        try:
+            while True:
+                while ready and len(running) < limit:
+                    round_no, agent, trigger = ready.popleft()
+                    agent_task = asyncio.create_task(
+                        self._execute_agent(
+                            agent=agent,
+                            trigger=trigger,
+                            event=in_flight[round_no][0],
+                            task=task,
+                            context=context,
+                        )
+                    )
+                    running[agent_task] = round_no
+
+                accepting = not stopped and self._running and rounds < self.config.max_rounds
+                if not accepting and not running:
+                    break
+                if accepting and getter is None and not ready and len(running) < limit:
+                    getter = asyncio.ensure_future(self._next_event())
+
+                waiting_on: set[asyncio.Future[Any]] = set(running)
+                if accepting and getter is not None:
+                    waiting_on.add(getter)
+                done, _ = await asyncio.wait(
+                    waiting_on,
+                    timeout=None if running else self.config.event_timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                if not done:
+                    # Idle: nothing running and no event within event_timeout
+                    if self.config.stop_on_idle:
+                        break
+                    rounds += 1
+                    continue
+
+                # Finished agents, in start order
+                for agent_task in [t for t in running if t in done]:
+                    round_no = running.pop(agent_task)
+                    reaction = agent_task.result()
+                    reactions.append(reaction)
+                    if reaction.output and not reaction.error:
+                        last_output = reaction.output
+
+                    remaining[round_no] -= 1
+                    if remaining[round_no]:
+                        continue
+                    del remaining[round_no]
+                    finish(round_no)
+
+                    # Checkpoint if enabled
+                    completed += 1
+                    every = self.config.checkpoint_every
+                    if self._checkpointer and every > 0 and completed % every == 0:
+                        await self._save_checkpoint(
+                            task=task,
+                            rounds=rounds,
+                            events_processed=events_processed,
+                            last_output=last_output,
+                            context=context,
+                            reactions=reactions,
+                            in_flight=[in_flight[r][0] for r in sorted(in_flight)],
+                        )
+
+                if getter is None or getter not in done:
+                    continue
+
+                event = getter.result()
+                getter = None
+                rounds += 1
+                events_processed += 1
+
+                self._observe(
+                    TraceType.REACTIVE_ROUND_STARTED,
+                    {"round": rounds, "pending_events": self._pending_events.qsize()},
+                )
+                self._observe(
+                    TraceType.REACTIVE_EVENT_PROCESSED,
+                    {"event_name": event.name, "event_id": event.id, "round": rounds},
+                )
+
+                # Check for stop events: take no more events, but let agents
+                # already dispatched finish
+                if event.name in self.config.stop_events:
+                    self._stop_event = event
+                    stopped = True
+                    continue
+
+                matching = self._matching_agents(event)
+                if not matching:
+                    self._observe(
+                        TraceType.REACTIVE_NO_MATCH,
+                        {"event_name": event.name, "event_id": event.id},
+                    )
+                    # If nothing is running and queue is empty, we're done
+                    if (
+                        not running
+                        and not ready
+                        and self._pending_events.empty()
+                        and self.config.stop_on_idle
+                    ):
+                        break
+                    continue
+
+                thread_id = self._resolve_thread_id(event, context)
+                in_flight[rounds] = (event, thread_id, len(matching))
+                if thread_id is not None:
+                    waiting = threads.setdefault(thread_id, deque())
+                    waiting.append((rounds, matching))
+                    if len(waiting) > 1:
+                        continue  # Runs after the earlier event of this thread
+                start(rounds, matching)
+
+        finally:
+            # Only reached with agents in flight when the run is cancelled or fails
+            pending = [*running, *([getter] if getter is not None else [])]
+            for pending_task in pending:
+                pending_task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return rounds, events_processed, last_output
+
+    def _matching_agents(self, event: CoreEvent) -> list[tuple[Agent, Trigger]]:
+        """Find all (agent, trigger) pairs that react to an event."""
+        matching: list[tuple[Agent, Trigger]] = []
+        for agent, trigger_config in self._agents_registry.values():
+            for trigger in trigger_config.get_matching_triggers(event):
+                matching.append((agent, trigger))
+        return matching
+
+    def _resolve_thread_id(self, event: CoreEvent, context: dict[str, Any]) -> str | None:
+        """Resolve the conversation thread for an event (None = no thread)."""
+        if self._thread_id_resolver is None:
+            return None
+        try:
+            return self._thread_id_resolver(event, context)
+        except TypeError:
+            # Backward compatible: resolver(event) only
+            return self._thread_id_resolver(event)  # type: ignore[misc]
+
     async def _process_event(
         self,
         event: CoreEvent,
@@ -1151,10 +1386,7 @@ class ReactiveFlow(BaseFlow):
         reactions: list[Reaction] = []
 
         # Find all agents with matching triggers
-        matching: list[tuple[Agent, Trigger]] = []
-        for agent, trigger_config in self._agents_registry.values():
-            for trigger in trigger_config.get_matching_triggers(event):
-                matching.append((agent, trigger))
+        matching = self._matching_agents(event)
 
         if not matching:
             self._observe(
@@ -1219,13 +1451,7 @@ class ReactiveFlow(BaseFlow):
         )
 
         try:
-            thread_id: str | None = None
-            if self._thread_id_resolver is not None:
-                try:
-                    thread_id = self._thread_id_resolver(event, context)
-                except TypeError:
-                    # Backward compatible: resolver(event) only
-                    thread_id = self._thread_id_resolver(event)  # type: ignore[misc]
+            thread_id = self._resolve_thread_id(event, context)
 
             # === Skill Injection ===
             # Find matching skills and prepare context/tools
@@ -1394,6 +1620,12 @@ class ReactiveFlow(BaseFlow):
 
         return "\n".join(parts)
 
+    async def _next_event(self) -> CoreEvent:
+        """Take the next pending event and wake emitters waiting for space."""
+        event = await self._pending_events.get()
+        self._queue_space.set()
+        return event
+
     async def _emit_event(self, event_name: str, data: dict[str, Any]) -> None:
         """Emit an orchestration event (core) and mirror it to observability."""
         core_event = CoreEvent(name=event_name, data=dict(data))
@@ -1406,13 +1638,25 @@ class ReactiveFlow(BaseFlow):
         Manually emit an event into the flow.
 
         Useful for external triggers like webhooks, timers, or user input.
+        When ``max_pending_events`` is set, waits while the pending queue is
+        full and the flow is running. Events emitted by agents are never
+        delayed, so a full queue cannot stall the agents that drain it.
 
         Args:
             event_name: Name/type of the event
             data: Event data
         """
+        limit = self.config.max_pending_events
+        while limit and self._running and self._pending_events.qsize() >= limit:
+            self._queue_space.clear()
+            await self._queue_space.wait()
         await self._emit_event(event_name, data or {})
 
+    def stop(self) -> None:
+        """Stop flow execution gracefully, releasing emitters waiting for space."""
+        super().stop()
+        self._queue_space.set()
+
 
 # Backward compatibility alias
 EventFlow = ReactiveFlow
@@ -23,6 +23,8 @@ from agenticflow.interceptors.base import (
     InterceptContext,
     Interceptor,
     InterceptResult,
+    MessageLog,
+    MessageView,
     Phase,
     StopExecution,
     run_interceptors,
@@ -46,6 +48,8 @@ __all__ = [
     "Interceptor",
     "InterceptContext",
     "InterceptResult",
+    "MessageLog",
+    "MessageView",
     "Phase",
     "StopExecution",
     "run_interceptors",
@@ -12,9 +12,11 @@ They enable cross-cutting concerns like:
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Callable, Iterator, MutableSequence, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Any
+from itertools import islice
+from typing import TYPE_CHECKING, Any, overload
 
 if TYPE_CHECKING:
     from agenticflow.agent.base import Agent
@@ -43,6 +45,139 @@ class Phase(Enum):
     ON_ERROR = "on_error"
 
 
+class MessageLog:
+    """Shared, append-only cache of interceptor message dicts for a run.
+
+    The executor keeps one log per run over its live message list. Each
+    message is converted to a ``{"role", "content"}`` dict once, and every
+    interceptor phase gets a :class:`MessageView` window onto the cached
+    dicts instead of a fresh copy of the whole transcript.
+
+    Appends to the underlying list are picked up automatically. Any other
+    change (replacing, inserting or rebinding the list) must be reported
+    with :meth:`reset`.
+    """
+
+    def __init__(self, messages: list[Any]) -> None:
+        """Initialize log.
+
+        Args:
+            messages: Live message list (native message objects).
+        """
+        self._messages = messages
+        self._entries: list[dict[str, Any]] = []
+        self._totals: dict[Callable[[dict[str, Any]], int], list[int]] = {}
+
+    def reset(self, messages: list[Any] | None = None, start: int = 0) -> None:
+        """Drop cached entries after a non-append change.
+
+        Args:
+            messages: New message list, if the executor replaced it.
+            start: First index whose message may have changed.
+        """
+        if messages is not None:
+            self._messages = messages
+            start = 0
+        del self._entries[start:]
+        for prefix in self._totals.values():
+            del prefix[start + 1:]
+
+    def view(self) -> MessageView:
+        """Get a view of the messages as they are now."""
+        messages = self._messages
+        for msg in messages[len(self._entries):]:
+            self._entries.append({
+                "role": getattr(msg, "role", "unknown"),
+                "content": getattr(msg, "content", ""),
+            })
+        return MessageView(self, len(messages))
+
+    def total(self, measure: Callable[[dict[str, Any]], int], length: int) -> int:
+        """Sum ``measure`` over the first ``length`` entries (memoized)."""
+        prefix = self._totals.setdefault(measure, [0])
+        for entry in self._entries[len(prefix) - 1:length]:
+            prefix.append(prefix[-1] + measure(entry))
+        return prefix[length]
+
+
+class MessageView(MutableSequence[dict[str, Any]]):
+    """Copy-on-write view of the message history for one interceptor phase.
+
+    Reads are served from the run's shared :class:`MessageLog`, fixed at the
+    length the history had when the context was created. The first write
+    (``append``, item assignment, ...) copies the list so changes stay
+    local to this context, as with a plain list. Message dicts are shared
+    between phases and should be treated as read-only; return
+    ``InterceptResult.modify_messages(...)`` to change the history.
+    """
+
+    def __init__(self, log: MessageLog, length: int) -> None:
+        self._log = log
+        self._length = length
+        self._items: list[dict[str, Any]] | None = None
+
+    def _materialize(self) -> list[dict[str, Any]]:
+        if self._items is None:
+            self._items = self._log._entries[: self._length]
+        return self._items
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if self._items is not None:
+            return self._items[index]
+        if isinstance(index, slice):
+            entries = self._log._entries
+            return [entries[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("message index out of range")
+        return self._log._entries[index]
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self._materialize()[index] = value
+
+    def __delitem__(self, index: int | slice) -> None:
+        del self._materialize()[index]
+
+    def insert(self, index: int, value: dict[str, Any]) -> None:
+        """Insert a message (copies the view first)."""
+        self._materialize().insert(index, value)
+
+    def __len__(self) -> int:
+        return len(self._items) if self._items is not None else self._length
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        if self._items is not None:
+            return iter(self._items)
+        return islice(self._log._entries, self._length)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"MessageView({list(self)!r})"
+
+    def total(self, measure: Callable[[dict[str, Any]], int]) -> int:
+        """Sum ``measure`` over all messages, reusing per-message results.
+
+        Args:
+            measure: Per-message function; pass the same function object
+                every time so earlier results can be reused.
+
+        Returns:
+            Sum of ``measure`` over the view.
+        """
+        if self._items is not None:
+            return sum(map(measure, self._items))
+        return self._log.total(measure, self._length)
+
+
 @dataclass
 class InterceptContext:
     """Context passed to interceptors at each phase.
@@ -55,7 +190,7 @@ class InterceptContext:
         agent: The agent being executed.
         phase: Current execution phase.
         task: The original task/prompt.
-        messages: Current message history.
+        messages: Current message history (a MessageView during agent runs).
         state: Mutable shared state dict for interceptors.
         run_context: Invocation-scoped context (from agent.run()).
         tool_name: Name of tool (only in PRE_ACT/POST_ACT).
@@ -67,7 +202,7 @@ class InterceptContext:
     agent: Agent
     phase: Phase
     task: str
-    messages: list[dict[str, Any]]
+    messages: MutableSequence[dict[str, Any]]
     state: dict[str, Any] = field(default_factory=dict)
     run_context: RunContext | None = None
 
@@ -8,6 +8,7 @@ summarization and compression when approaching token limits.
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -15,6 +16,7 @@ from agenticflow.interceptors.base import (
     InterceptContext,
     Interceptor,
     InterceptResult,
+    MessageView,
 )
 
 
@@ -23,24 +25,48 @@ def _estimate_tokens(text: str) -> int:
     return len(text) // 4
 
 
+def _message_parts(msg: dict[str, Any]) -> list[str]:
+    """Get the text parts of a message used for token counting."""
+    parts = []
+    content = msg.get("content", "")
+    if isinstance(content, str):
+        parts.append(content)
+    elif isinstance(content, list):
+        # Handle content arrays (e.g., with images)
+        for item in content:
+            if isinstance(item, dict) and item.get("type") == "text":
+                parts.append(item.get("text", ""))
+            elif isinstance(item, str):
+                parts.append(item)
+    # Include tool calls in estimate
+    if "tool_calls" in msg:
+        parts.append(json.dumps(msg["tool_calls"]))
+    return parts
+
+
 def _messages_to_text(messages: list[dict[str, Any]]) -> str:
     """Convert messages to text for token counting."""
-    parts = []
-    for msg in messages:
-        content = msg.get("content", "")
-        if isinstance(content, str):
-            parts.append(content)
-        elif isinstance(content, list):
-            # Handle content arrays (e.g., with images)
-            for item in content:
-                if isinstance(item, dict) and item.get("type") == "text":
-                    parts.append(item.get("text", ""))
-                elif isinstance(item, str):
-                    parts.append(item)
-        # Include tool calls in estimate
-        if "tool_calls" in msg:
-            parts.append(json.dumps(msg["tool_calls"]))
-    return " ".join(parts)
+    return " ".join(part for msg in messages for part in _message_parts(msg))
+
+
+def _text_weight(msg: dict[str, Any]) -> int:
+    """Characters a message adds to _messages_to_text, plus one separator per part."""
+    parts = _message_parts(msg)
+    return sum(map(len, parts)) + len(parts)
+
+
+def _estimate_message_tokens(messages: Sequence[dict[str, Any]]) -> int:
+    """Estimate tokens of messages without joining them into one string.
+
+    Equal to ``_estimate_tokens(_messages_to_text(messages))``. On a
+    MessageView, per-message sizes are cached across phases so the cost
+    is proportional to the new messages only.
+    """
+    if isinstance(messages, MessageView):
+        weight = messages.total(_text_weight)
+    else:
+        weight = sum(map(_text_weight, messages))
+    return max(weight - 1, 0) // 4
 
 
 @dataclass
@@ -100,8 +126,7 @@ class ContextCompressor(Interceptor):
         messages = ctx.messages
 
         # Estimate current token count
-        text = _messages_to_text(messages)
-        tokens = _estimate_tokens(text)
+        tokens = _estimate_message_tokens(messages)
 
         # Track compression in state
         ctx.state.setdefault("context_compressor", {
@@ -266,8 +291,7 @@ class TokenLimiter(Interceptor):
 
     async def pre_think(self, ctx: InterceptContext) -> InterceptResult:
         """Check token count before model call."""
-        text = _messages_to_text(ctx.messages)
-        tokens = _estimate_tokens(text)
+        tokens = _estimate_message_tokens(ctx.messages)
 
         if tokens > self.max_tokens:
             return InterceptResult.stop(self.message)
@@ -62,6 +62,15 @@ class Store(Protocol):
     - SQLiteStore: Local file persistence
     - PostgresStore: Production database
     - RedisStore: Distributed cache
+
+    Stores may also implement message-log operations, which Memory uses
+    for conversation history so appends don't rewrite the whole list:
+
+    - log_append(key, items) -> None: Append items
+    - log_range(key, start=0, stop=None) -> list: Slice (Python semantics)
+    - log_trim(key, max_len) -> None: Keep only the newest max_len items
+
+    A log is deleted by ``delete(key)`` and listed/cleared like any key.
     """
 
     async def get(self, key: str) -> Any | None:
@@ -464,11 +473,34 @@ class Memory:
         Args:
             message: Message to add.
         """
-        messages_key = "_messages"
-        async with self._lock:
-            messages = await self.recall(messages_key, [])
-            messages.append(_message_to_dict(message))
-            await self.remember(messages_key, messages)
+        await self.add_messages([message])
+
+    async def add_messages(self, messages: list[Message]) -> None:
+        """Append messages to conversation history in one operation.
+
+        Args:
+            messages: Messages to add, oldest first.
+        """
+        if not messages:
+            return
+        start = time.perf_counter()
+        items = [_message_to_dict(m) for m in messages]
+        key = self._key(_MESSAGES_KEY)
+
+        if hasattr(self._store, "log_append"):
+            await self._store.log_append(key, items)
+        else:
+            # Fallback for stores without log operations: read-modify-write
+            async with self._lock:
+                existing = await self._store.get(key) or []
+                existing.extend(items)
+                await self._store.set(key, existing)
+
+        await self._emit("memory.write", {
+            "key": _MESSAGES_KEY,
+            "count": len(items),
+            "duration_ms": (time.perf_counter() - start) * 1000,
+        })
 
     async def get_messages(self, limit: int | None = None) -> list[Message]:
         """Get conversation history.
@@ -479,19 +511,42 @@ class Memory:
         Returns:
             List of messages, oldest first.
         """
-        messages_key = "_messages"
-        raw = await self.recall(messages_key, [])
+        started = time.perf_counter()
+        key = self._key(_MESSAGES_KEY)
+        start = -limit if limit else 0
 
-        messages = [_dict_to_message(m) for m in raw]
+        if hasattr(self._store, "log_range"):
+            raw = await self._store.log_range(key, start)
+        else:
+            raw = (await self._store.get(key) or [])[start:]
+
+        await self._emit("memory.read", {
+            "key": _MESSAGES_KEY,
+            "found": bool(raw),
+            "duration_ms": (time.perf_counter() - started) * 1000,
+        })
+        return [_dict_to_message(m) for m in raw]
+
+    async def trim_messages(self, max_messages: int) -> None:
+        """Keep only the newest ``max_messages`` messages.
+
+        Args:
+            max_messages: Number of recent messages to keep.
+        """
+        key = self._key(_MESSAGES_KEY)
 
-        if limit:
-            messages = messages[-limit:]
+        if hasattr(self._store, "log_trim"):
+            await self._store.log_trim(key, max_messages)
+            return
 
-        return messages
+        async with self._lock:
+            existing = await self._store.get(key) or []
+            if len(existing) > max_messages:
+                await self._store.set(key, existing[-max_messages:] if max_messages > 0 else [])
 
     async def clear_messages(self) -> None:
         """Clear conversation history."""
-        await self.forget("_messages")
+        await self.forget(_MESSAGES_KEY)
 
     # -------------------------------------------------------------------------
     # Thread-Aware Methods (Agent Integration)
@@ -552,8 +607,7 @@ class Memory:
             metadata: Optional metadata.
         """
         thread = self.thread(thread_id)
-        for msg in messages:
-            await thread.add_message(msg)
+        await thread.add_messages(messages)
         if metadata:
             await thread.merge("_metadata", metadata)
 
@@ -763,11 +817,33 @@ class InMemoryStore:
         for key, value in items.items():
             await self.set(key, value, ttl=ttl)
 
+    async def log_append(self, key: str, items: list[Any]) -> None:
+        """Append items to the log at key."""
+        log = await self.get(key)
+        if log is None:
+            log = []
+            self._data[key] = (log, None)
+        log.extend(items)
+
+    async def log_range(self, key: str, start: int = 0, stop: int | None = None) -> list[Any]:
+        """Get a slice of the log at key (Python slice semantics)."""
+        log = await self.get(key)
+        return list(log[start:stop]) if log else []
+
+    async def log_trim(self, key: str, max_len: int) -> None:
+        """Keep only the newest max_len items of the log at key."""
+        log = await self.get(key)
+        if log and len(log) > max_len:
+            del log[: len(log) - max(max_len, 0)]
+
 
 # =============================================================================
 # MESSAGE SERIALIZATION HELPERS
 # =============================================================================
 
+_MESSAGES_KEY = "_messages"
+
+
 
 def _message_to_dict(message: Message) -> dict[str, Any]:
     """Convert a Message to a serializable dict."""
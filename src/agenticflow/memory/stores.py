@@ -16,6 +16,11 @@ Batch operations (optional, for performance):
     - get_many(keys) -> dict[str, Any]
     - set_many(items, ttl=None)
     - delete_many(keys) -> int
+
+Message-log operations (optional, used for conversation history):
+    - log_append(key, items)
+    - log_range(key, start=0, stop=None) -> list[Any]
+    - log_trim(key, max_len)
 """
 
 from __future__ import annotations
@@ -104,7 +109,7 @@ class SQLAlchemyStore:
             if self._initialized:
                 return
 
-            from sqlalchemy import DateTime, Index, String, Text
+            from sqlalchemy import DateTime, Index, Integer, String, Text
             from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
             from sqlalchemy.orm import DeclarativeBase, mapped_column, sessionmaker
 
@@ -141,7 +146,17 @@ class SQLAlchemyStore:
                     Index(f"idx_{table_name}_expires", "expires_at", postgresql_where=expires_at.isnot(None)),
                 )
 
+            class LogEntry(Base):
+                __tablename__ = f"{table_name}_log"
+
+                id = mapped_column(Integer, primary_key=True, autoincrement=True)
+                key = mapped_column(String(512), nullable=False)
+                value = mapped_column(Text, nullable=False)
+
+                __table_args__ = (Index(f"idx_{table_name}_log_key", "key", "id"),)
+
             self._model = MemoryEntry
+            self._log_model = LogEntry
             self._base = Base
 
             # Create tables
@@ -287,13 +302,19 @@ class SQLAlchemyStore:
 
         await self._ensure_initialized()
 
-        from sqlalchemy import delete
+        from sqlalchemy import delete, select
 
         async with self._sessionmaker() as session:
             stmt = delete(self._model).where(self._model.key.in_(keys))
             result = await session.execute(stmt)
+            # Message logs: count each log key once
+            log_keys = await session.execute(
+                select(self._log_model.key).where(self._log_model.key.in_(keys)).distinct()
+            )
+            log_count = len(log_keys.fetchall())
+            await session.execute(delete(self._log_model).where(self._log_model.key.in_(keys)))
             await session.commit()
-            return result.rowcount
+            return result.rowcount + log_count
 
     async def keys(self, prefix: str = "") -> list[str]:
         """List keys matching prefix."""
@@ -316,7 +337,15 @@ class SQLAlchemyStore:
             )
 
             result = await session.execute(stmt)
-            return [row[0] for row in result.fetchall()]
+            keys = [row[0] for row in result.fetchall()]
+
+            log_stmt = select(self._log_model.key).distinct()
+            if prefix:
+                log_stmt = log_stmt.where(self._log_model.key.like(f"{prefix}%"))
+            log_result = await session.execute(log_stmt)
+            seen = set(keys)
+            keys.extend(row[0] for row in log_result.fetchall() if row[0] not in seen)
+            return keys
 
     async def clear(self, prefix: str = "") -> None:
         """Clear keys matching prefix."""
@@ -325,14 +354,91 @@ class SQLAlchemyStore:
         from sqlalchemy import delete
 
         async with self._sessionmaker() as session:
-            if prefix:
-                stmt = delete(self._model).where(self._model.key.like(f"{prefix}%"))
-            else:
-                stmt = delete(self._model)
+            for model in (self._model, self._log_model):
+                stmt = delete(model)
+                if prefix:
+                    stmt = stmt.where(model.key.like(f"{prefix}%"))
+                await session.execute(stmt)
+            await session.commit()
+
+    async def log_append(self, key: str, items: list[Any]) -> None:
+        """Append items to the log at key (one row each)."""
+        await self._ensure_initialized()
+
+        async with self._sessionmaker() as session:
+            await self._migrate_list(session, key)
+            session.add_all(self._log_model(key=key, value=json.dumps(item)) for item in items)
+            await session.commit()
+
+    async def log_range(self, key: str, start: int = 0, stop: int | None = None) -> list[Any]:
+        """Get a slice of the log at key (Python slice semantics)."""
+        await self._ensure_initialized()
 
+        from sqlalchemy import func, select
+
+        log = self._log_model
+        async with self._sessionmaker() as session:
+            if await self._migrate_list(session, key):
+                await session.commit()
+
+            if start < 0 and stop is None:
+                # Tail read: newest rows via the (key, id) index
+                stmt = select(log.value).where(log.key == key).order_by(log.id.desc()).limit(-start)
+                rows = (await session.execute(stmt)).fetchall()
+                return [json.loads(row[0]) for row in reversed(rows)]
+
+            if start < 0 or (stop is not None and stop < 0):
+                total = (await session.execute(
+                    select(func.count()).select_from(log).where(log.key == key)
+                )).scalar_one()
+                start, stop, _ = slice(start, stop).indices(total)
+
+            stmt = select(log.value).where(log.key == key).order_by(log.id).offset(start)
+            if stop is not None:
+                if stop <= start:
+                    return []
+                stmt = stmt.limit(stop - start)
+            rows = (await session.execute(stmt)).fetchall()
+            return [json.loads(row[0]) for row in rows]
+
+    async def log_trim(self, key: str, max_len: int) -> None:
+        """Keep only the newest max_len items of the log at key."""
+        await self._ensure_initialized()
+
+        from sqlalchemy import delete, select
+
+        log = self._log_model
+        async with self._sessionmaker() as session:
+            await self._migrate_list(session, key)
+            stmt = delete(log).where(log.key == key)
+            if max_len > 0:
+                cutoff = (await session.execute(
+                    select(log.id).where(log.key == key)
+                    .order_by(log.id.desc()).offset(max_len - 1).limit(1)
+                )).scalar_one_or_none()
+                if cutoff is None:
+                    await session.commit()
+                    return
+                stmt = stmt.where(log.id < cutoff)
             await session.execute(stmt)
             await session.commit()
 
+    async def _migrate_list(self, session: Any, key: str) -> bool:
+        """Move a list stored as a single value at key into the log table."""
+        from sqlalchemy import select
+
+        entry = (await session.execute(
+            select(self._model).where(self._model.key == key)
+        )).scalar_one_or_none()
+        if entry is None:
+            return False
+        value = json.loads(entry.value)
+        await session.delete(entry)
+        if isinstance(value, list):
+            session.add_all(self._log_model(key=key, value=json.dumps(item)) for item in value)
+        await session.flush()
+        return True
+
     async def cleanup_expired(self) -> int:
         """Remove expired entries. Returns count removed."""
         await self._ensure_initialized()
@@ -518,6 +624,49 @@ class RedisStore:
             if cursor == 0:
                 break
 
+    async def log_append(self, key: str, items: list[Any]) -> None:
+        """Append items to the log at key (RPUSH)."""
+        if not items:
+            return
+        serialized = [json.dumps(item) for item in items]
+        await self._log_op(key, lambda client, k: client.rpush(k, *serialized))
+
+    async def log_range(self, key: str, start: int = 0, stop: int | None = None) -> list[Any]:
+        """Get a slice of the log at key (LRANGE, Python slice semantics)."""
+        if stop == 0:
+            return []
+        # LRANGE's end index is inclusive
+        end = -1 if stop is None else stop - 1
+        values = await self._log_op(key, lambda client, k: client.lrange(k, start, end))
+        return [json.loads(v) for v in values]
+
+    async def log_trim(self, key: str, max_len: int) -> None:
+        """Keep only the newest max_len items of the log at key (LTRIM)."""
+        if max_len <= 0:
+            await self.delete(key)
+            return
+        await self._log_op(key, lambda client, k: client.ltrim(k, -max_len, -1))
+
+    async def _log_op(self, key: str, op: Any) -> Any:
+        """Run a list command, migrating a legacy JSON-string list on WRONGTYPE."""
+        from redis.exceptions import ResponseError
+
+        client = await self._ensure_client()
+        full_key = self._full_key(key)
+        try:
+            return await op(client, full_key)
+        except ResponseError as e:
+            if "WRONGTYPE" not in str(e):
+                raise
+
+        value = json.loads(await client.get(full_key))
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.delete(full_key)
+            if isinstance(value, list) and value:
+                pipe.rpush(full_key, *(json.dumps(item) for item in value))
+            await pipe.execute()
+        return await op(client, full_key)
+
     async def close(self) -> None:
         """Close Redis client."""
         if self._client:
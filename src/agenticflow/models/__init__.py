@@ -83,6 +83,13 @@ from agenticflow.models.base import (
     convert_messages,
     normalize_input,
 )
+
+# Embedding cache (wraps any embedding provider)
+from agenticflow.models.cache import (
+    CachedEmbedding,
+    EmbeddingCache,
+    EmbeddingCacheStats,
+)
 from agenticflow.models.cloudflare import CloudflareChat, CloudflareEmbedding
 from agenticflow.models.cohere import CohereChat, CohereEmbedding
 
@@ -92,6 +99,9 @@ from agenticflow.models.mock import MockChatModel, MockEmbedding
 # Default models (OpenAI)
 from agenticflow.models.openai import OpenAIChat, OpenAIEmbedding
 
+# Bounded-concurrency embedding scheduler
+from agenticflow.models.scheduler import EmbeddingScheduler
+
 # Aliases for convenience
 ChatModel = OpenAIChat
 EmbeddingModel = OpenAIEmbedding
@@ -358,6 +368,12 @@ __all__ = [
     # Mock models for testing
     "MockChatModel",
     "MockEmbedding",
+    # Embedding cache
+    "CachedEmbedding",
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
+    # Embedding scheduler
+    "EmbeddingScheduler",
     # Factory functions
     "create_chat",
     "create_embedding",
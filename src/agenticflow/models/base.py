@@ -11,11 +11,14 @@ from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 # Import AIMessage from core messages - single source of truth
 from agenticflow.core.messages import AIMessage
 
+if TYPE_CHECKING:
+    from agenticflow.models.scheduler import EmbeddingScheduler
+
 
 def normalize_input(messages: str | list[Any]) -> list[Any]:
     """Normalize various input types to a list of messages.
@@ -371,6 +374,13 @@ class BaseEmbedding(ABC):
     - Single and batch embedding
     - Sync and async support
     - Configurable dimensions
+    - Bounded-concurrency async batching via EmbeddingScheduler
+
+    Providers that implement `_aembed_batch` get scheduled `aembed` and
+    `astream_embed`: batches are packed by token count, at most
+    `max_concurrency` requests are in flight (shared when several
+    embedders use the same `scheduler`), and rate-limited batches are
+    retried with backoff.
     """
 
     model: str = ""
@@ -379,6 +389,8 @@ class BaseEmbedding(ABC):
     timeout: float = 60.0
     max_retries: int = 2
     batch_size: int = 100
+    max_concurrency: int = 4
+    scheduler: EmbeddingScheduler | None = field(default=None, repr=False)
 
     # Client state (lazy initialized)
     _client: Any = field(default=None, repr=False)
@@ -420,6 +432,44 @@ class BaseEmbedding(ABC):
         """
         ...
 
+    async def _aembed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed one provider request batch. Override to enable scheduling."""
+        raise NotImplementedError(f"{type(self).__name__} does not support scheduled batching")
+
+    def _get_scheduler(self) -> EmbeddingScheduler:
+        """Return the configured scheduler, creating a private one if needed."""
+        if self.scheduler is None:
+            from agenticflow.models.scheduler import EmbeddingScheduler
+
+            self.scheduler = EmbeddingScheduler(max_concurrency=self.max_concurrency)
+        return self.scheduler
+
+    async def _aembed_scheduled(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts through the scheduler using `_aembed_batch`."""
+        self._ensure_initialized()
+        return await self._get_scheduler().run(texts, self._aembed_batch, self.batch_size)
+
+    async def astream_embed(
+        self,
+        texts: list[str],
+    ) -> AsyncIterator[tuple[int, list[list[float]]]]:
+        """Stream embeddings batch by batch in input order.
+
+        Lets large ingests write vectors out as they arrive instead of
+        holding every result in memory.
+
+        Args:
+            texts: Texts to embed.
+
+        Yields:
+            (start index, vectors) for each batch.
+        """
+        self._ensure_initialized()
+        async for start, vectors in self._get_scheduler().stream(
+            texts, self._aembed_batch, self.batch_size
+        ):
+            yield start, vectors
+
     def embed_query(self, text: str) -> list[float]:
         """Embed a single query text.
 
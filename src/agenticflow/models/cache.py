@@ -0,0 +1,351 @@
+"""Content-addressed embedding cache.
+
+Wraps any BaseEmbedding so identical text is only embedded once per
+(model, dimensions) pair. Entries are keyed by the model name, the
+requested dimensions and the SHA-256 of the text, and live in an
+in-memory LRU tier with an optional on-disk SQLite tier that survives
+restarts.
+
+Only cache misses are sent to the provider, de-duplicated and batched
+in a single call, so re-ingesting a mostly unchanged corpus costs only
+the changed chunks.
+
+Example:
+    >>> from agenticflow.models import CachedEmbedding, EmbeddingCache, OpenAIEmbedding
+    >>> embedder = CachedEmbedding(
+    ...     embedding=OpenAIEmbedding(),
+    ...     cache=EmbeddingCache(max_size=50_000, path="embeddings.sqlite"),
+    ... )
+    >>> vectors = await embedder.aembed(["hello", "world"])
+    >>> embedder.stats.hit_rate
+    0.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from agenticflow.models.base import BaseEmbedding
+
+if TYPE_CHECKING:
+    from agenticflow.observability.metrics import MetricsCollector
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Hit/miss counters for an embedding cache.
+
+    Attributes:
+        hits: Texts served from the memory tier.
+        disk_hits: Texts served from the disk tier.
+        misses: Texts sent to the provider.
+        provider_calls: Number of provider batches issued.
+    """
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    provider_calls: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """Total number of texts looked up."""
+        return self.hits + self.disk_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache (0.0 if none)."""
+        lookups = self.lookups
+        return (self.hits + self.disk_hits) / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "provider_calls": self.provider_calls,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class EmbeddingCache:
+    """Two-tier embedding cache: in-memory LRU plus optional SQLite file.
+
+    Vectors on disk are stored as packed float32 blobs; the memory tier
+    keeps the exact lists returned by the provider. Disk hits are
+    promoted into the memory tier.
+
+    Example:
+        >>> cache = EmbeddingCache(max_size=10_000)
+        >>> cache = EmbeddingCache(path="cache/embeddings.sqlite")
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        path: str | Path | None = None,
+    ) -> None:
+        """Create an embedding cache.
+
+        Args:
+            max_size: Maximum entries kept in memory (LRU eviction).
+            path: Optional SQLite file for a persistent disk tier.
+        """
+        self.max_size = max_size
+        self.path = Path(path) if path else None
+        self._memory: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, dimensions: int | None, text: str) -> str:
+        """Build the content-addressed key for a text.
+
+        Args:
+            model: Embedding model name.
+            dimensions: Requested output dimensions (None for model default).
+            text: Text to embed.
+
+        Returns:
+            Key string of the form ``model:dimensions:sha256``.
+        """
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{model}:{dimensions or ''}:{digest}"
+
+    def get_many(
+        self,
+        keys: list[str],
+        stats: EmbeddingCacheStats | None = None,
+    ) -> dict[str, list[float]]:
+        """Look up several keys, memory tier first, then disk.
+
+        Args:
+            keys: Cache keys.
+            stats: Optional stats object to update with hits.
+
+        Returns:
+            Mapping of found keys to vectors.
+        """
+        found: dict[str, list[float]] = {}
+        missing: list[str] = []
+
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is None:
+                    missing.append(key)
+                    continue
+                self._memory.move_to_end(key)
+                found[key] = vector
+                if stats:
+                    stats.hits += 1
+
+        if missing and self._conn is not None:
+            from_disk = self._read_disk(missing)
+            if stats:
+                stats.disk_hits += len(from_disk)
+            found.update(from_disk)
+            self._put_memory(from_disk)
+
+        return found
+
+    def put_many(self, items: dict[str, list[float]]) -> None:
+        """Store vectors in both tiers.
+
+        Args:
+            items: Mapping of cache keys to vectors.
+        """
+        if not items:
+            return
+        self._put_memory(items)
+        if self._conn is not None:
+            rows = [(key, array("f", vector).tobytes()) for key, vector in items.items()]
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows
+                )
+                self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM embeddings")
+                self._conn.commit()
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def _put_memory(self, items: dict[str, list[float]]) -> None:
+        """Insert into the LRU tier, evicting the oldest entries."""
+        with self._lock:
+            for key, vector in items.items():
+                self._memory[key] = vector
+                self._memory.move_to_end(key)
+            while len(self._memory) > self.max_size:
+                self._memory.popitem(last=False)
+
+    def _read_disk(self, keys: list[str]) -> dict[str, list[float]]:
+        """Fetch vectors for keys from SQLite (chunked IN queries)."""
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            assert self._conn is not None
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for key, blob in self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    chunk,
+                ):
+                    found[key] = array("f", blob).tolist()
+        return found
+
+
+@dataclass
+class CachedEmbedding(BaseEmbedding):
+    """Embedding wrapper that serves repeated texts from an EmbeddingCache.
+
+    Works with any BaseEmbedding provider. Texts are looked up by
+    (model, dimensions, sha256(text)); only the distinct misses are
+    batched to the wrapped provider.
+
+    Attributes:
+        embedding: The wrapped embedding provider.
+        cache: Cache to use (default: in-memory LRU of 10k entries).
+        metrics: Optional MetricsCollector receiving hit/miss counters.
+
+    Example:
+        >>> embedder = CachedEmbedding(embedding=OpenAIEmbedding())
+        >>> store = VectorStore(embeddings=embedder)
+        >>> embedder.stats.to_dict()
+    """
+
+    embedding: BaseEmbedding | None = None
+    cache: EmbeddingCache = field(default_factory=EmbeddingCache)
+    metrics: MetricsCollector | None = field(default=None, repr=False)
+    stats: EmbeddingCacheStats = field(default_factory=EmbeddingCacheStats)
+
+    def __post_init__(self) -> None:
+        """Mirror model settings from the wrapped provider."""
+        if self.embedding is None:
+            raise ValueError("CachedEmbedding requires an 'embedding' to wrap")
+        self.model = self.model or self.embedding.model
+        self.dimensions = self.dimensions or self.embedding.dimensions
+        self.batch_size = self.embedding.batch_size
+
+    def _init_client(self) -> None:
+        """No client of its own; the wrapped provider initializes lazily."""
+        pass
+
+    @property
+    def dimension(self) -> int:
+        """Return the wrapped provider's embedding dimension."""
+        return self.embedding.dimension  # type: ignore[union-attr]
+
+    def _keys(self, texts: list[str]) -> list[str]:
+        return [self.cache.make_key(self.model, self.dimensions, t) for t in texts]
+
+    def _lookup(self, texts: list[str]) -> tuple[list[str], dict[str, list[float]], list[str]]:
+        """Return keys, cached vectors and the distinct texts still needed."""
+        keys = self._keys(texts)
+        found = self.cache.get_many(keys, self.stats)
+        pending: dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key not in found and key not in pending:
+                pending[key] = text
+        self.stats.misses += len(texts) - sum(1 for k in keys if k in found)
+        return keys, found, list(pending.values())
+
+    def _store(
+        self,
+        missing: list[str],
+        vectors: list[list[float]],
+        found: dict[str, list[float]],
+    ) -> None:
+        """Record provider results in the cache and in the lookup map."""
+        computed = dict(zip(self._keys(missing), vectors, strict=True))
+        self.cache.put_many(computed)
+        found.update(computed)
+        self.stats.provider_calls += 1
+
+    def _record_metrics(self, before: EmbeddingCacheStats) -> None:
+        """Forward counter deltas to the MetricsCollector, if any."""
+        if self.metrics is None:
+            return
+        labels = {"model": self.model}
+        hits = (self.stats.hits - before.hits) + (self.stats.disk_hits - before.disk_hits)
+        misses = self.stats.misses - before.misses
+        if hits:
+            self.metrics.counter("embedding_cache_hits").inc(hits, labels)
+        if misses:
+            self.metrics.counter("embedding_cache_misses").inc(misses, labels)
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts, calling the provider only for cache misses.
+
+        Args:
+            texts: List of texts to embed.
+
+        Returns:
+            List of embedding vectors in input order.
+        """
+        before = EmbeddingCacheStats(**vars(self.stats))
+        keys, found, missing = self._lookup(texts)
+        if missing:
+            self._store(missing, self.embedding.embed(missing), found)  # type: ignore[union-attr]
+        self._record_metrics(before)
+        return [found[key] for key in keys]
+
+    async def aembed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts asynchronously, calling the provider only for misses.
+
+        Disk-tier reads and writes run in a worker thread.
+
+        Args:
+            texts: List of texts to embed.
+
+        Returns:
+            List of embedding vectors in input order.
+        """
+        before = EmbeddingCacheStats(**vars(self.stats))
+        if self.cache.path:
+            keys, found, missing = await asyncio.to_thread(self._lookup, texts)
+        else:
+            keys, found, missing = self._lookup(texts)
+
+        if missing:
+            vectors = await self.embedding.aembed(missing)  # type: ignore[union-attr]
+            if self.cache.path:
+                await asyncio.to_thread(self._store, missing, vectors, found)
+            else:
+                self._store(missing, vectors, found)
+
+        self._record_metrics(before)
+        return [found[key] for key in keys]
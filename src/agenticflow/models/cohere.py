@@ -224,9 +224,12 @@ class CohereEmbedding(BaseEmbedding):
         return [list(vec) for vec in embeddings] if embeddings else []
 
     async def aembed(self, texts: list[str]) -> list[list[float]]:
-        """Embed texts asynchronously."""
-        self._ensure_initialized()
-        response = await self._async_client.embed(model=self.model, texts=texts, input_type="search_document")
+        """Embed texts asynchronously with bounded concurrency."""
+        return await self._aembed_scheduled(texts)
+
+    async def _aembed_batch(self, batch: list[str]) -> list[list[float]]:
+        """Embed one request batch."""
+        response = await self._async_client.embed(model=self.model, texts=batch, input_type="search_document")
         embeddings = getattr(response, "embeddings", None) or getattr(response, "data", None)
         return [list(vec) for vec in embeddings] if embeddings else []
 
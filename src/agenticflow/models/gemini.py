@@ -430,12 +430,14 @@ class GeminiEmbedding(BaseEmbedding):
         return []
 
     async def aembed(self, texts: list[str]) -> list[list[float]]:
-        """Embed texts asynchronously."""
-        self._ensure_initialized()
+        """Embed texts asynchronously with bounded concurrency."""
+        return await self._aembed_scheduled(texts)
 
+    async def _aembed_batch(self, batch: list[str]) -> list[list[float]]:
+        """Embed one request batch."""
         result = await self._client.aio.models.embed_content(
             model=self.model,
-            contents=texts,
+            contents=batch,
         )
         # Handle both single and multiple embeddings
         embeddings = result.embeddings
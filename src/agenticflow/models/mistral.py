@@ -364,22 +364,14 @@ class MistralEmbedding(BaseEmbedding):
         return all_embeddings
 
     async def aembed(self, texts: list[str]) -> list[list[float]]:
-        """Embed texts asynchronously."""
-        self._ensure_initialized()
-        import asyncio
-
-        async def embed_batch(batch: list[str]) -> list[list[float]]:
-            response = await self._async_client.embeddings.create(**self._build_request(batch))
-            sorted_data = sorted(response.data, key=lambda x: x.index)
-            return [d.embedding for d in sorted_data]
-
-        batches = [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
-        results = await asyncio.gather(*[embed_batch(b) for b in batches])
-
-        all_embeddings: list[list[float]] = []
-        for batch_result in results:
-            all_embeddings.extend(batch_result)
-        return all_embeddings
+        """Embed texts asynchronously with bounded concurrency."""
+        return await self._aembed_scheduled(texts)
+
+    async def _aembed_batch(self, batch: list[str]) -> list[list[float]]:
+        """Embed one request batch."""
+        response = await self._async_client.embeddings.create(**self._build_request(batch))
+        sorted_data = sorted(response.data, key=lambda x: x.index)
+        return [d.embedding for d in sorted_data]
 
     def _build_request(self, texts: list[str]) -> dict[str, Any]:
         """Build API request."""
@@ -0,0 +1,219 @@
+"""Bounded-concurrency scheduler for embedding requests.
+
+Embedding providers split large inputs into request batches. Firing every
+batch at once (``asyncio.gather``) trips provider rate limits and holds
+every pending request in memory. The EmbeddingScheduler instead:
+
+- packs texts into batches by estimated token count and item count,
+- caps the number of requests in flight (shareable across embedders),
+- retries rate-limited (HTTP 429) batches with exponential backoff,
+  honoring ``Retry-After`` when the provider sends it,
+- streams batch results back in input order with a bounded look-ahead.
+
+Example:
+    >>> from agenticflow.models.openai import OpenAIEmbedding
+    >>> from agenticflow.models.scheduler import EmbeddingScheduler
+    >>> scheduler = EmbeddingScheduler(max_concurrency=8, max_batch_tokens=200_000)
+    >>> embedder = OpenAIEmbedding(scheduler=scheduler)
+    >>> async for start, vectors in embedder.astream_embed(chunks):
+    ...     await store.add(ids[start:start + len(vectors)], vectors, docs[start:start + len(vectors)])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import weakref
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from dataclasses import dataclass, field
+
+EmbedBatchFn = Callable[[list[str]], Awaitable[list[list[float]]]]
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Return True if an exception looks like a provider rate limit (429).
+
+    Checks status codes exposed by the OpenAI, Cohere, Gemini and httpx
+    error types, then falls back to the exception name and message.
+    """
+    for status in (
+        getattr(exc, "status_code", None),
+        getattr(exc, "code", None),
+        getattr(getattr(exc, "response", None), "status_code", None),
+    ):
+        if status == 429:
+            return True
+
+    name = type(exc).__name__.lower()
+    if "ratelimit" in name or "toomanyrequests" in name:
+        return True
+
+    message = str(exc).lower()
+    return any(
+        pattern in message
+        for pattern in ("429", "rate limit", "too many requests", "resource_exhausted", "resource exhausted")
+    )
+
+
+def _retry_after(exc: BaseException) -> float | None:
+    """Read a Retry-After header (seconds) from a provider error, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        value = headers.get("retry-after")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class EmbeddingScheduler:
+    """Packs, throttles and retries embedding batches.
+
+    A single scheduler can be shared by several embedders so that the
+    ``max_concurrency`` cap applies to all of them together.
+
+    Attributes:
+        max_concurrency: Maximum provider requests in flight.
+        max_batch_items: Maximum texts per request (None: use embedder's batch_size).
+        max_batch_tokens: Maximum estimated tokens per request.
+        max_retries: Retries per batch on rate-limit errors.
+        base_delay: Initial backoff delay in seconds.
+        max_delay: Backoff delay cap in seconds, also applied to Retry-After.
+        token_counter: Function estimating tokens for a text.
+    """
+
+    max_concurrency: int = 4
+    max_batch_items: int | None = None
+    max_batch_tokens: int = 100_000
+    max_retries: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    token_counter: Callable[[str], int] = estimate_tokens
+
+    _semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = field(
+        default_factory=weakref.WeakKeyDictionary, init=False, repr=False
+    )
+
+    def pack(self, texts: list[str], max_items: int = 100) -> Iterator[tuple[int, list[str]]]:
+        """Split texts into request batches by token and item budget.
+
+        A single text larger than the token budget is sent on its own.
+
+        Args:
+            texts: Texts to embed.
+            max_items: Item cap used when ``max_batch_items`` is not set.
+
+        Yields:
+            (start index, batch) tuples in input order.
+        """
+        limit = self.max_batch_items or max_items
+        start = 0
+        batch: list[str] = []
+        tokens = 0
+
+        for i, text in enumerate(texts):
+            count = self.token_counter(text)
+            if batch and (len(batch) >= limit or tokens + count > self.max_batch_tokens):
+                yield start, batch
+                start, batch, tokens = i, [], 0
+            batch.append(text)
+            tokens += count
+
+        if batch:
+            yield start, batch
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Concurrency cap for the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def _run_batch(
+        self,
+        batch: list[str],
+        embed_batch: EmbedBatchFn,
+    ) -> list[list[float]]:
+        """Run one batch under the concurrency cap, retrying rate limits."""
+        attempt = 0
+        while True:
+            async with self._get_semaphore():
+                try:
+                    return await embed_batch(batch)
+                except Exception as exc:
+                    attempt += 1
+                    if attempt > self.max_retries or not is_rate_limit_error(exc):
+                        raise
+                    delay = _retry_after(exc)
+                    if delay is None:
+                        delay = min(self.base_delay * 2 ** (attempt - 1), self.max_delay)
+                        delay += delay * 0.25 * random.random()
+                    else:
+                        delay = min(delay, self.max_delay)
+            # Back off outside the semaphore so other batches can proceed
+            await asyncio.sleep(delay)
+
+    async def stream(
+        self,
+        texts: list[str],
+        embed_batch: EmbedBatchFn,
+        max_items: int = 100,
+    ) -> AsyncIterator[tuple[int, list[list[float]]]]:
+        """Embed texts batch by batch, yielding results in input order.
+
+        At most ``2 * max_concurrency`` batches are scheduled ahead of the
+        consumer, which bounds memory for very large inputs.
+
+        Args:
+            texts: Texts to embed.
+            embed_batch: Coroutine function embedding one batch.
+            max_items: Item cap used when ``max_batch_items`` is not set.
+
+        Yields:
+            (start index, vectors) for each batch, in input order.
+        """
+        window = max(1, self.max_concurrency * 2)
+        pending: deque[tuple[int, asyncio.Task[list[list[float]]]]] = deque()
+
+        try:
+            for start, batch in self.pack(texts, max_items):
+                pending.append((start, asyncio.create_task(self._run_batch(batch, embed_batch))))
+                if len(pending) >= window:
+                    head_start, task = pending.popleft()
+                    yield head_start, await task
+            while pending:
+                head_start, task = pending.popleft()
+                yield head_start, await task
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    async def run(
+        self,
+        texts: list[str],
+        embed_batch: EmbedBatchFn,
+        max_items: int = 100,
+    ) -> list[list[float]]:
+        """Embed all texts and return vectors in input order.
+
+        Args:
+            texts: Texts to embed.
+            embed_batch: Coroutine function embedding one batch.
+            max_items: Item cap used when ``max_batch_items`` is not set.
+
+        Returns:
+            List of embedding vectors.
+        """
+        results: list[list[float]] = []
+        async for _, vectors in self.stream(texts, embed_batch, max_items):
+            results.extend(vectors)
+        return results
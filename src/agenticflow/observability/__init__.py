@@ -48,6 +48,8 @@ from agenticflow.observability.metrics import (
     Gauge,
     Histogram,
     MetricsCollector,
+    PrometheusExporter,
+    QuantileSketch,
     Timer,
 )
 from agenticflow.observability.observer import (
@@ -144,6 +146,8 @@ __all__ = [
     "Gauge",
     "Histogram",
     "Timer",
+    "QuantileSketch",
+    "PrometheusExporter",
     # Logging
     "ObservabilityLogger",
     "LogLevel",
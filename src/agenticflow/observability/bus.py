@@ -11,7 +11,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import inspect
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Awaitable, Callable
 
 from agenticflow.observability.trace_record import Trace, TraceType
@@ -31,11 +31,14 @@ class TraceBus:
     - Type-specific subscriptions
     - Global subscriptions (for logging, metrics)
     - Sync and async handlers
-    - Event history with querying
+    - Event history with querying (bounded ring buffer)
     - WebSocket client broadcasting
+    - Optional background dispatch so slow handlers don't block publishers
 
     Attributes:
         max_history: Maximum events to keep in history
+        background: Dispatch handlers from a background task instead of
+            awaiting them inside ``publish``
 
     Example:
         ```python
@@ -58,23 +61,39 @@ class TraceBus:
             event_type=TraceType.TASK_COMPLETED,
             limit=10,
         )
+
+        # Keep slow handlers (websockets, formatting) off the hot path
+        bus = TraceBus(background=True)
+        await bus.publish(event)  # returns after recording the event
+        await bus.flush()  # wait until handlers have seen it
         ```
     """
 
-    def __init__(self, max_history: int = 10000) -> None:
+    def __init__(
+        self,
+        max_history: int = 10000,
+        background: bool = False,
+        max_queue: int = 0,
+    ) -> None:
         """
         Initialize the TraceBus.
 
         Args:
             max_history: Maximum number of events to keep in history
+            background: Dispatch handlers from a background task
+            max_queue: Maximum pending events in background mode
+                (0 = unbounded; when full, publish waits for the dispatcher)
         """
         self._handlers: dict[TraceType, list[TraceHandler]] = defaultdict(list)
         self._global_handlers: list[TraceHandler] = []
-        self._event_history: list[Trace] = []
+        self._event_history: deque[Trace] = deque(maxlen=max_history)
         self._websocket_clients: set = set()
-        self._lock = asyncio.Lock()
         self._max_history = max_history
         self._loop: asyncio.AbstractEventLoop | None = None  # Store loop reference
+        self._background = background
+        self._max_queue = max_queue
+        self._queue: asyncio.Queue[Trace] | None = None
+        self._dispatcher: asyncio.Task[None] | None = None
 
     def subscribe(self, event_type: TraceType, handler: TraceHandler) -> None:
         """
@@ -174,24 +193,60 @@ class TraceBus:
                 data={"event_name": event if event_type == TraceType.CUSTOM else None, **(data or {})},
             )
 
-        # Add to history
-        async with self._lock:
-            self._event_history.append(event)
-            # Trim history if needed
-            if len(self._event_history) > self._max_history:
-                self._event_history = self._event_history[-self._max_history:]
+        # Add to history (deque drops the oldest event once full)
+        self._event_history.append(event)
 
+        if self._background:
+            await self._enqueue(event)
+        else:
+            await self._dispatch(event)
+
+    async def _dispatch(self, event: Trace) -> None:
+        """Deliver an event to handlers and WebSocket clients."""
         # Call specific handlers
-        for handler in self._handlers[event.type]:
-            await self._call_handler(handler, event)
+        handlers = self._handlers.get(event.type)
+        if handlers:
+            for handler in list(handlers):
+                await self._call_handler(handler, event)
 
         # Call global handlers
-        for handler in self._global_handlers:
+        for handler in list(self._global_handlers):
             await self._call_handler(handler, event)
 
         # Broadcast to WebSocket clients
         await self._broadcast_to_websockets(event)
 
+    async def _enqueue(self, event: Trace) -> None:
+        """Queue an event for the background dispatcher, starting it if needed."""
+        if self._queue is None or self._dispatcher is None or self._dispatcher.done():
+            self._queue = asyncio.Queue(maxsize=self._max_queue)
+            self._dispatcher = asyncio.get_running_loop().create_task(self._run_dispatcher(self._queue))
+        await self._queue.put(event)
+
+    async def _run_dispatcher(self, queue: asyncio.Queue[Trace]) -> None:
+        """Background task draining the dispatch queue."""
+        while True:
+            event = await queue.get()
+            try:
+                await self._dispatch(event)
+            finally:
+                queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every queued event has been delivered (background mode)."""
+        if self._queue is not None and self._dispatcher is not None and not self._dispatcher.done():
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Deliver pending events and stop the background dispatcher."""
+        await self.flush()
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._dispatcher
+        self._dispatcher = None
+        self._queue = None
+
     def publish_sync(self, event: Trace | str, data: dict | None = None) -> None:
         """
         Publish an event synchronously (fire and forget).
@@ -330,6 +385,11 @@ class TraceBus:
         """
         events = self._event_history
 
+        if limit > 0 and not (event_type or correlation_id or source):
+            # Read only the tail of the ring buffer
+            n = min(limit, len(events))
+            return [events[-i] for i in range(n, 0, -1)]
+
         if event_type:
             events = [e for e in events if e.type == event_type]
 
@@ -339,7 +399,7 @@ class TraceBus:
         if source:
             events = [e for e in events if e.source == source]
 
-        return events[-limit:]
+        return list(events)[-limit:]
 
     def get_history_by_category(
         self,
@@ -382,6 +442,7 @@ class TraceBus:
         return {
             "history_size": len(self._event_history),
             "max_history": self._max_history,
+            "pending_dispatch": self._queue.qsize() if self._queue is not None else 0,
             "handler_count": sum(len(h) for h in self._handlers.values()),
             "global_handler_count": len(self._global_handlers),
             "websocket_clients": len(self._websocket_clients),
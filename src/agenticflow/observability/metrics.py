@@ -6,8 +6,11 @@ for tracking system performance and behavior.
 
 from __future__ import annotations
 
+import math
+import re
 import statistics
 import time
+from bisect import bisect_left
 from collections import defaultdict
 from contextlib import contextmanager
 from dataclasses import dataclass, field
@@ -175,12 +178,143 @@ class Gauge:
         return self._value
 
 
+class QuantileSketch:
+    """Mergeable quantile sketch with bounded relative error.
+
+    Values are counted in logarithmically sized buckets (DDSketch-style),
+    so memory depends on the value range rather than the number of
+    observations, and any quantile is reported within
+    ``relative_accuracy`` of the true value. Sketches built with the same
+    accuracy can be merged exactly, which makes them suitable for
+    combining distributions recorded by separate workers.
+
+    Example:
+        >>> sketch = QuantileSketch(relative_accuracy=0.01)
+        >>> for v in range(1, 1001):
+        ...     sketch.add(v)
+        >>> sketch.quantile(0.99)  # ~990, within 1%
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048) -> None:
+        """Initialize sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of reported quantiles.
+            max_bins: Bucket limit per sign; the lowest buckets are collapsed
+                together beyond it, trading accuracy on the smallest values
+                for a hard memory bound.
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: dict[int, int] = defaultdict(int)
+        self._negative: dict[int, int] = defaultdict(int)
+        self._zero_count = 0
+        self.count = 0
+
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add a value to the sketch.
+
+        Args:
+            value: Observed value.
+            count: Number of times the value was observed.
+        """
+        if value > 0:
+            self._positive[self._key(value)] += count
+            if len(self._positive) > self.max_bins:
+                self._collapse(self._positive)
+        elif value < 0:
+            self._negative[self._key(-value)] += count
+            if len(self._negative) > self.max_bins:
+                self._collapse(self._negative)
+        else:
+            self._zero_count += count
+        self.count += count
+
+    def _collapse(self, bins: dict[int, int]) -> None:
+        keys = sorted(bins)
+        excess = keys[: len(keys) - self.max_bins + 1]
+        target = keys[len(excess)]
+        for key in excess:
+            bins[target] += bins.pop(key)
+
+    def quantile(self, q: float) -> float | None:
+        """Get the value at quantile ``q``.
+
+        Args:
+            q: Quantile (0-1).
+
+        Returns:
+            Approximate value at the quantile, or None if empty.
+        """
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self._zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self._positive))
+
+    def merge(self, other: QuantileSketch) -> None:
+        """Merge another sketch into this one.
+
+        Args:
+            other: Sketch built with the same relative accuracy.
+
+        Raises:
+            ValueError: If the sketches use different accuracies.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, n in other._positive.items():
+            self._positive[key] += n
+        for key, n in other._negative.items():
+            self._negative[key] += n
+        if len(self._positive) > self.max_bins:
+            self._collapse(self._positive)
+        if len(self._negative) > self.max_bins:
+            self._collapse(self._negative)
+        self._zero_count += other._zero_count
+        self.count += other.count
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._positive.clear()
+        self._negative.clear()
+        self._zero_count = 0
+        self.count = 0
+
+
 class Histogram:
     """Distribution of values.
 
     Use for tracking distributions like response times,
     task durations, or message sizes.
 
+    By default every observation is kept so percentiles are exact. With
+    ``streaming=True`` the histogram runs in constant memory: count, sum,
+    min, max and variance are maintained incrementally and percentiles
+    come from a :class:`QuantileSketch`. Streaming histograms can be
+    merged across workers with :meth:`merge`.
+
     Example:
         >>> hist = Histogram("task_duration_ms", buckets=[10, 50, 100, 500])
         >>> hist.observe(45)
@@ -193,6 +327,9 @@ class Histogram:
         name: str,
         description: str = "",
         buckets: list[float] | None = None,
+        *,
+        streaming: bool = False,
+        relative_accuracy: float = 0.01,
     ) -> None:
         """Initialize histogram.
 
@@ -200,13 +337,26 @@ class Histogram:
             name: Metric name.
             description: Human-readable description.
             buckets: Bucket boundaries for distribution.
+            streaming: Keep a quantile sketch instead of every observation.
+            relative_accuracy: Percentile accuracy in streaming mode.
         """
         self.name = name
         self.description = description
         self.buckets = sorted(buckets or [10, 25, 50, 100, 250, 500, 1000])
+        self.streaming = streaming
         self._values: list[float] = []
+        self._sketch = QuantileSketch(relative_accuracy) if streaming else None
+        self._reset_state()
+
+    def _reset_state(self) -> None:
         self._bucket_counts: dict[float, int] = dict.fromkeys(self.buckets, 0)
         self._bucket_counts[float("inf")] = 0
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        self._mean = 0.0
+        self._m2 = 0.0
 
     def observe(self, value: float) -> None:
         """Record an observation.
@@ -214,45 +364,66 @@ class Histogram:
         Args:
             value: Observed value.
         """
-        self._values.append(value)
+        if self._sketch is not None:
+            self._sketch.add(value)
+        else:
+            self._values.append(value)
+
+        # Running moments (Welford) so stats don't rescan observations
+        self._count += 1
+        self._sum += value
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
 
         # Update bucket counts
-        for bucket in self.buckets:
-            if value <= bucket:
-                self._bucket_counts[bucket] += 1
-                return
-        self._bucket_counts[float("inf")] += 1
+        i = bisect_left(self.buckets, value)
+        self._bucket_counts[self.buckets[i] if i < len(self.buckets) else float("inf")] += 1
 
     @property
     def count(self) -> int:
         """Get total number of observations."""
-        return len(self._values)
+        return self._count
 
     @property
     def sum(self) -> float:
         """Get sum of all observations."""
-        return sum(self._values)
+        return self._sum
+
+    @property
+    def min(self) -> float | None:
+        """Get smallest observation."""
+        return self._min if self._count else None
+
+    @property
+    def max(self) -> float | None:
+        """Get largest observation."""
+        return self._max if self._count else None
 
     @property
     def mean(self) -> float | None:
         """Get mean of observations."""
-        if not self._values:
+        if not self._count:
             return None
-        return statistics.mean(self._values)
+        return self._mean
 
     @property
     def median(self) -> float | None:
         """Get median of observations."""
-        if not self._values:
+        if not self._count:
             return None
+        if self._sketch is not None:
+            return self.percentile(50)
         return statistics.median(self._values)
 
     @property
     def stddev(self) -> float | None:
         """Get standard deviation."""
-        if len(self._values) < 2:
+        if self._count < 2:
             return None
-        return statistics.stdev(self._values)
+        return math.sqrt(self._m2 / (self._count - 1))
 
     def percentile(self, p: float) -> float | None:
         """Get percentile value.
@@ -263,8 +434,15 @@ class Histogram:
         Returns:
             Value at percentile.
         """
-        if not self._values:
+        if not self._count:
             return None
+        if self._sketch is not None:
+            if p <= 0:
+                return self._min
+            if p >= 100:
+                return self._max
+            value = self._sketch.quantile(p / 100)
+            return min(max(value, self._min), self._max)
         sorted_values = sorted(self._values)
         k = (len(sorted_values) - 1) * (p / 100)
         f = int(k)
@@ -275,11 +453,47 @@ class Histogram:
         """Get bucket counts."""
         return self._bucket_counts.copy()
 
+    def merge(self, other: Histogram) -> None:
+        """Merge another histogram's observations into this one.
+
+        Args:
+            other: Histogram with the same bucket boundaries.
+
+        Raises:
+            ValueError: If buckets differ, or if merging a streaming
+                histogram into an exact one.
+        """
+        if other.buckets != self.buckets:
+            raise ValueError("Cannot merge histograms with different buckets")
+        if self._sketch is None:
+            if other._sketch is not None:
+                raise ValueError("Cannot merge a streaming histogram into an exact one")
+            self._values.extend(other._values)
+        elif other._sketch is not None:
+            self._sketch.merge(other._sketch)
+        else:
+            for value in other._values:
+                self._sketch.add(value)
+
+        if other._count:
+            # Chan et al. parallel combination of running moments
+            total = self._count + other._count
+            delta = other._mean - self._mean
+            self._m2 += other._m2 + delta * delta * self._count * other._count / total
+            self._mean += delta * other._count / total
+            self._count = total
+            self._sum += other._sum
+            self._min = min(self._min, other._min)
+            self._max = max(self._max, other._max)
+        for bucket, n in other._bucket_counts.items():
+            self._bucket_counts[bucket] += n
+
     def reset(self) -> None:
         """Reset histogram."""
         self._values.clear()
-        self._bucket_counts = dict.fromkeys(self.buckets, 0)
-        self._bucket_counts[float("inf")] = 0
+        if self._sketch is not None:
+            self._sketch.clear()
+        self._reset_state()
 
 
 class Timer:
@@ -297,6 +511,8 @@ class Timer:
         name: str,
         description: str = "",
         buckets: list[float] | None = None,
+        *,
+        streaming: bool = False,
     ) -> None:
         """Initialize timer.
 
@@ -304,12 +520,14 @@ class Timer:
             name: Metric name.
             description: Human-readable description.
             buckets: Histogram buckets in milliseconds.
+            streaming: Record durations in a constant-memory histogram.
         """
         self.name = name
         self.histogram = Histogram(
             f"{name}_ms",
             description,
             buckets or [1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000],
+            streaming=streaming,
         )
 
     @contextmanager
@@ -345,8 +563,14 @@ class MetricsCollector:
         >>> metrics.snapshot()
     """
 
-    def __init__(self) -> None:
-        """Initialize metrics collector."""
+    def __init__(self, streaming: bool = False) -> None:
+        """Initialize metrics collector.
+
+        Args:
+            streaming: Create histograms and timers in constant-memory
+                streaming mode by default.
+        """
+        self.streaming = streaming
         self._counters: dict[str, Counter] = {}
         self._gauges: dict[str, Gauge] = {}
         self._histograms: dict[str, Histogram] = {}
@@ -385,6 +609,7 @@ class MetricsCollector:
         name: str,
         description: str = "",
         buckets: list[float] | None = None,
+        streaming: bool | None = None,
     ) -> Histogram:
         """Get or create a histogram.
 
@@ -392,12 +617,18 @@ class MetricsCollector:
             name: Histogram name.
             description: Description.
             buckets: Bucket boundaries.
+            streaming: Override the collector's streaming default.
 
         Returns:
             Histogram instance.
         """
         if name not in self._histograms:
-            self._histograms[name] = Histogram(name, description, buckets)
+            self._histograms[name] = Histogram(
+                name,
+                description,
+                buckets,
+                streaming=self.streaming if streaming is None else streaming,
+            )
         return self._histograms[name]
 
     def timer(
@@ -405,6 +636,7 @@ class MetricsCollector:
         name: str,
         description: str = "",
         buckets: list[float] | None = None,
+        streaming: bool | None = None,
     ) -> Timer:
         """Get or create a timer.
 
@@ -412,12 +644,18 @@ class MetricsCollector:
             name: Timer name.
             description: Description.
             buckets: Histogram buckets.
+            streaming: Override the collector's streaming default.
 
         Returns:
             Timer instance.
         """
         if name not in self._timers:
-            self._timers[name] = Timer(name, description, buckets)
+            self._timers[name] = Timer(
+                name,
+                description,
+                buckets,
+                streaming=self.streaming if streaming is None else streaming,
+            )
         return self._timers[name]
 
     def snapshot(self) -> dict[str, Any]:
@@ -456,6 +694,51 @@ class MetricsCollector:
             "timestamp": now_utc().isoformat(),
         }
 
+    def export_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format.
+
+        Histograms and timers are exposed as Prometheus histograms
+        (cumulative ``_bucket``, ``_sum`` and ``_count`` series) plus a
+        ``<name>_quantile`` gauge family for p50/p90/p95/p99.
+
+        Returns:
+            Exposition text (``text/plain; version=0.0.4``).
+        """
+        lines: list[str] = []
+
+        def header(name: str, description: str, kind: str) -> None:
+            if description:
+                help_text = description.replace("\\", "\\\\").replace("\n", "\\n")
+                lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for kind, metrics in (("counter", self._counters), ("gauge", self._gauges)):
+            for metric in metrics.values():
+                name = _prometheus_name(metric.name)
+                header(name, metric.description, kind)
+                lines.append(f"{name} {_prometheus_value(metric.value)}")
+                for key, value in metric._labels_values.items():
+                    lines.append(f"{name}{_prometheus_labels(key)} {_prometheus_value(value)}")
+
+        histograms = [*self._histograms.values(), *(t.histogram for t in self._timers.values())]
+        for hist in histograms:
+            name = _prometheus_name(hist.name)
+            header(name, hist.description, "histogram")
+            cumulative = 0
+            for bucket, n in hist.get_buckets().items():
+                cumulative += n
+                le = _prometheus_value(bucket)
+                lines.append(f'{name}_bucket{{le="{le}"}} {cumulative}')
+            lines.append(f"{name}_sum {_prometheus_value(hist.sum)}")
+            lines.append(f"{name}_count {hist.count}")
+            if hist.count:
+                lines.append(f"# TYPE {name}_quantile gauge")
+                for q in _PROMETHEUS_QUANTILES:
+                    value = _prometheus_value(hist.percentile(q * 100))
+                    lines.append(f'{name}_quantile{{quantile="{q}"}} {value}')
+
+        return "\n".join(lines) + "\n" if lines else ""
+
     def reset_all(self) -> None:
         """Reset all metrics."""
         for c in self._counters.values():
@@ -463,3 +746,100 @@ class MetricsCollector:
         for h in self._histograms.values():
             h.reset()
         # Gauges typically aren't reset
+
+
+_PROMETHEUS_QUANTILES = (0.5, 0.9, 0.95, 0.99)
+_PROMETHEUS_INVALID = re.compile(r"[^a-zA-Z0-9_:]")
+
+
+def _prometheus_name(name: str) -> str:
+    name = _PROMETHEUS_INVALID.sub("_", name)
+    return f"_{name}" if name[:1].isdigit() else name
+
+
+def _prometheus_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _prometheus_labels(key: tuple[tuple[str, str], ...]) -> str:
+    pairs = []
+    for label, value in key:
+        escaped = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{_prometheus_name(label)}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class PrometheusExporter:
+    """Serve a collector's metrics over HTTP for Prometheus to scrape.
+
+    Example:
+        ```python
+        metrics = MetricsCollector(streaming=True)
+        exporter = PrometheusExporter(metrics, port=9100)
+        asyncio.create_task(exporter.start())
+
+        # Prometheus scrapes http://host:9100/metrics
+        ```
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(
+        self,
+        collector: MetricsCollector,
+        host: str = "0.0.0.0",
+        port: int = 9100,
+        path: str = "/metrics",
+    ) -> None:
+        """Initialize exporter.
+
+        Args:
+            collector: Metrics collector to expose.
+            host: Host to bind to.
+            port: Port to listen on.
+            path: URL path serving the exposition text.
+        """
+        self.collector = collector
+        self.host = host
+        self.port = port
+        self.path = path
+        self._server: Any = None
+
+    async def start(self) -> None:
+        """Start the HTTP server (runs until :meth:`stop` is called)."""
+        try:
+            import uvicorn
+            from starlette.applications import Starlette
+            from starlette.requests import Request
+            from starlette.responses import Response
+            from starlette.routing import Route
+        except ImportError as e:
+            raise ImportError(
+                "PrometheusExporter requires 'starlette' and 'uvicorn'. "
+                "Install with: uv add starlette uvicorn"
+            ) from e
+
+        async def handle_metrics(request: Request) -> Response:
+            return Response(self.collector.export_prometheus(), media_type=self.CONTENT_TYPE)
+
+        app = Starlette(routes=[Route(self.path, handle_metrics, methods=["GET"])])
+        config = uvicorn.Config(
+            app,
+            host=self.host,
+            port=self.port,
+            log_level="warning",
+            access_log=False,
+        )
+        self._server = uvicorn.Server(config)
+        await self._server.serve()
+
+    async def stop(self) -> None:
+        """Stop the HTTP server."""
+        if self._server:
+            self._server.should_exit = True
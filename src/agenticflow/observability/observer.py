@@ -74,8 +74,8 @@ from __future__ import annotations
 
 import json
 import sys
-from collections import defaultdict
-from collections.abc import Callable
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, IntEnum
@@ -252,6 +252,8 @@ CHANNEL_EVENTS: dict[Channel, set[TraceType]] = {
         TraceType.TOOL_CALLED,
         TraceType.TOOL_RESULT,
         TraceType.TOOL_ERROR,
+        TraceType.TOOL_CACHE_HIT,
+        TraceType.TOOL_CACHE_MISS,
     },
     Channel.MESSAGES: {
         TraceType.MESSAGE_SENT,
@@ -346,7 +348,116 @@ CHANNEL_EVENTS: dict[Channel, set[TraceType]] = {
 }
 
 
-@dataclass
+# Minimum level required to display each event type (first match wins);
+# anything not listed is TRACE-level.
+_LEVEL_EVENTS: list[tuple[ObservabilityLevel, set[TraceType]]] = [
+    # Result-level events
+    (ObservabilityLevel.RESULT, {TraceType.TASK_COMPLETED, TraceType.TASK_FAILED}),
+    # Progress-level events - these are the main milestones
+    (ObservabilityLevel.PROGRESS, {
+        TraceType.AGENT_INVOKED,
+        TraceType.AGENT_RESPONDED,
+        TraceType.AGENT_THINKING,  # Show thinking at progress level
+        TraceType.AGENT_REASONING,  # Show reasoning at progress level
+        TraceType.TASK_STARTED,
+        # User interaction events at progress level
+        TraceType.USER_INPUT,
+        TraceType.OUTPUT_GENERATED,
+        # Spawning events at progress - important milestones
+        TraceType.AGENT_SPAWNED,
+        TraceType.AGENT_SPAWN_COMPLETED,
+        TraceType.AGENT_SPAWN_FAILED,
+        # MCP server connection at progress level (important milestones)
+        TraceType.MCP_SERVER_CONNECTED,
+        TraceType.MCP_TOOLS_DISCOVERED,
+    }),
+    # Detailed-level events
+    (ObservabilityLevel.DETAILED, {
+        TraceType.TOOL_CALLED,
+        TraceType.TOOL_RESULT,
+        TraceType.TOOL_ERROR,
+        TraceType.AGENT_ACTING,
+        TraceType.TASK_RETRYING,
+        TraceType.AGENT_DESPAWNED,  # Cleanup at detailed level
+        # MCP tool calls at detailed level (same as regular tools)
+        TraceType.MCP_TOOL_CALLED,
+        TraceType.MCP_TOOL_RESULT,
+        TraceType.MCP_TOOL_ERROR,
+        # VectorStore operations at detailed level
+        TraceType.VECTORSTORE_ADD,
+        TraceType.VECTORSTORE_SEARCH,
+        TraceType.VECTORSTORE_DELETE,
+    }),
+    # LLM events - opt-in only (requires explicit LLM channel subscription)
+    # Show subtle presence at DEBUG, full details at TRACE
+    (ObservabilityLevel.DEBUG, {
+        TraceType.LLM_REQUEST,
+        TraceType.LLM_RESPONSE,
+        TraceType.LLM_TOOL_DECISION,
+    }),
+    # Debug-level events
+    (ObservabilityLevel.DEBUG, {
+        TraceType.AGENT_STATUS_CHANGED,
+        TraceType.MESSAGE_SENT,
+        TraceType.MESSAGE_RECEIVED,
+        TraceType.TOOL_CACHE_HIT,
+        TraceType.TOOL_CACHE_MISS,
+        # MCP connecting/disconnecting at debug level
+        TraceType.MCP_SERVER_CONNECTING,
+        TraceType.MCP_SERVER_DISCONNECTED,
+        TraceType.MCP_SERVER_ERROR,
+    }),
+    # Streaming events - DETAILED level (same as tool calls)
+    # STREAM_START/END at DETAILED, TOKEN_STREAMED at DEBUG for less noise
+    (ObservabilityLevel.DETAILED, {
+        TraceType.STREAM_START,
+        TraceType.STREAM_END,
+        TraceType.STREAM_TOOL_CALL,
+        TraceType.STREAM_ERROR,
+    }),
+    (ObservabilityLevel.DEBUG, {TraceType.TOKEN_STREAMED}),  # Individual tokens at debug level
+    # Reactive flow events - tiered visibility
+    # Core milestones at PROGRESS level
+    (ObservabilityLevel.PROGRESS, {
+        TraceType.REACTIVE_FLOW_STARTED,
+        TraceType.REACTIVE_FLOW_COMPLETED,
+        TraceType.REACTIVE_FLOW_FAILED,
+        TraceType.REACTIVE_AGENT_TRIGGERED,
+        TraceType.REACTIVE_AGENT_COMPLETED,
+        TraceType.REACTIVE_AGENT_FAILED,
+        TraceType.SKILL_ACTIVATED,  # Skill activation is a key milestone
+    }),
+    # Detailed reactive events
+    (ObservabilityLevel.DETAILED, {
+        TraceType.REACTIVE_EVENT_EMITTED,
+        TraceType.REACTIVE_EVENT_PROCESSED,
+        TraceType.REACTIVE_NO_MATCH,
+    }),
+    # Round info at DEBUG (verbose)
+    (ObservabilityLevel.DEBUG, {
+        TraceType.REACTIVE_ROUND_STARTED,
+        TraceType.REACTIVE_ROUND_COMPLETED,
+    }),
+]
+
+def _first_match_table(groups: Iterable[tuple[Any, set[TraceType]]]) -> dict[TraceType, Any]:
+    """Flatten ordered (value, event types) groups into a per-type lookup."""
+    table: dict[TraceType, Any] = {}
+    for value, event_types in groups:
+        for event_type in event_types:
+            table.setdefault(event_type, value)
+    return table
+
+
+# Precomputed per-type lookups so event handling is O(1) per event
+_EVENT_CHANNELS: dict[TraceType, Channel] = _first_match_table(
+    (channel, event_types) for channel, event_types in CHANNEL_EVENTS.items()
+)
+_EVENT_LEVELS: dict[TraceType, ObservabilityLevel] = _first_match_table(_LEVEL_EVENTS)
+_EVENT_METRIC_KEYS: dict[TraceType, str] = {t: f"events.{t.value}" for t in TraceType}
+
+
+@dataclass(slots=True)
 class ObservedEvent:
     """An event captured by the observer."""
 
@@ -395,6 +506,9 @@ class ObserverConfig:
     on_stream: Callable[[str, str, dict], None] | None = None  # agent, token/action, data
     on_error: Callable[[str, Exception | str], None] | None = None
 
+    # Retention
+    max_events: int | None = None  # Event history ring size (None = unbounded)
+
     # Filtering
     include_agents: set[str] | None = None  # None = all
     exclude_agents: set[str] | None = None
@@ -503,6 +617,8 @@ class Observer:
         exclude_agents: set[str] | list[str] | None = None,
         include_tools: set[str] | list[str] | None = None,
         exclude_tools: set[str] | list[str] | None = None,
+        # Retention
+        max_events: int | None = None,
     ) -> None:
         """
         Create a Observer.
@@ -537,6 +653,8 @@ class Observer:
             exclude_agents: Exclude these agents
             include_tools: Only these tools (None = all)
             exclude_tools: Exclude these tools
+            max_events: Keep only the most recent N events in history
+                (None = unbounded). Metrics still count every event.
         """
         # Resolve truncation: low-level overrides mid-level, default is 0 (no limit)
         base_limit = max_output if max_output is not None else 0
@@ -572,9 +690,11 @@ class Observer:
             exclude_agents=set(exclude_agents) if exclude_agents else None,
             include_tools=set(include_tools) if include_tools else None,
             exclude_tools=set(exclude_tools) if exclude_tools else None,
+            max_events=max_events,
         )
 
-        self._events: list[ObservedEvent] = []
+        self._events: deque[ObservedEvent] = deque(maxlen=max_events)
+        self._channel_counts: dict[str, int] = defaultdict(int)
         self._start_time: datetime | None = None
         self._metrics: dict[str, Any] = defaultdict(int)
         self._styler = Styler(OutputConfig(
@@ -590,9 +710,12 @@ class Observer:
         self._nodes: dict[str, dict] = {}  # node_id -> {name, type, status, ...}
         self._edges: list[tuple[str, str, str]] = []  # (from, to, label)
         self._current_agents: dict[str, str] = {}  # agent_name -> node_id
+        self._agent_order: dict[str, int] = {}  # node_id -> creation order
+        self._last_completed_agent: str | None = None  # latest-created completed node
 
         # Tool call tracking
         self._tool_calls: list[dict] = []
+        self._tool_index: dict[str, dict] = {}  # tool_id -> tool record
         self._current_tools: dict[str, dict] = {}  # tool_name -> trace info
 
         # Span tracking (for nested operations)
@@ -652,6 +775,17 @@ class Observer:
         """Create observer with no output."""
         return cls(level=ObservabilityLevel.OFF)
 
+    @classmethod
+    def production(cls, max_events: int = 10_000) -> Observer:
+        """
+        Create a low-overhead observer for running under load.
+
+        Nothing is printed, history is a bounded ring of the last
+        ``max_events`` events, and metrics, callbacks and the execution
+        graph are still maintained.
+        """
+        return cls(level=ObservabilityLevel.OFF, max_events=max_events)
+
     @classmethod
     def minimal(cls) -> Observer:
         """Create observer showing only results."""
@@ -877,14 +1011,7 @@ class Observer:
             return False, None
 
         # Find channel for this event
-        event_channel: Channel | None = None
-        for channel, event_types in CHANNEL_EVENTS.items():
-            if event.type in event_types:
-                event_channel = channel
-                break
-
-        if event_channel is None:
-            event_channel = Channel.SYSTEM
+        event_channel = _EVENT_CHANNELS.get(event.type, Channel.SYSTEM)
 
         # Check if channel is subscribed
         if Channel.ALL not in self.config.channels:
@@ -916,122 +1043,17 @@ class Observer:
 
     def _get_level_for_event(self, event: Trace) -> ObservabilityLevel:
         """Get minimum level required to see this event."""
-        # Result-level events
-        if event.type in {TraceType.TASK_COMPLETED, TraceType.TASK_FAILED}:
-            return ObservabilityLevel.RESULT
-
-        # Progress-level events - these are the main milestones
-        if event.type in {
-            TraceType.AGENT_INVOKED,
-            TraceType.AGENT_RESPONDED,
-            TraceType.AGENT_THINKING,  # Show thinking at progress level
-            TraceType.AGENT_REASONING,  # Show reasoning at progress level
-            TraceType.TASK_STARTED,
-            # User interaction events at progress level
-            TraceType.USER_INPUT,
-            TraceType.OUTPUT_GENERATED,
-            # Spawning events at progress - important milestones
-            TraceType.AGENT_SPAWNED,
-            TraceType.AGENT_SPAWN_COMPLETED,
-            TraceType.AGENT_SPAWN_FAILED,
-            # MCP server connection at progress level (important milestones)
-            TraceType.MCP_SERVER_CONNECTED,
-            TraceType.MCP_TOOLS_DISCOVERED,
-        }:
-            return ObservabilityLevel.PROGRESS
-
-        # Detailed-level events
-        if event.type in {
-            TraceType.TOOL_CALLED,
-            TraceType.TOOL_RESULT,
-            TraceType.TOOL_ERROR,
-            TraceType.AGENT_ACTING,
-            TraceType.TASK_RETRYING,
-            TraceType.AGENT_DESPAWNED,  # Cleanup at detailed level
-            # MCP tool calls at detailed level (same as regular tools)
-            TraceType.MCP_TOOL_CALLED,
-            TraceType.MCP_TOOL_RESULT,
-            TraceType.MCP_TOOL_ERROR,
-            # VectorStore operations at detailed level
-            TraceType.VECTORSTORE_ADD,
-            TraceType.VECTORSTORE_SEARCH,
-            TraceType.VECTORSTORE_DELETE,
-        }:
-            return ObservabilityLevel.DETAILED
-
-        # LLM events - opt-in only (requires explicit LLM channel subscription)
-        # Show subtle presence at DEBUG, full details at TRACE
-        if event.type in {
-            TraceType.LLM_REQUEST,
-            TraceType.LLM_RESPONSE,
-            TraceType.LLM_TOOL_DECISION,
-        }:
-            return ObservabilityLevel.DEBUG
-
-        # Debug-level events
-        if event.type in {
-            TraceType.AGENT_STATUS_CHANGED,
-            TraceType.MESSAGE_SENT,
-            TraceType.MESSAGE_RECEIVED,
-            # MCP connecting/disconnecting at debug level
-            TraceType.MCP_SERVER_CONNECTING,
-            TraceType.MCP_SERVER_DISCONNECTED,
-            TraceType.MCP_SERVER_ERROR,
-        }:
-            return ObservabilityLevel.DEBUG
-
-        # Streaming events - DETAILED level (same as tool calls)
-        # STREAM_START/END at DETAILED, TOKEN_STREAMED at DEBUG for less noise
-        if event.type in {
-            TraceType.STREAM_START,
-            TraceType.STREAM_END,
-            TraceType.STREAM_TOOL_CALL,
-            TraceType.STREAM_ERROR,
-        }:
-            return ObservabilityLevel.DETAILED
-
-        if event.type == TraceType.TOKEN_STREAMED:
-            return ObservabilityLevel.DEBUG  # Individual tokens at debug level
-
-        # Reactive flow events - tiered visibility
-        # Core milestones at PROGRESS level
-        if event.type in {
-            TraceType.REACTIVE_FLOW_STARTED,
-            TraceType.REACTIVE_FLOW_COMPLETED,
-            TraceType.REACTIVE_FLOW_FAILED,
-            TraceType.REACTIVE_AGENT_TRIGGERED,
-            TraceType.REACTIVE_AGENT_COMPLETED,
-            TraceType.REACTIVE_AGENT_FAILED,
-            TraceType.SKILL_ACTIVATED,  # Skill activation is a key milestone
-        }:
-            return ObservabilityLevel.PROGRESS
-
-        # Detailed reactive events
-        if event.type in {
-            TraceType.REACTIVE_EVENT_EMITTED,
-            TraceType.REACTIVE_EVENT_PROCESSED,
-            TraceType.REACTIVE_NO_MATCH,
-        }:
-            return ObservabilityLevel.DETAILED
-
-        # Round info at DEBUG (verbose)
-        if event.type in {
-            TraceType.REACTIVE_ROUND_STARTED,
-            TraceType.REACTIVE_ROUND_COMPLETED,
-        }:
-            return ObservabilityLevel.DEBUG
-
-        # Trace-level: everything else
-        return ObservabilityLevel.TRACE
+        return _EVENT_LEVELS.get(event.type, ObservabilityLevel.TRACE)
 
     def _handle_event(self, event: Trace) -> None:
         """Handle an incoming event."""
         # Always track metrics and call callbacks regardless of level
         self._metrics["total_events"] += 1
-        self._metrics[f"events.{event.type.value}"] += 1
+        self._metrics[_EVENT_METRIC_KEYS[event.type]] += 1
 
         # Determine channel for this event
         event_channel = self._get_channel_for_event(event)
+        self._channel_counts[event_channel.value] += 1
 
         # Store event (for metrics/history)
         observed = ObservedEvent(
@@ -1047,7 +1069,9 @@ class Observer:
         # Always call callbacks (they're opt-in)
         self._dispatch_callbacks(event, event_channel)
 
-        # Check if we should display this event
+        # Check if we should display this event (formatting is skipped otherwise)
+        if self.config.level == ObservabilityLevel.OFF:
+            return
         should_display, _ = self._should_observe(event)
         if not should_display:
             return
@@ -1062,10 +1086,7 @@ class Observer:
 
     def _get_channel_for_event(self, event: Trace) -> Channel:
         """Get the channel for an event."""
-        for channel, event_types in CHANNEL_EVENTS.items():
-            if event.type in event_types:
-                return channel
-        return Channel.SYSTEM
+        return _EVENT_CHANNELS.get(event.type, Channel.SYSTEM)
 
     def _dispatch_callbacks(self, event: Trace, channel: Channel | None) -> None:
         """Dispatch event to registered callbacks."""
@@ -2215,15 +2236,11 @@ class Observer:
                     "tools_called": [],
                 }
                 self._current_agents[agent_name] = node_id
+                self._agent_order[node_id] = len(self._agent_order)
 
                 # Add edge from previous completed agent
-                prev_completed = [
-                    n for n in self._nodes.values()
-                    if n["type"] == "agent" and n["status"] == "completed"
-                ]
-                if prev_completed:
-                    last = prev_completed[-1]
-                    self._edges.append((last["id"], node_id, "→"))
+                if self._last_completed_agent is not None:
+                    self._edges.append((self._last_completed_agent, node_id, "→"))
 
         elif event_type == TraceType.AGENT_RESPONDED:
             agent_name = data.get("agent_name", "unknown")
@@ -2233,6 +2250,10 @@ class Observer:
                     node = self._nodes[node_id]
                     node["status"] = "completed"
                     node["end_time"] = ts
+                    # Track the most recently *created* completed agent
+                    last = self._last_completed_agent
+                    if last is None or self._agent_order[node_id] > self._agent_order[last]:
+                        self._last_completed_agent = node_id
                     node["output"] = data.get("response_preview") or data.get("response", "")[:200]
                     if node["start_time"]:
                         delta = (ts - node["start_time"]).total_seconds() * 1000
@@ -2266,6 +2287,7 @@ class Observer:
                 "result": None,
             }
             self._tool_calls.append(tool_record)
+            self._tool_index[tool_id] = tool_record
             self._current_tools[tool_name] = tool_record
 
             # Link to current agent
@@ -2419,7 +2441,7 @@ class Observer:
         Returns:
             List of events (most recent last)
         """
-        result = self._events
+        result = list(self._events)
 
         if channel:
             result = [e for e in result if e.channel == channel]
@@ -2473,7 +2495,7 @@ class Observer:
                     # Show tools called (if detailed)
                     if detailed:
                         for tool_id in node.get("tools_called", []):
-                            tool = next((t for t in self._tool_calls if t["id"] == tool_id), None)
+                            tool = self._tool_index.get(tool_id)
                             if tool and tool.get("start_time"):
                                 t_dur = f" ({tool.get('duration_ms', 0):.0f}ms)" if "duration_ms" in tool else ""
                                 status = "✓" if tool["status"] == "completed" else "✗"
@@ -2526,11 +2548,8 @@ class Observer:
         if self._start_time:
             result["duration_seconds"] = (now_utc() - self._start_time).total_seconds()
 
-        # Count by channel
-        channel_counts: dict[str, int] = defaultdict(int)
-        for observed in self._events:
-            channel_counts[observed.channel.value] += 1
-        result["by_channel"] = dict(channel_counts)
+        # Count by channel (maintained incrementally in _handle_event)
+        result["by_channel"] = dict(self._channel_counts)
 
         return result
 
@@ -2885,6 +2904,7 @@ class Observer:
     def clear(self) -> None:
         """Clear all observed events, metrics, and trace data."""
         self._events.clear()
+        self._channel_counts.clear()
         self._metrics.clear()
         self._start_time = now_utc()
 
@@ -2893,7 +2913,10 @@ class Observer:
         self._nodes.clear()
         self._edges.clear()
         self._current_agents.clear()
+        self._agent_order.clear()
+        self._last_completed_agent = None
         self._tool_calls.clear()
+        self._tool_index.clear()
         self._current_tools.clear()
         self._spans.clear()
         self._span_stack.clear()
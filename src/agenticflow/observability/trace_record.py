@@ -80,6 +80,8 @@ class TraceType(Enum):
     TOOL_CALLED = "tool.called"
     TOOL_RESULT = "tool.result"
     TOOL_ERROR = "tool.error"
+    TOOL_CACHE_HIT = "tool.cache.hit"  # Result served from ToolCache
+    TOOL_CACHE_MISS = "tool.cache.miss"  # ToolCache miss, tool executed
 
     # Deferred tool events (async/event-driven completion)
     TOOL_DEFERRED = "tool.deferred"  # Tool returned DeferredResult
@@ -323,6 +323,30 @@ class BaseRetriever:
         """
         raise NotImplementedError("Subclasses must implement retrieve_with_scores")
 
+    async def retrieve_many_with_scores(
+        self,
+        queries: list[str],
+        k: int = 4,
+        filter: dict[str, Any] | None = None,
+    ) -> list[list[RetrievalResult]]:
+        """Retrieve documents with scores for several queries.
+
+        Default implementation runs `retrieve_with_scores` concurrently.
+        Subclasses backed by a vector store override this to embed and
+        search the whole batch at once.
+
+        Args:
+            queries: The search queries.
+            k: Number of documents to retrieve per query.
+            filter: Optional metadata filter.
+
+        Returns:
+            One list of RetrievalResult per query, in query order.
+        """
+        import asyncio
+        tasks = [self.retrieve_with_scores(q, k=k, filter=filter) for q in queries]
+        return list(await asyncio.gather(*tasks))
+
     async def abatch_retrieve(
         self,
         queries: list[str],
@@ -333,12 +357,42 @@ class BaseRetriever:
     ) -> list[list[Document]] | list[list[RetrievalResult]]:
         """Batch retrieve for multiple queries.
 
-        Default implementation calls retrieve for each query.
-        Subclasses can override for more efficient batch processing.
+        Delegates to `retrieve_many_with_scores`, emitting the usual
+        retrieval events for each query.
         """
-        import asyncio
-        tasks = [self.retrieve(q, k=k, filter=filter, include_scores=include_scores) for q in queries]
-        return await asyncio.gather(*tasks)
+        start = time.perf_counter()
+
+        for query in queries:
+            await self._emit("retrieval.start", {
+                "query": query[:100],
+                "k": k,
+                "filter": filter,
+            })
+
+        try:
+            batches = await self.retrieve_many_with_scores(queries, k=k, filter=filter)
+        except Exception as e:
+            for query in queries:
+                await self._emit("retrieval.error", {
+                    "query": query[:100],
+                    "error": str(e),
+                    "duration_ms": (time.perf_counter() - start) * 1000,
+                })
+            raise
+
+        duration_ms = (time.perf_counter() - start) * 1000
+        for query, results in zip(queries, batches, strict=True):
+            await self._emit("retrieval.complete", {
+                "query": query[:100],
+                "k": k,
+                "results_count": len(results),
+                "top_scores": [r.score for r in results[:3]],
+                "duration_ms": duration_ms,
+            })
+
+        if include_scores:
+            return batches
+        return [[r.document for r in results] for results in batches]
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name={self.name!r})"
@@ -12,7 +12,7 @@ from agenticflow.retriever.base import BaseRetriever, RetrievalResult
 
 if TYPE_CHECKING:
     from agenticflow.vectorstore import Document, VectorStore
-    from agenticflow.vectorstore.base import EmbeddingProvider
+    from agenticflow.vectorstore.base import EmbeddingProvider, SearchResult
 
 
 class DenseRetriever(BaseRetriever):
@@ -75,7 +75,29 @@ class DenseRetriever(BaseRetriever):
         """
         # Use vectorstore's search which returns SearchResult
         search_results = await self.vectorstore.search(query, k=k, filter=filter)
+        return self._to_results(search_results)
 
+    async def retrieve_many_with_scores(
+        self,
+        queries: list[str],
+        k: int = 4,
+        filter: dict[str, Any] | None = None,
+    ) -> list[list[RetrievalResult]]:
+        """Retrieve for several queries with one embedding call and batch search.
+
+        Args:
+            queries: The search queries (embedded together).
+            k: Number of documents to retrieve per query.
+            filter: Optional metadata filter.
+
+        Returns:
+            One list of RetrievalResult per query, in query order.
+        """
+        batches = await self.vectorstore.search_many(queries, k=k, filter=filter)
+        return [self._to_results(search_results) for search_results in batches]
+
+    def _to_results(self, search_results: list[SearchResult]) -> list[RetrievalResult]:
+        """Convert vector store hits to RetrievalResults, applying the threshold."""
         results = []
         for sr in search_results:
             # Apply score threshold if set
@@ -115,6 +115,54 @@ class EnsembleRetriever(BaseRetriever):
         ]
         all_results = await asyncio.gather(*tasks)
 
+        return self._fuse(list(all_results), k)
+
+    async def retrieve_many_with_scores(
+        self,
+        queries: list[str],
+        k: int = 4,
+        filter: dict[str, Any] | None = None,
+    ) -> list[list[RetrievalResult]]:
+        """Retrieve for several queries, batching each child retriever.
+
+        Each child receives the whole batch once (so dense children embed
+        all queries in one call), then results are fused per query.
+
+        Args:
+            queries: The search queries.
+            k: Number of documents to retrieve per query.
+            filter: Optional metadata filter.
+
+        Returns:
+            One list of fused RetrievalResult per query, in query order.
+        """
+        import asyncio
+
+        fetch_k = k * 2
+
+        async def _batch(retriever: Retriever) -> list[list[RetrievalResult]]:
+            if hasattr(retriever, "retrieve_many_with_scores"):
+                return await retriever.retrieve_many_with_scores(
+                    queries, k=fetch_k, filter=filter
+                )
+            return list(await asyncio.gather(*(
+                retriever.retrieve_with_scores(q, k=fetch_k, filter=filter)
+                for q in queries
+            )))
+
+        per_retriever = await asyncio.gather(*(_batch(r) for r in self._retrievers))
+
+        return [
+            self._fuse([batches[i] for batches in per_retriever], k)
+            for i in range(len(queries))
+        ]
+
+    def _fuse(
+        self,
+        all_results: list[list[RetrievalResult]],
+        k: int,
+    ) -> list[RetrievalResult]:
+        """Fuse one query's results from every child retriever."""
         # Optionally normalize scores for linear fusion
         if self._normalize and self._fusion == FusionStrategy.LINEAR:
             all_results = [normalize_scores(results) for results in all_results]
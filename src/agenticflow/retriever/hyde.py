@@ -147,24 +147,24 @@ class HyDERetriever(BaseRetriever):
             tasks = [self.generate_hypothetical(query) for _ in range(self.n_hypotheticals)]
             hypotheticals = await asyncio.gather(*tasks)
 
-        # Search with each hypothetical document
-        search_tasks = [
-            self.base_retriever.retrieve(
-                hypo, k=k, filter=filter, include_scores=True, **kwargs
-            )
-            for hypo in hypotheticals
-        ]
-
-        # Optionally include original query
+        # Search with each hypothetical document (and optionally the query)
+        search_queries = list(hypotheticals)
         if self.include_original_query:
-            search_tasks.append(
+            search_queries.append(query)
+
+        if kwargs:
+            all_results = await asyncio.gather(*(
                 self.base_retriever.retrieve(
-                    query, k=k, filter=filter, include_scores=True, **kwargs
+                    q, k=k, filter=filter, include_scores=True, **kwargs
                 )
+                for q in search_queries
+            ))
+        else:
+            # One batched call: dense retrievers embed all texts together
+            all_results = await self.base_retriever.retrieve_many_with_scores(
+                search_queries, k=k, filter=filter
             )
 
-        all_results = await asyncio.gather(*search_tasks)
-
         # If only one search, just return those results
         if len(all_results) == 1:
             results = all_results[0]
@@ -376,13 +376,19 @@ Category (one word):'''
             # Search all representations and fuse
             all_results: list[list[RetrievalResult]] = []
 
+            rep_filters: list[dict[str, Any] | None] = []
             for rep_type in self._representations:
                 rep_filter = {"representation": rep_type}
                 if filter:
                     rep_filter.update(filter)
+                rep_filters.append(rep_filter)
 
-                results = await self._vectorstore.search(query, k=k * 2, filter=rep_filter)
+            # Embed the query once and search every representation
+            batches = await self._vectorstore.search_many(
+                [query] * len(rep_filters), k=k * 2, filter=rep_filters
+            )
 
+            for rep_type, results in zip(self._representations, batches, strict=True):
                 rep_results = []
                 for r in results:
                     doc_id = r.document.metadata.get("doc_id")
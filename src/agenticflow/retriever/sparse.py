@@ -7,6 +7,7 @@ It's fast, interpretable, and works well for keyword-based queries.
 
 from __future__ import annotations
 
+import heapq
 import math
 import re
 from collections import Counter
@@ -21,7 +22,10 @@ from agenticflow.vectorstore import Document
 class BM25Index:
     """In-memory BM25 index for sparse retrieval.
 
-    Implements the Okapi BM25 ranking function.
+    Implements the Okapi BM25 ranking function over an inverted index:
+    each term maps to a postings dict of document position to term
+    frequency, so a query only touches the postings of its own terms.
+    Document frequencies and lengths are maintained incrementally.
 
     Attributes:
         k1: Term frequency saturation parameter (default: 1.5).
@@ -33,10 +37,9 @@ class BM25Index:
 
     # Internal state
     _documents: list[Document] = field(default_factory=list)
-    _doc_tokens: list[list[str]] = field(default_factory=list)
-    _doc_freqs: dict[str, int] = field(default_factory=dict)
-    _avg_doc_len: float = 0.0
-    _idf: dict[str, float] = field(default_factory=dict)
+    _doc_lens: list[int] = field(default_factory=list)
+    _postings: dict[str, dict[int, int]] = field(default_factory=dict)
+    _total_len: int = 0
 
     def _tokenize(self, text: str) -> list[str]:
         """Tokenize text into lowercase words.
@@ -49,33 +52,47 @@ class BM25Index:
         tokens = re.findall(r'\b\w+\b', text)
         return tokens
 
+    @property
+    def _avg_doc_len(self) -> float:
+        """Average document length in tokens."""
+        return self._total_len / len(self._doc_lens) if self._doc_lens else 0.0
+
+    def idf(self, term: str) -> float:
+        """Inverse document frequency of a term (0.0 if unseen).
+
+        Args:
+            term: Normalized term.
+
+        Returns:
+            Smoothed BM25 IDF value.
+        """
+        postings = self._postings.get(term)
+        if not postings:
+            return 0.0
+        df = len(postings)
+        # IDF with smoothing to avoid negative values
+        return math.log((len(self._documents) - df + 0.5) / (df + 0.5) + 1)
+
     def add_documents(self, documents: list[Document]) -> None:
         """Add documents to the index.
 
+        Only the postings of the new documents' terms are touched.
+
         Args:
             documents: Documents to index.
         """
         for doc in documents:
             tokens = self._tokenize(doc.text)
+            doc_idx = len(self._documents)
             self._documents.append(doc)
-            self._doc_tokens.append(tokens)
+            self._doc_lens.append(len(tokens))
+            self._total_len += len(tokens)
 
-            # Update document frequencies
-            seen = set()
-            for token in tokens:
-                if token not in seen:
-                    self._doc_freqs[token] = self._doc_freqs.get(token, 0) + 1
-                    seen.add(token)
-
-        # Recalculate average document length
-        total_len = sum(len(tokens) for tokens in self._doc_tokens)
-        self._avg_doc_len = total_len / len(self._doc_tokens) if self._doc_tokens else 0
-
-        # Recalculate IDF values
-        n = len(self._documents)
-        for term, df in self._doc_freqs.items():
-            # IDF with smoothing to avoid negative values
-            self._idf[term] = math.log((n - df + 0.5) / (df + 0.5) + 1)
+            for term, tf in Counter(tokens).items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                postings[doc_idx] = tf
 
     def search(
         self,
@@ -106,77 +123,45 @@ class BM25Index:
         else:
             raise ValueError("Either 'query' or 'keywords' must be provided")
 
-        scores: list[tuple[int, float]] = []
-
-        for idx, doc_tokens in enumerate(self._doc_tokens):
-            doc = self._documents[idx]
-
-            # Apply metadata filter
-            if filter:
-                match = all(
-                    doc.metadata.get(k) == v
-                    for k, v in filter.items()
-                )
-                if not match:
-                    continue
-
-            # Calculate BM25 score
-            score = self._score_document(query_tokens, doc_tokens)
-            if score > 0:
-                scores.append((idx, score))
-
-        # Sort by score descending
-        scores.sort(key=lambda x: x[1], reverse=True)
+        # Accumulate BM25 scores over the postings of the query terms only
+        k1 = self.k1
+        length_norm = self.k1 * self.b / self._avg_doc_len if self._avg_doc_len else 0.0
+        base_norm = self.k1 * (1 - self.b)
+        doc_lens = self._doc_lens
+        scores: dict[int, float] = {}
 
-        # Return top k
-        results = []
-        for idx, score in scores[:k]:
-            results.append((self._documents[idx], score))
-
-        return results
-
-    def _score_document(
-        self,
-        query_tokens: list[str],
-        doc_tokens: list[str],
-    ) -> float:
-        """Calculate BM25 score for a document.
-
-        Args:
-            query_tokens: Tokenized query.
-            doc_tokens: Tokenized document.
-
-        Returns:
-            BM25 score.
-        """
-        doc_len = len(doc_tokens)
-        doc_term_freqs = Counter(doc_tokens)
-
-        score = 0.0
-        for term in query_tokens:
-            if term not in self._idf:
+        for term, count in Counter(query_tokens).items():
+            postings = self._postings.get(term)
+            if not postings:
                 continue
+            weight = count * self.idf(term) * (k1 + 1)
+            for doc_idx, tf in postings.items():
+                denominator = tf + base_norm + length_norm * doc_lens[doc_idx]
+                scores[doc_idx] = scores.get(doc_idx, 0.0) + weight * tf / denominator
+
+        # Apply metadata filter to candidates only
+        if filter:
+            documents = self._documents
+            scores = {
+                idx: score
+                for idx, score in scores.items()
+                if all(documents[idx].metadata.get(key) == v for key, v in filter.items())
+            }
 
-            tf = doc_term_freqs.get(term, 0)
-            idf = self._idf[term]
-
-            # BM25 formula
-            numerator = tf * (self.k1 + 1)
-            denominator = tf + self.k1 * (
-                1 - self.b + self.b * (doc_len / self._avg_doc_len)
-            )
-
-            score += idf * (numerator / denominator)
+        # Keep top k in a heap (ties broken by insertion order)
+        top = heapq.nlargest(
+            k,
+            ((score, -idx) for idx, score in scores.items() if score > 0),
+        )
 
-        return score
+        return [(self._documents[-neg_idx], score) for score, neg_idx in top]
 
     def clear(self) -> None:
         """Clear the index."""
         self._documents = []
-        self._doc_tokens = []
-        self._doc_freqs = {}
-        self._avg_doc_len = 0.0
-        self._idf = {}
+        self._doc_lens = []
+        self._postings = {}
+        self._total_len = 0
 
     def __len__(self) -> int:
         return len(self._documents)
@@ -448,6 +433,13 @@ class TFIDFRetriever(BaseRetriever):
     TF-IDF (Term Frequency-Inverse Document Frequency) is a simpler
     alternative to BM25. Uses cosine similarity between TF-IDF vectors.
 
+    Term frequencies are stored as a CSR matrix (row pointers, term ids,
+    normalized counts). IDF weights and row norms are refit from global
+    document frequencies after each insert, so earlier vectors never go
+    stale, and a query is scored with a single sparse mat-vec (SciPy when
+    installed, otherwise NumPy). Without NumPy a pure-Python fallback
+    scores the same CSR rows.
+
     Note: For most use cases, BM25Retriever is recommended as it
     generally performs better.
     """
@@ -459,16 +451,38 @@ class TFIDFRetriever(BaseRetriever):
         documents: list[Document] | None = None,
         *,
         name: str | None = None,
+        use_matrix: bool | None = None,
     ) -> None:
         """Create a TF-IDF retriever.
 
         Args:
             documents: Initial documents to index.
             name: Optional custom name.
+            use_matrix: Score with NumPy/SciPy sparse matrices
+                (default: when NumPy is installed).
         """
         self._documents: list[Document] = []
-        self._doc_vectors: list[dict[str, float]] = []
-        self._idf: dict[str, float] = {}
+
+        # CSR storage of normalized term frequencies
+        self._vocab: dict[str, int] = {}
+        self._doc_freqs: list[int] = []
+        self._indptr: list[int] = [0]
+        self._indices: list[int] = []
+        self._tfs: list[float] = []
+
+        # Derived state, refit lazily after inserts
+        self._idf: list[float] = []
+        self._row_norms: list[float] = []
+        self._matrix: Any = None
+        self._dirty = False
+
+        if use_matrix is None:
+            try:
+                import numpy  # noqa: F401
+                use_matrix = True
+            except ImportError:
+                use_matrix = False
+        self._use_matrix = use_matrix
 
         if name:
             self._name = name
@@ -482,36 +496,114 @@ class TFIDFRetriever(BaseRetriever):
 
     def add_documents(self, documents: list[Document]) -> None:
         """Add documents to the index."""
-        # First pass: count document frequencies
-        doc_freqs: dict[str, int] = {}
-        all_tokens: list[list[str]] = []
-
         for doc in documents:
             tokens = self._tokenize(doc.text)
-            all_tokens.append(tokens)
-            seen = set(tokens)
-            for token in seen:
-                doc_freqs[token] = doc_freqs.get(token, 0) + 1
-
-        # Calculate IDF
-        n = len(documents) + len(self._documents)
-        for term, df in doc_freqs.items():
-            self._idf[term] = math.log(n / (df + 1)) + 1
-
-        # Second pass: create TF-IDF vectors
-        for doc, tokens in zip(documents, all_tokens, strict=False):
-            term_freqs = Counter(tokens)
             doc_len = len(tokens)
 
-            # TF-IDF vector
-            vector: dict[str, float] = {}
-            for term, tf in term_freqs.items():
-                tfidf = (tf / doc_len) * self._idf.get(term, 0)
-                if tfidf > 0:
-                    vector[term] = tfidf
+            for term, tf in Counter(tokens).items():
+                term_id = self._vocab.get(term)
+                if term_id is None:
+                    term_id = self._vocab[term] = len(self._vocab)
+                    self._doc_freqs.append(0)
+                self._doc_freqs[term_id] += 1
+                self._indices.append(term_id)
+                self._tfs.append(tf / doc_len)
 
+            self._indptr.append(len(self._indices))
             self._documents.append(doc)
-            self._doc_vectors.append(vector)
+
+        if documents:
+            self._dirty = True
+
+    def _refit(self) -> None:
+        """Recompute IDF weights, the weighted matrix and cached row norms."""
+        n = len(self._documents)
+        self._idf = [math.log(n / (df + 1)) + 1 for df in self._doc_freqs]
+
+        if self._use_matrix:
+            import numpy as np
+
+            idf = np.asarray(self._idf, dtype=np.float64)
+            indptr = np.asarray(self._indptr, dtype=np.int64)
+            indices = np.asarray(self._indices, dtype=np.int64)
+            data = np.asarray(self._tfs, dtype=np.float64) * idf[indices]
+            rows = np.repeat(np.arange(n), np.diff(indptr))
+            self._row_norms = np.sqrt(np.bincount(rows, weights=data * data, minlength=n))
+
+            try:
+                from scipy.sparse import csr_matrix
+
+                self._matrix = csr_matrix(
+                    (data, indices, indptr), shape=(n, len(self._vocab))
+                )
+            except ImportError:
+                self._matrix = (rows, indices, data)
+        else:
+            norms = []
+            for row in range(n):
+                sq = 0.0
+                for pos in range(self._indptr[row], self._indptr[row + 1]):
+                    w = self._tfs[pos] * self._idf[self._indices[pos]]
+                    sq += w * w
+                norms.append(math.sqrt(sq))
+            self._row_norms = norms
+
+        self._dirty = False
+
+    def _query_vector(self, query: str) -> dict[int, float]:
+        """Build a sparse TF-IDF vector (term id -> weight) for a query."""
+        tokens = self._tokenize(query)
+        query_len = len(tokens)
+
+        query_vector: dict[int, float] = {}
+        for term, tf in Counter(tokens).items():
+            term_id = self._vocab.get(term)
+            if term_id is None:
+                continue
+            tfidf = (tf / query_len) * self._idf[term_id]
+            if tfidf > 0:
+                query_vector[term_id] = tfidf
+        return query_vector
+
+    def _score_matrix(self, query_vector: dict[int, float]) -> list[tuple[int, float]]:
+        """Cosine scores via one sparse mat-vec; returns positive (row, score)."""
+        import numpy as np
+
+        q = np.zeros(len(self._vocab), dtype=np.float64)
+        q[list(query_vector)] = list(query_vector.values())
+        q_norm = float(np.sqrt(q @ q))
+
+        if isinstance(self._matrix, tuple):
+            rows, indices, data = self._matrix
+            dots = np.bincount(
+                rows, weights=data * q[indices], minlength=len(self._documents)
+            )
+        else:
+            dots = self._matrix @ q
+
+        norms = self._row_norms
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(norms > 0, dots / (norms * q_norm), 0.0)
+        candidates = np.flatnonzero(scores > 0)
+        return list(zip(candidates.tolist(), scores[candidates].tolist(), strict=True))
+
+    def _score_python(self, query_vector: dict[int, float]) -> list[tuple[int, float]]:
+        """Pure-Python cosine scores over the CSR rows."""
+        q_norm = math.sqrt(sum(v * v for v in query_vector.values()))
+        scores: list[tuple[int, float]] = []
+
+        for row, norm in enumerate(self._row_norms):
+            if norm == 0:
+                continue
+            dot = 0.0
+            for pos in range(self._indptr[row], self._indptr[row + 1]):
+                weight = query_vector.get(self._indices[pos])
+                if weight is not None:
+                    dot += weight * self._tfs[pos] * self._idf[self._indices[pos]]
+            if dot > 0:
+                scores.append((row, dot / (norm * q_norm)))
+
+        return scores
 
     async def retrieve_with_scores(
         self,
@@ -523,39 +615,31 @@ class TFIDFRetriever(BaseRetriever):
         if not self._documents:
             return []
 
-        # Create query vector
-        tokens = self._tokenize(query)
-        term_freqs = Counter(tokens)
-        query_len = len(tokens)
+        if self._dirty:
+            self._refit()
 
-        query_vector: dict[str, float] = {}
-        for term, tf in term_freqs.items():
-            tfidf = (tf / query_len) * self._idf.get(term, 0)
-            if tfidf > 0:
-                query_vector[term] = tfidf
-
-        # Calculate cosine similarity with each document
-        scores: list[tuple[int, float]] = []
-
-        for idx, doc_vector in enumerate(self._doc_vectors):
-            doc = self._documents[idx]
+        query_vector = self._query_vector(query)
+        if not query_vector:
+            return []
 
-            # Apply filter
-            if filter:
-                match = all(doc.metadata.get(k) == v for k, v in filter.items())
-                if not match:
-                    continue
+        if self._use_matrix:
+            scores = self._score_matrix(query_vector)
+        else:
+            scores = self._score_python(query_vector)
 
-            # Cosine similarity
-            score = self._cosine_similarity(query_vector, doc_vector)
-            if score > 0:
-                scores.append((idx, score))
+        # Apply filter to scored candidates only
+        if filter:
+            scores = [
+                (idx, score)
+                for idx, score in scores
+                if all(self._documents[idx].metadata.get(key) == v for key, v in filter.items())
+            ]
 
-        # Sort and return top k
-        scores.sort(key=lambda x: x[1], reverse=True)
+        # Top k (ties broken by insertion order)
+        top = heapq.nlargest(k, scores, key=lambda x: (x[1], -x[0]))
 
         results = []
-        for idx, score in scores[:k]:
+        for idx, score in top:
             results.append(
                 RetrievalResult(
                     document=self._documents[idx],
@@ -566,21 +650,3 @@ class TFIDFRetriever(BaseRetriever):
             )
 
         return results
-
-    def _cosine_similarity(
-        self,
-        vec1: dict[str, float],
-        vec2: dict[str, float],
-    ) -> float:
-        """Calculate cosine similarity between two sparse vectors."""
-        # Dot product
-        dot = sum(vec1.get(k, 0) * vec2.get(k, 0) for k in vec1)
-
-        # Magnitudes
-        mag1 = math.sqrt(sum(v * v for v in vec1.values()))
-        mag2 = math.sqrt(sum(v * v for v in vec2.values()))
-
-        if mag1 == 0 or mag2 == 0:
-            return 0.0
-
-        return dot / (mag1 * mag2)
@@ -5,6 +5,8 @@ TaskManager - manages tasks with hierarchy and dependency support.
 from __future__ import annotations
 
 import asyncio
+import heapq
+from itertools import count
 from typing import TYPE_CHECKING, Any
 
 from agenticflow.core.enums import Priority, TaskStatus
@@ -27,6 +29,14 @@ class TaskManager:
     - Emitting lifecycle events
     - Aggregating subtask results
 
+    Readiness is tracked incrementally: each task keeps a count of unmet
+    dependencies, completing a task decrements the counts of its
+    dependents, and tasks whose count reaches zero go on a priority heap.
+    Polling for ready work therefore doesn't scan the task table. Status,
+    assignment and dependency changes must go through the manager
+    (``update_status``, ``assign_task``, ``add_dependency``, ...) to be
+    reflected in the indexes.
+
     Attributes:
         event_bus: TraceBus for publishing events
         tasks: Dictionary of all managed tasks
@@ -60,6 +70,85 @@ class TaskManager:
         self.event_bus = event_bus
         self.tasks: dict[str, Task] = {}
         self._lock = asyncio.Lock()
+        self._reset_indexes()
+
+    def _reset_indexes(self) -> None:
+        """Create empty scheduling indexes."""
+        # Creation order, used to break priority ties
+        self._seq = count()
+        self._order: dict[str, int] = {}
+        # dependency ID -> IDs of tasks waiting on it (the dependency may
+        # not exist yet)
+        self._dependents: dict[str, set[str]] = {}
+        # task ID -> number of its dependencies not yet completed
+        self._unmet: dict[str, int] = {}
+        # Heap of (-priority, order, task_id); entries no longer in
+        # _ready are stale and skipped lazily
+        self._ready_heap: list[tuple[int, int, str]] = []
+        self._ready: dict[str, tuple[int, int, str]] = {}
+        # Secondary indexes, plus the status/agent each task is filed under
+        self._by_status: dict[TaskStatus, set[str]] = {}
+        self._by_agent: dict[str, set[str]] = {}
+        self._indexed: dict[str, tuple[TaskStatus, str | None]] = {}
+
+    def _add_to_graph(self, task: Task) -> None:
+        """Record a task's dependency edges and unmet-dependency count."""
+        self._order[task.id] = next(self._seq)
+        deps = set(task.depends_on)
+        for dep_id in deps:
+            self._dependents.setdefault(dep_id, set()).add(task.id)
+        self._unmet[task.id] = sum(
+            1 for dep_id in deps
+            if dep_id not in self.tasks or self.tasks[dep_id].status != TaskStatus.COMPLETED
+        )
+
+    def _reindex(self, task: Task) -> None:
+        """Bring the indexes in line with a task's current status and agent."""
+        if task.id not in self._order:
+            self._add_to_graph(task)
+        old_status, old_agent = self._indexed.get(task.id, (None, None))
+        status, agent = task.status, task.assigned_agent_id
+        self._indexed[task.id] = (status, agent)
+
+        if status != old_status:
+            if old_status is not None:
+                self._by_status[old_status].discard(task.id)
+            self._by_status.setdefault(status, set()).add(task.id)
+
+            # Completing (or un-completing) a task changes its dependents
+            was_done = old_status == TaskStatus.COMPLETED
+            if was_done != (status == TaskStatus.COMPLETED):
+                delta = 1 if was_done else -1
+                for dependent_id in self._dependents.get(task.id, ()):
+                    self._unmet[dependent_id] += delta
+                    self._update_ready(self.tasks[dependent_id])
+
+        if agent != old_agent:
+            if old_agent is not None:
+                self._by_agent[old_agent].discard(task.id)
+            if agent is not None:
+                self._by_agent.setdefault(agent, set()).add(task.id)
+
+        self._update_ready(task)
+
+    def _update_ready(self, task: Task) -> None:
+        """Add a task to, or drop it from, the ready heap."""
+        if task.status == TaskStatus.PENDING and self._unmet[task.id] == 0:
+            if task.id not in self._ready:
+                entry = (-task.priority.value, self._order[task.id], task.id)
+                self._ready[task.id] = entry
+                heapq.heappush(self._ready_heap, entry)
+        elif (
+            self._ready.pop(task.id, None) is not None
+            and len(self._ready_heap) > 2 * len(self._ready) + 64
+        ):
+            # Rebuild once stale entries dominate the heap
+            self._ready_heap = list(self._ready.values())
+            heapq.heapify(self._ready_heap)
+
+    def _sorted_by_creation(self, task_ids: set[str]) -> list[Task]:
+        """Resolve task IDs, oldest first."""
+        return [self.tasks[i] for i in sorted(task_ids, key=self._order.__getitem__)]
 
     async def create_task(
         self,
@@ -107,6 +196,7 @@ class TaskManager:
 
         async with self._lock:
             self.tasks[task.id] = task
+            self._reindex(task)
 
             # Link to parent if specified
             if parent_id and parent_id in self.tasks:
@@ -208,6 +298,8 @@ class TaskManager:
             else:
                 task.status = status
 
+            self._reindex(task)
+
         # Map status to event type
         event_map = {
             TaskStatus.SCHEDULED: TraceType.TASK_SCHEDULED,
@@ -235,6 +327,43 @@ class TaskManager:
 
         return task
 
+    async def add_dependency(self, task_id: str, dependency_id: str) -> Task:
+        """
+        Make a task wait for another task to complete.
+
+        Use this instead of ``Task.add_dependency`` for managed tasks so
+        the ready queue stays in sync.
+
+        Args:
+            task_id: ID of the dependent task
+            dependency_id: ID of the task that must complete first
+
+        Returns:
+            The updated Task
+
+        Raises:
+            ValueError: If the dependent task doesn't exist
+        """
+        async with self._lock:
+            task = self.tasks.get(task_id)
+            if not task:
+                raise ValueError(f"Task {task_id} not found")
+
+            task.add_dependency(dependency_id)
+            if task.id not in self._order:
+                self._reindex(task)
+                return task
+
+            dependents = self._dependents.setdefault(dependency_id, set())
+            if task.id not in dependents:
+                dependents.add(task.id)
+                dependency = self.tasks.get(dependency_id)
+                if dependency is None or dependency.status != TaskStatus.COMPLETED:
+                    self._unmet[task.id] += 1
+                    self._update_ready(task)
+
+        return task
+
     async def get_task(self, task_id: str) -> Task | None:
         """
         Get a task by ID.
@@ -252,27 +381,27 @@ class TaskManager:
         Get tasks ready to execute (dependencies met).
 
         Returns:
-            List of tasks sorted by priority (highest first)
+            List of tasks sorted by priority (highest first), then by
+            creation order
         """
-        ready = []
-
         async with self._lock:
-            for task in self.tasks.values():
-                if task.status != TaskStatus.PENDING:
-                    continue
-
-                # Check dependencies
-                deps_met = all(
-                    self.tasks.get(dep_id, Task(name="")).status == TaskStatus.COMPLETED
-                    for dep_id in task.depends_on
-                )
+            return [self.tasks[task_id] for *_, task_id in sorted(self._ready.values())]
+
+    async def get_next_ready_task(self) -> Task | None:
+        """
+        Get the highest-priority task ready to execute.
 
-                if deps_met:
-                    ready.append(task)
+        Cheaper than ``get_ready_tasks()[0]`` when many tasks are ready:
+        amortized O(log n). The task stays ready until its status changes.
 
-        # Sort by priority (highest first)
-        ready.sort(key=lambda t: t.priority.value, reverse=True)
-        return ready
+        Returns:
+            The Task, or None if nothing is ready
+        """
+        async with self._lock:
+            heap = self._ready_heap
+            while heap and self._ready.get(heap[0][2]) is not heap[0]:
+                heapq.heappop(heap)
+            return self.tasks[heap[0][2]] if heap else None
 
     async def get_tasks_by_status(self, status: TaskStatus) -> list[Task]:
         """
@@ -284,7 +413,7 @@ class TaskManager:
         Returns:
             List of matching tasks
         """
-        return [t for t in self.tasks.values() if t.status == status]
+        return self._sorted_by_creation(self._by_status.get(status, set()))
 
     async def get_tasks_by_agent(self, agent_id: str) -> list[Task]:
         """
@@ -296,7 +425,7 @@ class TaskManager:
         Returns:
             List of tasks assigned to the agent
         """
-        return [t for t in self.tasks.values() if t.assigned_agent_id == agent_id]
+        return self._sorted_by_creation(self._by_agent.get(agent_id, set()))
 
     async def assign_task(
         self,
@@ -321,6 +450,7 @@ class TaskManager:
                 raise ValueError(f"Task {task_id} not found")
 
             task.assigned_agent_id = agent_id
+            self._reindex(task)
 
         return await self.update_status(
             task_id,
@@ -350,6 +480,7 @@ class TaskManager:
 
             if not task.increment_retry():
                 return False
+            self._reindex(task)
 
         await self.event_bus.publish(
             Trace(
@@ -445,7 +576,7 @@ class TaskManager:
                 return True
 
             return all(
-                self.tasks.get(sub_id, Task(name="")).is_complete()
+                sub_id in self.tasks and self.tasks[sub_id].is_complete()
                 for sub_id in parent.subtask_ids
             )
 
@@ -490,3 +621,4 @@ class TaskManager:
         """Clear all tasks."""
         async with self._lock:
             self.tasks.clear()
+            self._reset_indexes()
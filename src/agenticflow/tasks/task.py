@@ -250,7 +250,12 @@ class Task:
             self.subtask_ids.append(subtask_id)
 
     def add_dependency(self, task_id: str) -> None:
-        """Add a dependency to this task."""
+        """
+        Add a dependency to this task.
+
+        For tasks owned by a TaskManager, call
+        ``TaskManager.add_dependency`` instead so its ready queue is updated.
+        """
         if task_id not in self.depends_on:
             self.depends_on.append(task_id)
 
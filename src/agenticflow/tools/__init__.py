@@ -3,6 +3,7 @@ Tools module - ToolRegistry, tool utilities, and deferred execution.
 """
 
 from agenticflow.tools.base import tool
+from agenticflow.tools.cache import ToolCache
 from agenticflow.tools.deferred import (
     DeferredManager,
     DeferredResult,
@@ -18,6 +19,7 @@ __all__ = [
     "ToolRegistry",
     "create_tool_from_function",
     "tool",
+    "ToolCache",
     # Deferred execution
     "DeferredResult",
     "DeferredStatus",
@@ -13,6 +13,8 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, get_type_hints
 
+from agenticflow.tools.cache import ToolCache, resolve_cache
+
 if TYPE_CHECKING:
     from agenticflow.core.context import RunContext
 
@@ -26,6 +28,7 @@ class BaseTool:
     - JSON schema for parameters
     - Sync and async invocation
     - Context injection (if function has `ctx: RunContext` param)
+    - Optional result caching for deterministic tools (`cache=`)
 
     Example:
         @tool
@@ -45,6 +48,7 @@ class BaseTool:
             description="Search the web",
             func=search_fn,
             args_schema={"query": {"type": "string"}},
+            cache=ToolCache(ttl=300),
         )
     """
 
@@ -54,10 +58,12 @@ class BaseTool:
     args_schema: dict[str, Any] = field(default_factory=dict)
     return_info: str = field(default="", repr=False)
     _needs_context: bool = field(default=False, repr=False)
+    cache: ToolCache | bool | None = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
-        """Check if function needs context injection."""
+        """Check if function needs context injection and resolve the cache."""
         self._needs_context = _function_needs_context(self.func)
+        self.cache = resolve_cache(self.cache)
 
     def invoke(self, args: dict[str, Any], ctx: RunContext | None = None) -> Any:
         """Invoke the tool synchronously.
@@ -293,7 +299,13 @@ def _extract_schema_from_function(func: Callable[..., Any]) -> dict[str, Any]:
     return schema
 
 
-def tool(func: Callable[..., Any] | None = None, *, name: str | None = None, description: str | None = None) -> BaseTool | Callable[[Callable[..., Any]], BaseTool]:
+def tool(
+    func: Callable[..., Any] | None = None,
+    *,
+    name: str | None = None,
+    description: str | None = None,
+    cache: bool | ToolCache | None = None,
+) -> BaseTool | Callable[[Callable[..., Any]], BaseTool]:
     """Decorator to create a tool from a function.
 
     The function's docstring becomes the tool description.
@@ -314,6 +326,12 @@ def tool(func: Callable[..., Any] | None = None, *, name: str | None = None, des
         def search(query: str) -> str:
             '''Search the web.'''
             return f"Results for: {query}"
+
+        # Cache results of a deterministic tool (see ToolCache):
+        @tool(cache=ToolCache(ttl=300))
+        def lookup(key: str) -> str:
+            '''Look up a value.'''
+            return db[key]
     """
     def decorator(fn: Callable[..., Any]) -> BaseTool:
         tool_name = name or fn.__name__
@@ -330,6 +348,7 @@ def tool(func: Callable[..., Any] | None = None, *, name: str | None = None, des
             func=fn,
             args_schema=args_schema,
             return_info=return_info,
+            cache=cache,
         )
 
     if func is not None:
@@ -0,0 +1,203 @@
+"""
+Tool result caching for deterministic tools.
+
+Pure tools (lookups, graph queries, fetches of immutable resources) often get
+called with identical arguments several times within a run and across runs.
+Declaring a cache on the tool lets the executor reuse earlier results:
+
+Example:
+    ```python
+    from agenticflow.tools import ToolCache, tool
+
+    @tool(cache=True)  # In-memory LRU, no expiry
+    def find_callers(symbol: str) -> str:
+        '''Find call sites of a symbol.'''
+        ...
+
+    @tool(cache=ToolCache(ttl=300, max_size=500))
+    async def fetch(url: str) -> str:
+        '''Fetch a URL.'''
+        ...
+
+    # Shared across processes via a memory store
+    from agenticflow.memory.stores import RedisStore
+    shared = ToolCache(ttl=3600, store=RedisStore(url="redis://localhost:6379"))
+    ```
+
+Entries are keyed by tool name plus canonical JSON of the arguments, so
+``{"a": 1, "b": 2}`` and ``{"b": 2, "a": 1}`` share an entry. Concurrent
+identical calls are de-duplicated: only the first runs the tool, the rest
+await its result. Failed calls are never cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class ToolCache:
+    """Result cache for tool calls with TTL, LRU size bound and single-flight.
+
+    By default entries live in a process-local LRU. Pass ``store`` to use any
+    memory store (``InMemoryStore``, ``SQLAlchemyStore``, ``RedisStore``) as
+    the backend instead, e.g. to share results between workers; ``max_size``
+    then does not apply and expiry is delegated to the store's ``ttl``.
+
+    Attributes:
+        ttl: Seconds before an entry expires (None = never).
+        max_size: Maximum in-memory entries before evicting the least
+            recently used.
+        store: Optional memory store backend.
+        hits: Number of calls served from the cache.
+        misses: Number of calls that ran the tool.
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        max_size: int = 1024,
+        store: Any = None,
+        namespace: str = "tool_cache",
+    ) -> None:
+        """Initialize cache.
+
+        Args:
+            ttl: Seconds before an entry expires (None = never).
+            max_size: Maximum in-memory entries.
+            store: Optional memory store backend.
+            namespace: Key prefix used with ``store``.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.ttl = ttl
+        self.max_size = max_size
+        self.store = store
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
+    @staticmethod
+    def make_key(tool_name: str, args: dict[str, Any]) -> str:
+        """Build the cache key for a tool call.
+
+        Args:
+            tool_name: Tool name.
+            args: Call arguments.
+
+        Returns:
+            ``"<tool_name>:<sha256 of canonical JSON args>"``.
+        """
+        canonical = json.dumps(args, sort_keys=True, separators=(",", ":"), default=str)
+        return f"{tool_name}:{hashlib.sha256(canonical.encode()).hexdigest()}"
+
+    async def get(self, key: str) -> tuple[bool, Any]:
+        """Look up a key.
+
+        Returns:
+            ``(found, value)``.
+        """
+        if self.store is not None:
+            entry = await self.store.get(f"{self.namespace}:{key}")
+            return (True, entry["value"]) if entry is not None else (False, None)
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store a value under a key."""
+        if self.store is not None:
+            ttl = None if self.ttl is None else max(1, int(self.ttl))
+            # Wrapped so a cached None is distinguishable from a miss
+            await self.store.set(f"{self.namespace}:{key}", {"value": value}, ttl=ttl)
+            return
+
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get_or_call(
+        self,
+        tool_name: str,
+        args: dict[str, Any],
+        call: Callable[[], Awaitable[Any]],
+    ) -> tuple[Any, bool]:
+        """Return a cached result, or run ``call`` once and cache it.
+
+        Concurrent callers with the same key wait for the first call
+        instead of running the tool again. Exceptions propagate to every
+        waiter and nothing is cached.
+
+        Args:
+            tool_name: Tool name.
+            args: Call arguments.
+            call: Zero-argument coroutine function that runs the tool.
+
+        Returns:
+            ``(result, hit)``.
+        """
+        key = self.make_key(tool_name, args)
+
+        found, value = await self.get(key)
+        if found:
+            self.hits += 1
+            return value, True
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.hits += 1
+            return await asyncio.shield(pending), True
+
+        self.misses += 1
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await call()
+            await self.set(key, value)
+            future.set_result(value)
+            return value, False
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure isn't logged
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    def clear(self) -> None:
+        """Drop in-memory entries and reset statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Get hit/miss statistics."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+def resolve_cache(cache: bool | ToolCache | None) -> ToolCache | None:
+    """Normalize a ``cache=`` tool option to a ToolCache (or None)."""
+    if cache is True:
+        return ToolCache()
+    if cache is False or cache is None:
+        return None
+    return cache
@@ -26,6 +26,8 @@ class ToolRegistry:
 
     Attributes:
         event_bus: Optional EventBus for registration events
+        version: Change counter, bumped on every mutation so consumers
+            can cache derived views (e.g. an agent's tool index)
 
     Example:
         ```python
@@ -57,6 +59,7 @@ class ToolRegistry:
         """
         self._tools: dict[str, BaseTool] = {}
         self.event_bus = event_bus
+        self.version = 0
 
     def register(self, tool_instance: BaseTool) -> ToolRegistry:
         """
@@ -69,6 +72,7 @@ class ToolRegistry:
             Self for method chaining
         """
         self._tools[tool_instance.name] = tool_instance
+        self.version += 1
         return self
 
     def register_many(self, tools: list[BaseTool]) -> ToolRegistry:
@@ -97,6 +101,7 @@ class ToolRegistry:
         """
         if name in self._tools:
             del self._tools[name]
+            self.version += 1
             return True
         return False
 
@@ -205,6 +210,7 @@ class ToolRegistry:
     def clear(self) -> None:
         """Remove all registered tools."""
         self._tools.clear()
+        self.version += 1
 
 
 def create_tool_from_function(
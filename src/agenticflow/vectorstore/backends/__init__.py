@@ -1,7 +1,7 @@
 """Vector store backends package.
 
 Provides different storage backends:
-- InMemoryBackend: NumPy-based, good for <10k documents (default)
+- InMemoryBackend: NumPy-based matrix, no extra deps (default)
 - FAISSBackend: Large-scale similarity search
 - ChromaBackend: Persistent with metadata filtering
 - QdrantBackend: Production vector database
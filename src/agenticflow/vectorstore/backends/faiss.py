@@ -160,25 +160,58 @@ class FAISSBackend:
         Returns:
             List of SearchResult objects sorted by similarity.
         """
+        results = await self.search_many([embedding], k, filter)
+        return results[0]
+
+    async def search_many(
+        self,
+        embeddings: list[list[float]],
+        k: int = 4,
+        filter: dict[str, Any] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for several query embeddings in one FAISS call.
+
+        Args:
+            embeddings: Query embedding vectors.
+            k: Number of results to return per query.
+            filter: Optional metadata filter (post-filtering).
+
+        Returns:
+            One list of SearchResult objects per query, in query order.
+        """
         if self._index.ntotal == 0:
+            return [[] for _ in embeddings]
+        if not embeddings:
             return []
 
         np = self._np
 
-        # Convert and normalize query
-        query = np.array([embedding], dtype=np.float32)
-        query = self._normalize(query)
+        # Convert and normalize queries
+        queries = np.array(embeddings, dtype=np.float32)
+        queries = self._normalize(queries)
 
         # Search more results if filtering (for post-filtering)
         search_k = k * 4 if filter else k
         search_k = min(search_k, self._index.ntotal)
 
-        # Search
-        scores, indices = self._index.search(query, search_k)
+        # Native batch search
+        scores, indices = self._index.search(queries, search_k)
 
-        # Build results with optional filtering
+        return [
+            self._build_results(row_scores, row_indices, k, filter)
+            for row_scores, row_indices in zip(scores, indices, strict=True)
+        ]
+
+    def _build_results(
+        self,
+        scores: Any,
+        indices: Any,
+        k: int,
+        filter: dict[str, Any] | None,
+    ) -> list[SearchResult]:
+        """Map one row of FAISS output to SearchResults with optional filtering."""
         results: list[SearchResult] = []
-        for score, idx in zip(scores[0], indices[0], strict=False):
+        for score, idx in zip(scores, indices, strict=False):
             if idx == -1:  # FAISS returns -1 for empty slots
                 continue
 
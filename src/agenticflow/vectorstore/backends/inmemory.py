@@ -1,6 +1,8 @@
 """In-memory vector store backend using NumPy.
 
-A simple, zero-dependency backend suitable for small to medium datasets (<10k documents).
+A simple, zero-dependency backend. When NumPy is available, embeddings are kept
+in a contiguous, growable float32 matrix so search is a single mat-vec plus a
+partial top-k selection, which keeps corpora of 100k-1M chunks interactive.
 Supports multiple similarity metrics: cosine, euclidean, dot product.
 """
 
@@ -47,13 +49,15 @@ class StoredDocument:
 
     Attributes:
         id: Unique identifier.
-        embedding: Vector embedding.
+        embedding: Vector embedding (empty when held in the NumPy matrix).
         document: The original document.
+        row: Row of the embedding in the NumPy matrix (-1 if unused).
     """
 
     id: str
     embedding: list[float]
     document: Document
+    row: int = -1
 
 
 @dataclass
@@ -61,11 +65,14 @@ class InMemoryBackend:
     """In-memory vector store backend using NumPy-style operations.
 
     Uses pure Python with optional NumPy acceleration for similarity search.
-    Good for datasets up to ~10k documents.
+    With NumPy, embeddings live in a growable float32 matrix indexed by row;
+    deletes leave tombstones that are compacted once they exceed
+    ``compact_ratio`` of the used rows.
 
     Attributes:
         metric: Similarity metric to use (default: COSINE).
         normalize: Whether to normalize embeddings (auto-set based on metric).
+        compact_ratio: Fraction of tombstoned rows that triggers compaction.
 
     Example:
         >>> # Default: cosine similarity
@@ -83,9 +90,18 @@ class InMemoryBackend:
 
     metric: SimilarityMetric | str = SimilarityMetric.COSINE
     normalize: bool | None = None  # Auto-set based on metric if None
+    compact_ratio: float = 0.25
     _storage: dict[str, StoredDocument] = field(default_factory=dict)
     _numpy_available: bool = field(default=False, init=False)
 
+    # NumPy matrix state (only used when NumPy is available)
+    _matrix: Any = field(default=None, init=False, repr=False)
+    _sq_norms: Any = field(default=None, init=False, repr=False)
+    _alive: Any = field(default=None, init=False, repr=False)
+    _row_ids: list[str | None] = field(default_factory=list, init=False, repr=False)
+    _size: int = field(default=0, init=False, repr=False)
+    _tombstones: int = field(default=0, init=False, repr=False)
+
     def __post_init__(self) -> None:
         """Initialize metric and check for NumPy."""
         # Convert string to enum
@@ -127,6 +143,17 @@ class InMemoryBackend:
             msg = f"Lengths must match: ids={len(ids)}, embeddings={len(embeddings)}, documents={len(documents)}"
             raise ValueError(msg)
 
+        if self._numpy_available:
+            self._add_numpy(ids, embeddings, documents)
+            return
+
+        dims = {len(embedding) for embedding in embeddings}
+        if self._storage:
+            dims.add(len(next(iter(self._storage.values())).embedding))
+        if len(dims) > 1:
+            msg = f"Embedding dimension mismatch: got dimensions {sorted(dims)}"
+            raise ValueError(msg)
+
         for doc_id, embedding, document in zip(ids, embeddings, documents, strict=False):
             # Normalize if requested
             if self.normalize:
@@ -157,17 +184,15 @@ class InMemoryBackend:
         if not self._storage:
             return []
 
+        # Calculate similarities (the NumPy path normalizes the query itself)
+        if self._numpy_available:
+            return self._search_numpy(embedding, k, filter)
+
         # Normalize query if needed
         if self.normalize:
             embedding = self._normalize_vector(embedding)
 
-        # Calculate similarities
-        if self._numpy_available:
-            results = self._search_numpy(embedding, k, filter)
-        else:
-            results = self._search_pure_python(embedding, k, filter)
-
-        return results
+        return self._search_pure_python(embedding, k, filter)
 
     def _compute_similarity(
         self,
@@ -237,63 +262,257 @@ class InMemoryBackend:
 
         return results
 
+    async def search_many(
+        self,
+        embeddings: list[list[float]],
+        k: int = 4,
+        filter: dict[str, Any] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for several query embeddings at once.
+
+        With NumPy, all queries are scored with a single matrix-matrix
+        product against the stored embeddings.
+
+        Args:
+            embeddings: Query embedding vectors.
+            k: Number of results to return per query.
+            filter: Optional metadata filter (exact match), shared by all queries.
+
+        Returns:
+            One list of SearchResult objects per query, in query order.
+        """
+        if not embeddings:
+            return []
+        if not self._storage:
+            return [[] for _ in embeddings]
+
+        if self._numpy_available:
+            return self._search_numpy_many(embeddings, k, filter)
+
+        results = []
+        for embedding in embeddings:
+            if self.normalize:
+                embedding = self._normalize_vector(embedding)
+            results.append(self._search_pure_python(embedding, k, filter))
+        return results
+
     def _search_numpy(
         self,
         embedding: list[float],
         k: int,
         filter: dict[str, Any] | None,
     ) -> list[SearchResult]:
-        """NumPy-accelerated search implementation."""
+        """NumPy-accelerated search over the persistent embedding matrix."""
+        return self._search_numpy_many([embedding], k, filter)[0]
+
+    def _search_numpy_many(
+        self,
+        embeddings: list[list[float]],
+        k: int,
+        filter: dict[str, Any] | None,
+    ) -> list[list[SearchResult]]:
+        """Score a batch of queries against the matrix and select top k for each."""
         import numpy as np
 
-        # Filter documents first
-        filtered_docs = []
-        for stored in self._storage.values():
-            if filter and not self._matches_filter(stored.document, filter):
-                continue
-            filtered_docs.append(stored)
+        if self._matrix is None or k <= 0:
+            return [[] for _ in embeddings]
 
-        if not filtered_docs:
-            return []
+        queries = np.asarray(embeddings, dtype=np.float32)
+        if queries.ndim != 2 or queries.shape[1] != self._matrix.shape[1]:
+            msg = f"Query dimension does not match index dimension {self._matrix.shape[1]}"
+            raise ValueError(msg)
+        if self.normalize:
+            norms = np.linalg.norm(queries, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            queries = queries / norms
+
+        # Restrict to filtered rows, or scan the used part of the matrix
+        rows = None
+        if filter:
+            rows = np.fromiter(
+                (
+                    stored.row
+                    for stored in self._storage.values()
+                    if self._matches_filter(stored.document, filter)
+                ),
+                dtype=np.intp,
+            )
+            if rows.size == 0:
+                return [[] for _ in embeddings]
+            scores = self._score_rows(self._matrix[rows], self._sq_norms[rows], queries)
+            candidates = rows.size
+        else:
+            scores = self._score_rows(
+                self._matrix[: self._size], self._sq_norms[: self._size], queries
+            )
+            if self._tombstones:
+                scores[~self._alive[: self._size]] = -np.inf
+            candidates = len(self._storage)
+
+        # Partial selection of the top k per query, then order just those
+        top_k = min(k, candidates)
+        n = scores.shape[0]
+        if top_k < n:
+            top = np.argpartition(-scores, top_k - 1, axis=0)[:top_k]
+        else:
+            top = np.broadcast_to(np.arange(n)[:, None], scores.shape)
 
-        # Build embedding matrix
-        query = np.array(embedding)
-        matrix = np.array([doc.embedding for doc in filtered_docs])
+        results = []
+        for q in range(scores.shape[1]):
+            column = scores[:, q]
+            indices = top[:, q]
+            indices = indices[np.argsort(-column[indices], kind="stable")][:top_k]
+
+            query_results = []
+            for idx in indices:
+                row = int(rows[idx]) if rows is not None else int(idx)
+                stored = self._storage[self._row_ids[row]]  # type: ignore[index]
+                query_results.append(SearchResult(
+                    document=stored.document,
+                    score=float(column[idx]),
+                    id=stored.id,
+                ))
+            results.append(query_results)
 
-        # Compute similarity based on metric
-        if self.metric in (SimilarityMetric.COSINE, SimilarityMetric.DOT_PRODUCT):
-            # Dot product (cosine for normalized vectors)
-            scores = np.dot(matrix, query)
+        return results
 
-        elif self.metric == SimilarityMetric.EUCLIDEAN:
-            # Euclidean distance converted to similarity
-            distances = np.linalg.norm(matrix - query, axis=1)
-            scores = 1.0 / (1.0 + distances)
+    def _score_rows(self, matrix: Any, sq_norms: Any, queries: Any) -> Any:
+        """Compute similarity scores of matrix rows against a batch of queries.
 
-        elif self.metric == SimilarityMetric.MANHATTAN:
-            # Manhattan distance converted to similarity
-            distances = np.sum(np.abs(matrix - query), axis=1)
-            scores = 1.0 / (1.0 + distances)
+        Args:
+            matrix: Row-major float32 embedding matrix (n x d).
+            sq_norms: Squared L2 norms of the matrix rows.
+            queries: Query matrix (m x d).
 
-        else:
-            # Fallback to dot product
-            scores = np.dot(matrix, query)
+        Returns:
+            Score matrix (n x m, higher = more similar).
+        """
+        import numpy as np
 
-        # Get top k indices
-        top_k = min(k, len(scores))
-        top_indices = np.argsort(scores)[-top_k:][::-1]
+        if self.metric == SimilarityMetric.EUCLIDEAN:
+            # ||a - q||^2 = ||a||^2 - 2 a.q + ||q||^2, without an n x d temporary
+            sq_dist = (
+                sq_norms[:, None]
+                - 2.0 * (matrix @ queries.T)
+                + np.einsum("ij,ij->i", queries, queries)[None, :]
+            )
+            np.maximum(sq_dist, 0.0, out=sq_dist)
+            return 1.0 / (1.0 + np.sqrt(sq_dist))
 
-        # Build results
-        results = []
-        for idx in top_indices:
-            stored = filtered_docs[idx]
-            results.append(SearchResult(
-                document=stored.document,
-                score=float(scores[idx]),
-                id=stored.id,
-            ))
+        if self.metric == SimilarityMetric.MANHATTAN:
+            distances = np.stack(
+                [np.abs(matrix - query).sum(axis=1) for query in queries], axis=1
+            )
+            return 1.0 / (1.0 + distances)
 
-        return results
+        # Cosine (normalized vectors) and dot product
+        return matrix @ queries.T
+
+    def _add_numpy(
+        self,
+        ids: list[str],
+        embeddings: list[list[float]],
+        documents: list[Document],
+    ) -> None:
+        """Write embeddings into the matrix, reusing rows of existing IDs."""
+        import numpy as np
+
+        # Last occurrence wins for duplicate IDs within a batch
+        positions = {doc_id: i for i, doc_id in enumerate(ids)}
+        if not positions:
+            return
+
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        if vectors.ndim != 2:
+            msg = "All embeddings must have the same dimension"
+            raise ValueError(msg)
+        if self._matrix is not None and vectors.shape[1] != self._matrix.shape[1]:
+            msg = f"Embedding dimension {vectors.shape[1]} does not match index dimension {self._matrix.shape[1]}"
+            raise ValueError(msg)
+
+        if self.normalize:
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            vectors = vectors / norms
+
+        new_count = sum(1 for doc_id in positions if doc_id not in self._storage)
+        self._reserve(self._size + new_count, vectors.shape[1])
+
+        rows = np.empty(len(positions), dtype=np.intp)
+        sources = np.empty(len(positions), dtype=np.intp)
+        for i, (doc_id, pos) in enumerate(positions.items()):
+            existing = self._storage.get(doc_id)
+            if existing is not None:
+                row = existing.row
+                existing.document = documents[pos]
+            else:
+                row = self._size
+                self._size += 1
+                self._row_ids[row] = doc_id
+                self._alive[row] = True
+                self._storage[doc_id] = StoredDocument(
+                    id=doc_id,
+                    embedding=[],
+                    document=documents[pos],
+                    row=row,
+                )
+            rows[i] = row
+            sources[i] = pos
+
+        block = vectors[sources]
+        self._matrix[rows] = block
+        self._sq_norms[rows] = np.einsum("ij,ij->i", block, block)
+
+    def _reserve(self, rows: int, dim: int) -> None:
+        """Ensure the matrix has capacity for at least ``rows`` rows."""
+        import numpy as np
+
+        capacity = 0 if self._matrix is None else self._matrix.shape[0]
+        if rows <= capacity:
+            return
+
+        new_capacity = max(rows, capacity * 2, 64)
+        matrix = np.zeros((new_capacity, dim), dtype=np.float32)
+        sq_norms = np.zeros(new_capacity, dtype=np.float32)
+        alive = np.zeros(new_capacity, dtype=bool)
+        if self._matrix is not None:
+            matrix[: self._size] = self._matrix[: self._size]
+            sq_norms[: self._size] = self._sq_norms[: self._size]
+            alive[: self._size] = self._alive[: self._size]
+
+        self._matrix = matrix
+        self._sq_norms = sq_norms
+        self._alive = alive
+        self._row_ids.extend([None] * (new_capacity - len(self._row_ids)))
+
+    def _compact(self) -> None:
+        """Drop tombstoned rows and renumber the remaining documents."""
+        import numpy as np
+
+        live = np.flatnonzero(self._alive[: self._size])
+        n = live.size
+        self._matrix[:n] = self._matrix[live]
+        self._sq_norms[:n] = self._sq_norms[live]
+        self._alive[:n] = True
+        self._alive[n : self._size] = False
+
+        row_ids = [self._row_ids[row] for row in live]
+        for row, doc_id in enumerate(row_ids):
+            self._storage[doc_id].row = row  # type: ignore[index]
+        self._row_ids[:n] = row_ids
+        self._row_ids[n : self._size] = [None] * (self._size - n)
+
+        self._size = n
+        self._tombstones = 0
+
+    def _reset_matrix(self) -> None:
+        """Release the NumPy matrix state."""
+        self._matrix = None
+        self._sq_norms = None
+        self._alive = None
+        self._row_ids = []
+        self._size = 0
+        self._tombstones = 0
 
     async def delete(self, ids: list[str]) -> bool:
         """Delete documents by ID.
@@ -306,14 +525,26 @@ class InMemoryBackend:
         """
         deleted = False
         for doc_id in ids:
-            if doc_id in self._storage:
-                del self._storage[doc_id]
-                deleted = True
+            stored = self._storage.pop(doc_id, None)
+            if stored is None:
+                continue
+            deleted = True
+            if stored.row >= 0:
+                self._alive[stored.row] = False
+                self._row_ids[stored.row] = None
+                self._tombstones += 1
+
+        if self._matrix is not None:
+            if not self._storage:
+                self._reset_matrix()
+            elif self._tombstones > self.compact_ratio * self._size:
+                self._compact()
         return deleted
 
     async def clear(self) -> None:
         """Remove all documents from the store."""
         self._storage.clear()
+        self._reset_matrix()
 
     async def get(self, ids: list[str]) -> list[Document]:
         """Get documents by ID.
@@ -182,7 +182,48 @@ class QdrantBackend:
             query_filter=query_filter,
         )
 
-        # Build SearchResult objects
+        return self._to_search_results(results)
+
+    async def search_many(
+        self,
+        embeddings: list[list[float]],
+        k: int = 4,
+        filter: dict[str, Any] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for several query embeddings in one batch request.
+
+        Args:
+            embeddings: Query embedding vectors.
+            k: Number of results to return per query.
+            filter: Optional metadata filter (Qdrant filter format).
+
+        Returns:
+            One list of SearchResult objects per query, in query order.
+        """
+        if not embeddings:
+            return []
+
+        models = self._models
+        query_filter = self._build_filter(filter) if filter else None
+
+        batches = self._client.search_batch(
+            collection_name=self.collection_name,
+            requests=[
+                models.SearchRequest(
+                    vector=embedding,
+                    limit=k,
+                    filter=query_filter,
+                    with_payload=True,
+                )
+                for embedding in embeddings
+            ],
+        )
+
+        return [self._to_search_results(results) for results in batches]
+
+    @staticmethod
+    def _to_search_results(results: Any) -> list[SearchResult]:
+        """Build SearchResult objects from scored Qdrant points."""
         search_results: list[SearchResult] = []
 
         for result in results:
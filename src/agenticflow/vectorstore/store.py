@@ -213,6 +213,75 @@ class VectorStore:
 
         return results
 
+    async def search_many(
+        self,
+        queries: list[str],
+        k: int = 4,
+        filter: dict[str, Any] | list[dict[str, Any] | None] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for several queries at once.
+
+        All distinct query texts are embedded in a single ``aembed_texts``
+        call. If the backend provides ``search_many`` and every query shares
+        the same filter, the backend is queried once for the whole batch
+        (a matrix-matrix product for InMemory, native batch search for
+        FAISS and Qdrant); otherwise each query is searched concurrently.
+
+        Args:
+            queries: Query texts.
+            k: Number of results to return per query.
+            filter: Optional metadata filter shared by all queries, or one
+                filter (or None) per query.
+
+        Returns:
+            One list of SearchResult objects per query, in query order.
+
+        Example:
+            >>> batches = await store.search_many(["python", "rust"], k=3)
+            >>> for query_results in batches:
+            ...     print([r.id for r in query_results])
+        """
+        if not queries:
+            return []
+
+        filters: list[dict[str, Any] | None]
+        if isinstance(filter, list):
+            if len(filter) != len(queries):
+                msg = f"Lengths must match: queries={len(queries)}, filters={len(filter)}"
+                raise ValueError(msg)
+            filters = filter
+        else:
+            filters = [filter] * len(queries)
+
+        # Embed each distinct query once
+        unique = list(dict.fromkeys(queries))
+        unique_embeddings = await self.embeddings.aembed_texts(unique)  # type: ignore
+        by_text = dict(zip(unique, unique_embeddings, strict=True))
+        query_embeddings = [by_text[q] for q in queries]
+
+        # Search backend
+        shared_filter = all(f == filters[0] for f in filters)
+        if shared_filter and hasattr(self.backend, "search_many"):
+            results = await self.backend.search_many(query_embeddings, k, filters[0])  # type: ignore
+        else:
+            import asyncio
+
+            results = list(await asyncio.gather(*(
+                self.backend.search(embedding, k, f)  # type: ignore
+                for embedding, f in zip(query_embeddings, filters, strict=True)
+            )))
+
+        # Emit event
+        await _emit_event("vectorstore.search", {
+            "query": queries[0][:100],
+            "queries": len(queries),
+            "k": k,
+            "results": sum(len(r) for r in results),
+            "top_score": max((r[0].score for r in results if r), default=None),
+        })
+
+        return results
+
     async def similarity_search(
         self,
         query: str,
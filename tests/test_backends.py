@@ -219,6 +219,33 @@ class TestSQLAlchemyStore:
 
         await store.close()
 
+    @pytest.mark.asyncio
+    async def test_sqlite_message_log(self, temp_db):
+        """Test append/range/trim on the row-per-item log table."""
+        pytest.importorskip("sqlalchemy")
+        pytest.importorskip("aiosqlite")
+        from agenticflow.memory.stores import SQLAlchemyStore
+
+        store = SQLAlchemyStore(f"sqlite+aiosqlite:///{temp_db}")
+        await store.initialize()
+
+        # A list written with set() is migrated on first log access
+        await store.set("log", [0, 1])
+        await store.log_append("log", [2, 3, 4])
+
+        assert await store.log_range("log") == [0, 1, 2, 3, 4]
+        assert await store.log_range("log", -2) == [3, 4]
+        assert await store.log_range("log", 1, -1) == [1, 2, 3]
+        assert "log" in await store.keys()
+
+        await store.log_trim("log", 2)
+        assert await store.log_range("log") == [3, 4]
+
+        assert await store.delete("log") is True
+        assert await store.log_range("log") == []
+
+        await store.close()
+
 
 class TestRedisStore:
     """Tests for Redis memory store."""
@@ -154,6 +154,91 @@ class TestInMemoryGraph:
         assert paths[0] == ["Alice", "Bob", "Charlie"]
 
 
+class TestCompactGraph:
+    """Tests for CompactGraph."""
+    
+    def test_entities_and_relationships(self):
+        from agenticflow.capabilities.knowledge_graph import CompactGraph
+        
+        graph = CompactGraph()
+        graph.add_entity("Alice", "Person", {"role": "engineer"})
+        graph.add_entity("Alice", "Person", {"team": "backend"})
+        graph.add_entity("Acme", "Company")
+        graph.add_relationship("Alice", "works_at", "Acme")
+        graph.add_relationship("Alice", "works_at", "Acme", {"since": 2020})
+        graph.add_relationship("Alice", "knows", "Bob")  # Bob is not an entity
+        
+        assert graph.get_entity("Alice").attributes == {"role": "engineer", "team": "backend"}
+        assert graph.get_entity("Bob") is None
+        assert graph.stats() == {"entities": 2, "relationships": 2}
+        
+        rels = graph.get_relationships("Alice", relation="works_at")
+        assert [(r.target_id, r.attributes) for r in rels] == [("Acme", {"since": 2020})]
+        assert [r.source_id for r in graph.get_relationships("Acme", direction="incoming")] == ["Alice"]
+        assert len(graph.get_relationships("Alice", direction="both")) == 2
+        assert graph.query("? -knows-> ?") == [{"source": "Alice", "relation": "knows", "target": "Bob"}]
+        assert graph.query("? -works_at-> Acme")[0]["source_type"] == "Person"
+    
+    def test_remove_entity(self):
+        from agenticflow.capabilities.knowledge_graph import CompactGraph
+        
+        graph = CompactGraph()
+        graph.add_entities_batch([("A", "Node", None), ("B", "Node", None), ("C", "Node", None)])
+        graph.add_relationships_batch([("A", "to", "B"), ("B", "to", "C"), ("B", "to", "B")])
+        
+        assert graph.remove_entity("B")
+        assert not graph.remove_entity("B")
+        assert graph.stats() == {"entities": 2, "relationships": 0}
+        assert graph.get_relationships("A") == []
+        assert graph.query("? -to-> ?") == []
+        
+        graph.add_relationship("A", "to", "C")
+        assert graph.find_path("A", "C") == [["A", "C"]]
+    
+    def test_find_path_is_shortest_within_depth(self):
+        from agenticflow.capabilities.knowledge_graph import CompactGraph
+        
+        graph = CompactGraph()
+        chain = [(f"n{i}", "next", f"n{i + 1}") for i in range(6)]
+        graph.add_relationships_batch(chain + [("n0", "skip", "n3"), ("x", "next", "n6")])
+        
+        assert graph.find_path("n0", "n6", max_depth=4) == [["n0", "n3", "n4", "n5", "n6"]]
+        assert graph.find_path("n0", "n6", max_depth=3) is None
+        assert graph.find_path("n6", "n0") is None  # Edges are directed
+        assert graph.find_path("n1", "n1") == [["n1"]]
+        assert graph.find_path("n0", "missing") is None
+    
+    def test_neighborhood_and_batches(self):
+        from agenticflow.capabilities.knowledge_graph import CompactGraph
+        
+        graph = CompactGraph()
+        graph.add_relationships_batch([("A", "calls", "B"), ("B", "uses", "C"), ("D", "calls", "A")])
+        
+        assert graph.neighborhood("A", 2) == {"A": 0, "B": 1, "C": 2}
+        assert graph.neighborhood("A", 2, relation="calls") == {"A": 0, "B": 1}
+        assert graph.neighborhood("A", 1, direction="both") == {"A": 0, "B": 1, "D": 1}
+        rels = graph.get_relationships_batch(["A", "B"])
+        assert [(r.source_id, r.target_id) for r in rels] == [("A", "B"), ("B", "C")]
+    
+    def test_save_load_and_capability_backend(self, tmp_path):
+        from agenticflow.capabilities.knowledge_graph import CompactGraph
+        
+        kg = KnowledgeGraph(backend="compact")
+        assert isinstance(kg.graph, CompactGraph)
+        kg.graph.add_entity("Alice", "Person", {"role": "engineer"})
+        kg.graph.add_relationship("Alice", "works_at", "Acme", {"since": 2020})
+        kg.save(tmp_path / "graph.json")
+        
+        restored = InMemoryGraph()
+        restored.load(tmp_path / "graph.json")
+        assert restored.get_entity("Alice").attributes == {"role": "engineer"}
+        
+        graph = CompactGraph()
+        graph.load(tmp_path / "graph.json")
+        assert graph.stats() == {"entities": 1, "relationships": 1}
+        assert graph.get_relationships("Alice")[0].attributes == {"since": 2020}
+
+
 class TestKnowledgeGraphCapability:
     """Tests for KnowledgeGraph capability."""
     
@@ -342,6 +427,44 @@ class TestAgentWithCapabilities:
         assert "remember" in tool_names
         assert "recall" in tool_names
     
+    def test_tool_index_tracks_changes(self):
+        from agenticflow import Agent
+        from agenticflow.tools import ToolRegistry, tool
+        from unittest.mock import MagicMock
+
+        @tool
+        def lookup(key: str) -> str:
+            """Look up a key."""
+            return key
+
+        @tool
+        def fetch(url: str) -> str:
+            """Fetch a URL."""
+            return url
+
+        registry = ToolRegistry()
+        agent = Agent(
+            name="TestAgent",
+            model=MagicMock(),
+            tools=["lookup"],
+            capabilities=[KnowledgeGraph()],
+            tool_registry=registry,
+        )
+        assert agent._get_tool("lookup") is None
+
+        version = registry.version
+        registry.register(lookup)
+        assert registry.version == version + 1
+        assert agent._get_tool("lookup") is lookup
+        assert agent.all_tools[-1] is lookup
+        assert agent.all_tools is not agent.all_tools  # Callers get a copy
+
+        agent.direct_tools.append(fetch)
+        assert agent._get_tool("fetch") is fetch
+
+        registry.unregister("lookup")
+        assert "lookup" not in [t.name for t in agent.all_tools]
+
     def test_agent_capability_list(self):
         from agenticflow import Agent
         from unittest.mock import MagicMock
@@ -498,6 +621,52 @@ class TestSQLiteGraph:
         
         graph.close()
     
+    def test_traversal_matches_in_memory(self, tmp_path):
+        """Batched and recursive traversals agree with the default backend."""
+        from agenticflow.capabilities.knowledge_graph import InMemoryGraph, SQLiteGraph
+        
+        graph = SQLiteGraph(tmp_path / "traverse.db")
+        reference = InMemoryGraph()
+        edges = [("A", "calls", "B"), ("A", "calls", "C"), ("B", "uses", "D"),
+                 ("C", "calls", "D"), ("D", "calls", "E"), ("E", "calls", "A")]
+        for g in (graph, reference):
+            for name in "ABCDEF":
+                g.add_entity(name, "Node", {"name": name.lower()})
+            for src, rel, tgt in edges:
+                g.add_relationship(src, rel, tgt)
+        
+        assert graph.find_path("A", "E") == [["A", "B", "D", "E"]]
+        assert graph.find_path("A", "E", max_depth=2) is None
+        assert graph.find_path("A", "A") == [["A"]]
+        assert graph.find_path("A", "F") is None
+        
+        for direction in ("outgoing", "incoming", "both"):
+            assert graph.neighborhood("D", 2, direction=direction) == \
+                reference.neighborhood("D", 2, direction=direction)
+        assert graph.neighborhood("A", 3, relation="calls") == {"A": 0, "B": 1, "C": 1, "D": 2, "E": 3}
+        
+        def triples(rels):
+            return sorted((r.source_id, r.relation, r.target_id) for r in rels)
+        
+        rels = graph.get_relationships_batch(["A", "D"], direction="both")
+        assert triples(rels) == triples(reference.get_relationships_batch(["A", "D"], direction="both"))
+        assert rels[0].attributes == {}
+        assert rels[0] == graph.get_relationships("A")[0]
+        
+        entities = graph.get_entities_batch(["A", "F", "missing"])
+        assert set(entities) == {"A", "F"}
+        assert entities["A"].attributes == {"name": "a"}
+        assert entities["A"] == graph.get_entity("A")
+        
+        # Plain model instances: dataclasses.replace and repr work as usual
+        from dataclasses import replace
+        from agenticflow.capabilities.knowledge_graph.models import Entity, Relationship
+        assert type(entities["A"]) is Entity and type(rels[0]) is Relationship
+        assert replace(entities["A"], type="Renamed").type == "Renamed"
+        assert repr(entities["A"]).startswith("Entity(")
+        
+        graph.close()
+    
     def test_stats(self, tmp_path):
         """Test stats with SQLite."""
         from agenticflow.capabilities.knowledge_graph import SQLiteGraph
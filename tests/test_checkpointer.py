@@ -18,6 +18,7 @@ from agenticflow.flow.checkpointer import (
     FlowState,
     MemoryCheckpointer,
     FileCheckpointer,
+    SQLiteCheckpointer,
     generate_checkpoint_id,
     generate_flow_id,
 )
@@ -242,6 +243,95 @@ class TestFileCheckpointer:
             assert loaded is None
 
 
+# =============================================================================
+# SQLiteCheckpointer Tests
+# =============================================================================
+
+
+class TestSQLiteCheckpointer:
+    """Tests for SQLite-backed checkpointer."""
+
+    @pytest.mark.asyncio
+    async def test_save_load_latest_and_list(self) -> None:
+        """Checkpoints are looked up per flow, newest first."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpointer = SQLiteCheckpointer(Path(tmpdir) / "cp.db")
+
+            for i in range(3):
+                await checkpointer.save(
+                    FlowState(flow_id="f1", checkpoint_id=f"cp{i}", task="T", round=i)
+                )
+            await checkpointer.save(FlowState(flow_id="f2", checkpoint_id="other", task="T"))
+
+            assert await checkpointer.list_checkpoints("f1") == ["cp2", "cp1", "cp0"]
+            latest = await checkpointer.load_latest("f1")
+            assert latest is not None
+            assert latest.checkpoint_id == "cp2"
+            assert latest.round == 2
+            assert await checkpointer.load_latest("missing") is None
+            checkpointer.close()
+
+    @pytest.mark.asyncio
+    async def test_delta_checkpoints_survive_pruning(self) -> None:
+        """Delta checkpoints resolve correctly after their base is pruned or deleted."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpointer = SQLiteCheckpointer(
+                Path(tmpdir) / "cp.db",
+                max_checkpoints_per_flow=3,
+                delta=True,
+                full_every=10,
+            )
+
+            for i in range(5):
+                await checkpointer.save(
+                    FlowState(
+                        flow_id="f1",
+                        checkpoint_id=f"cp{i}",
+                        task="Long task",
+                        round=i,
+                        context={"step": i, "shared": "x" * 100},
+                    )
+                )
+
+            assert await checkpointer.list_checkpoints("f1") == ["cp4", "cp3", "cp2"]
+            assert await checkpointer.delete("cp2") is True
+
+            state = await checkpointer.load("cp4")
+            assert state is not None
+            assert state.task == "Long task"
+            assert state.context == {"step": 4, "shared": "x" * 100}
+            checkpointer.close()
+
+            reopened = SQLiteCheckpointer(Path(tmpdir) / "cp.db", delta=True)
+            state = await reopened.load_latest("f1")
+            assert state is not None
+            assert state.round == 4
+            reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_delta_sees_context_mutated_in_place(self) -> None:
+        """Changes to a context dict reused between saves are checkpointed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpointer = SQLiteCheckpointer(Path(tmpdir) / "cp.db", delta=True)
+            context = {"step": 1, "items": ["a"]}
+
+            await checkpointer.save(
+                FlowState(flow_id="f1", checkpoint_id="c1", task="T", context=context)
+            )
+            context["step"] = 2
+            context["items"].append("b")
+            await checkpointer.save(
+                FlowState(flow_id="f1", checkpoint_id="c2", task="T", context=context)
+            )
+
+            first = await checkpointer.load("c1")
+            second = await checkpointer.load("c2")
+            assert first is not None and second is not None
+            assert first.context == {"step": 1, "items": ["a"]}
+            assert second.context == {"step": 2, "items": ["a", "b"]}
+            checkpointer.close()
+
+
 # =============================================================================
 # ID Generation Tests
 # =============================================================================
@@ -193,3 +193,43 @@ class TestTruncateString:
     def test_empty_string(self) -> None:
         result = truncate_string("", max_length=10)
         assert result == ""
+
+
+class TestLazyPackageImports:
+    """Tests for lazy top-level exports in agenticflow/__init__.py."""
+
+    def test_import_does_not_load_submodules(self) -> None:
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, agenticflow; "
+            "print(sorted(m for m in sys.modules if m.startswith('agenticflow.')))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.strip() == "[]"
+
+    def test_all_exports_resolve(self) -> None:
+        import agenticflow
+        from agenticflow.graph import GraphView
+        from agenticflow.middleware import Span
+
+        for name in agenticflow.__all__:
+            assert getattr(agenticflow, name) is not None, name
+        assert agenticflow.MiddlewareSpan is Span
+        assert agenticflow.AgentDiagram is GraphView
+        assert set(agenticflow.__all__) <= set(dir(agenticflow))
+
+        with pytest.raises(AttributeError):
+            agenticflow.DoesNotExist  # noqa: B018
+
+    def test_subpackages_and_no_helper_leaks(self) -> None:
+        import agenticflow
+
+        for name in ("agent", "core", "events", "flow", "models", "tools"):
+            assert getattr(agenticflow, name).__name__ == f"agenticflow.{name}"
+        public = {n for n in dir(agenticflow) if not n.startswith("_")}
+        assert "Any" not in public
+        assert "importlib" not in public
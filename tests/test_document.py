@@ -34,6 +34,7 @@ from agenticflow.document import (
     MarkdownSplitter,
     HTMLSplitter,
     CodeSplitter,
+    TokenSplitter,
     split_text,
 )
 
@@ -425,6 +426,75 @@ def function_two():
         assert all(c.metadata.get("language") == "python" for c in chunks)
 
 
+class FakeEncoding:
+    """Whitespace-attached word tokenizer with the tiktoken interface."""
+
+    def __init__(self) -> None:
+        self.encode_calls = 0
+
+    def encode(self, text: str) -> list[str]:
+        import re
+
+        self.encode_calls += 1
+        return re.findall(r"\s*\S+|\s+", text)
+
+    def decode_with_offsets(self, tokens: list[str]) -> tuple[str, list[int]]:
+        offsets, position = [], 0
+        for token in tokens:
+            offsets.append(position)
+            position += len(token)
+        return "".join(tokens), offsets
+
+
+class TestTokenSplitter:
+    """Tests for TokenSplitter."""
+
+    @pytest.fixture
+    def splitter(self) -> TokenSplitter:
+        splitter = TokenSplitter(chunk_size=8, chunk_overlap=2)
+        splitter._tokenizer = FakeEncoding()
+        return splitter
+
+    def test_encodes_document_once(self, splitter: TokenSplitter) -> None:
+        text = " ".join(f"w{i}" for i in range(100))
+        chunks = splitter.split_text(text)
+
+        assert splitter.tokenizer.encode_calls == 1
+        assert all(c.metadata["token_count"] <= 8 for c in chunks)
+        for chunk in chunks:
+            meta = chunk.metadata
+            assert text[meta["start_index"]:meta["end_index"]] == chunk.text
+        # Consecutive chunks overlap by two tokens
+        assert chunks[1].text.split()[:2] == chunks[0].text.split()[-2:]
+        assert chunks[-1].text.endswith("w99")
+
+    def test_prefers_separator_boundaries(self, splitter: TokenSplitter) -> None:
+        splitter.chunk_overlap = 0
+        text = "one two three.\n\nfour five six seven eight nine"
+        chunks = splitter.split_text(text)
+
+        assert chunks[0].text == "one two three."
+        assert chunks[1].text.startswith("four")
+
+    def test_early_separator_with_overlap(self) -> None:
+        splitter = TokenSplitter(chunk_size=20, chunk_overlap=5)
+        splitter._tokenizer = FakeEncoding()
+        words = " ".join(f"w{i}" for i in range(60))
+        text = "Intro line one two three four\n\n" + words
+        chunks = splitter.split_text(text)
+
+        ends = [c.metadata["end_index"] for c in chunks]
+        assert ends == sorted(set(ends))  # Every chunk ends past the last
+        assert len({c.text for c in chunks}) == len(chunks)
+        assert chunks[0].text.startswith("Intro line one two three four")
+        assert chunks[-1].text.endswith("w59")
+
+    def test_length_is_cached(self, splitter: TokenSplitter) -> None:
+        assert splitter.length_function("a b c") == 3
+        assert splitter.length_function("a b c") == 3
+        assert splitter.tokenizer.encode_calls == 1
+
+
 class TestSplitTextFunction:
     """Tests for split_text convenience function."""
     
@@ -0,0 +1,111 @@
+"""Tests for the content-addressed embedding cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from agenticflow.models import CachedEmbedding, EmbeddingCache, MockEmbedding
+
+
+class CountingEmbedding(MockEmbedding):
+    """MockEmbedding that records every batch sent to the provider."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches: list[list[str]] = []
+
+    async def aembed(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        return await super().aembed(texts)
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        return super().embed(texts)
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache tiers."""
+
+    def test_key_includes_model_and_dimensions(self) -> None:
+        a = EmbeddingCache.make_key("m1", 256, "hello")
+        assert a != EmbeddingCache.make_key("m2", 256, "hello")
+        assert a != EmbeddingCache.make_key("m1", 512, "hello")
+        assert a == EmbeddingCache.make_key("m1", 256, "hello")
+
+    def test_lru_eviction(self) -> None:
+        cache = EmbeddingCache(max_size=2)
+        cache.put_many({"a": [1.0], "b": [2.0]})
+        cache.get_many(["a"])  # touch a
+        cache.put_many({"c": [3.0]})
+        assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+
+    def test_disk_tier_persists(self, tmp_path: Path) -> None:
+        path = tmp_path / "emb.sqlite"
+        cache = EmbeddingCache(path=path)
+        cache.put_many({"k": [0.5, -0.25]})
+        cache.close()
+
+        reopened = EmbeddingCache(path=path)
+        assert reopened.get_many(["k"]) == {"k": [0.5, -0.25]}
+        reopened.close()
+
+
+class TestCachedEmbedding:
+    """Tests for the CachedEmbedding wrapper."""
+
+    @pytest.mark.asyncio
+    async def test_only_misses_reach_provider(self) -> None:
+        provider = CountingEmbedding(dimensions=16)
+        embedder = CachedEmbedding(embedding=provider)
+
+        first = await embedder.aembed(["a", "b", "a"])
+        second = await embedder.aembed(["b", "c", "a"])
+
+        assert provider.batches == [["a", "b"], ["c"]]
+        assert first[0] == first[2] == second[2]
+        assert second == await provider.aembed(["b", "c", "a"])
+        assert embedder.stats.hits == 2
+        assert embedder.stats.misses == 4
+        assert embedder.stats.hit_rate == pytest.approx(2 / 6)
+
+    @pytest.mark.asyncio
+    async def test_query_and_sync_paths_use_cache(self) -> None:
+        provider = CountingEmbedding(dimensions=8)
+        embedder = CachedEmbedding(embedding=provider)
+
+        embedder.embed(["x"])
+        await embedder.aembed_query("x")
+        assert provider.batches == [["x"]]
+        assert embedder.dimension == 8
+        assert embedder.model == provider.model
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_new_wrapper(self, tmp_path: Path) -> None:
+        path = tmp_path / "emb.sqlite"
+        provider = CountingEmbedding(dimensions=8)
+        await CachedEmbedding(embedding=provider, cache=EmbeddingCache(path=path)).aembed(["doc"])
+
+        embedder = CachedEmbedding(embedding=provider, cache=EmbeddingCache(path=path))
+        vectors = await embedder.aembed(["doc"])
+        assert provider.batches == [["doc"]]
+        assert embedder.stats.disk_hits == 1
+        assert vectors[0] == pytest.approx(provider.embed(["doc"])[0], abs=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_metrics_counters(self) -> None:
+        from agenticflow.observability.metrics import MetricsCollector
+
+        metrics = MetricsCollector()
+        embedder = CachedEmbedding(embedding=MockEmbedding(), metrics=metrics)
+        await embedder.aembed(["a", "a", "b"])
+        await embedder.aembed(["a"])
+
+        labels = {"model": "mock-embedding"}
+        assert metrics.counter("embedding_cache_misses").get(labels) == 3
+        assert metrics.counter("embedding_cache_hits").get(labels) == 1
+
+    def test_requires_wrapped_embedding(self) -> None:
+        with pytest.raises(ValueError, match="embedding"):
+            CachedEmbedding()
@@ -0,0 +1,139 @@
+"""Tests for the bounded-concurrency embedding scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from agenticflow.models import EmbeddingScheduler, MockEmbedding
+from agenticflow.models.scheduler import is_rate_limit_error
+
+
+class RateLimitError(Exception):
+    """Stand-in for a provider 429 error."""
+
+    status_code = 429
+
+
+class ScheduledMockEmbedding(MockEmbedding):
+    """MockEmbedding routed through the scheduler, tracking concurrency."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.in_flight = 0
+        self.peak = 0
+        self.batches: list[list[str]] = []
+        self.failures: dict[str, int] = {}
+
+    async def aembed(self, texts: list[str]) -> list[list[float]]:
+        return await self._aembed_scheduled(texts)
+
+    async def _aembed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            if self.failures.get(texts[0], 0) > 0:
+                self.failures[texts[0]] -= 1
+                raise RateLimitError("Too Many Requests")
+            self.batches.append(list(texts))
+            return [self._generate_embedding(t) for t in texts]
+        finally:
+            self.in_flight -= 1
+
+
+class TestEmbeddingScheduler:
+    """Tests for EmbeddingScheduler batching and throttling."""
+
+    def test_pack_by_items_and_tokens(self) -> None:
+        scheduler = EmbeddingScheduler(max_batch_tokens=10, token_counter=len)
+        texts = ["aaaa", "bbbb", "cc", "dddddddddddd", "e", "f", "g"]
+        batches = list(scheduler.pack(texts, max_items=2))
+        assert batches == [
+            (0, ["aaaa", "bbbb"]),
+            (2, ["cc"]),
+            (3, ["dddddddddddd"]),
+            (4, ["e", "f"]),
+            (6, ["g"]),
+        ]
+
+    def test_rate_limit_detection(self) -> None:
+        assert is_rate_limit_error(RateLimitError())
+        assert is_rate_limit_error(Exception("429 resource exhausted"))
+        assert not is_rate_limit_error(ValueError("bad input"))
+
+    @pytest.mark.asyncio
+    async def test_caps_in_flight_and_preserves_order(self) -> None:
+        embedder = ScheduledMockEmbedding(dimensions=8, batch_size=3, max_concurrency=2)
+        texts = [f"text {i}" for i in range(50)]
+        vectors = await embedder.aembed(texts)
+        assert vectors == embedder.embed(texts)
+        assert embedder.peak <= 2
+        assert len(embedder.batches) == 17
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_batches(self) -> None:
+        scheduler = EmbeddingScheduler(base_delay=0.001, max_retries=3)
+        embedder = ScheduledMockEmbedding(dimensions=8, batch_size=2, scheduler=scheduler)
+        embedder.failures = {"c": 2}
+        vectors = await embedder.aembed(["a", "b", "c", "d"])
+        assert vectors == embedder.embed(["a", "b", "c", "d"])
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_capped_by_max_delay(self) -> None:
+        class Response:
+            headers = {"retry-after": "3600"}
+
+        calls = 0
+
+        async def embed_batch(batch: list[str]) -> list[list[float]]:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                error = RateLimitError("Too Many Requests")
+                error.response = Response()
+                raise error
+            return [[1.0] for _ in batch]
+
+        scheduler = EmbeddingScheduler(max_delay=0.01)
+        vectors = await asyncio.wait_for(scheduler.run(["a"], embed_batch), timeout=1)
+        assert vectors == [[1.0]]
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self) -> None:
+        scheduler = EmbeddingScheduler(base_delay=0.001, max_retries=1)
+        embedder = ScheduledMockEmbedding(dimensions=8, scheduler=scheduler)
+        embedder.failures = {"a": 5}
+        with pytest.raises(RateLimitError):
+            await embedder.aembed(["a"])
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_batches_in_order(self) -> None:
+        embedder = ScheduledMockEmbedding(dimensions=8, batch_size=4)
+        texts = [f"doc {i}" for i in range(10)]
+        starts = []
+        collected: list[list[float]] = []
+        async for start, vectors in embedder.astream_embed(texts):
+            starts.append(start)
+            collected.extend(vectors)
+        assert starts == [0, 4, 8]
+        assert collected == embedder.embed(texts)
+
+    @pytest.mark.asyncio
+    async def test_shared_scheduler_caps_across_embedders(self) -> None:
+        scheduler = EmbeddingScheduler(max_concurrency=1)
+        a = ScheduledMockEmbedding(dimensions=8, batch_size=1, scheduler=scheduler)
+        b = ScheduledMockEmbedding(dimensions=8, batch_size=1, scheduler=scheduler)
+        in_flight = []
+
+        original = ScheduledMockEmbedding._aembed_batch
+
+        async def tracked(self, texts):
+            in_flight.append(a.in_flight + b.in_flight)
+            return await original(self, texts)
+
+        a._aembed_batch = tracked.__get__(a)
+        b._aembed_batch = tracked.__get__(b)
+        await asyncio.gather(a.aembed(["x", "y", "z"]), b.aembed(["u", "v"]))
+        assert max(in_flight) == 0
@@ -0,0 +1,82 @@
+"""Tests for SubscriptionRouter and the dispatch paths that use it."""
+
+import re
+
+import pytest
+
+from agenticflow.events import Event, EventBus, SubscriptionRouter, matches
+from agenticflow.flow.core import Flow
+
+
+class TestSubscriptionRouter:
+    """Tests for SubscriptionRouter."""
+
+    def test_exact_and_glob_routes(self) -> None:
+        """Exact names and globs resolve to the same routes as matches()."""
+        router: SubscriptionRouter[str] = SubscriptionRouter()
+        patterns = ["task.created", "task.*", "*.done", "agent.**", "agent.*.done"]
+        for pattern in patterns:
+            router.add(pattern, pattern)
+
+        for name in ["task.created", "task.x.y", "agent.done", "agent.a.done", "other"]:
+            expected = tuple(p for p in patterns if matches(p, name))
+            assert router.match(name) == expected
+
+    def test_regex_route(self) -> None:
+        """Compiled regex patterns are supported."""
+        router: SubscriptionRouter[str] = SubscriptionRouter()
+        router.add("r", re.compile(r"agent\..*\.done"))
+
+        assert router.match("agent.writer.done") == ("r",)
+        assert router.match("agent.writer") == ()
+
+    def test_multi_pattern_route_matches_once(self) -> None:
+        """A route with several matching patterns is returned once, in add order."""
+        router: SubscriptionRouter[str] = SubscriptionRouter()
+        router.add("first", "task.done")
+        router.add("second", ["task.*", "task.done"])
+
+        assert router.match("task.done") == ("first", "second")
+
+    def test_remove_invalidates_cache(self) -> None:
+        """Removing a route drops it from memoized results."""
+        router: SubscriptionRouter[str] = SubscriptionRouter()
+        route_id = router.add("a", "task.*")
+        router.add("b", "task.created")
+
+        assert router.match("task.created") == ("a", "b")
+        router.remove(route_id)
+        assert router.match("task.created") == ("b",)
+        assert len(router) == 1
+
+
+class TestRoutedDispatch:
+    """EventBus and Flow dispatch through the router."""
+
+    @pytest.mark.asyncio
+    async def test_event_bus_glob_and_unsubscribe(self) -> None:
+        """EventBus globs still match across segments and honor unsubscribe."""
+        bus = EventBus()
+        seen: list[str] = []
+
+        def handler(event: Event) -> None:
+            seen.append(event.name)
+
+        bus.subscribe("agent.*", handler)
+        await bus.publish("agent.writer.done")
+        bus.unsubscribe("agent.*", handler)
+        await bus.publish("agent.writer.done")
+
+        assert seen == ["agent.writer.done"]
+
+    def test_flow_bindings_follow_priority(self) -> None:
+        """Flow returns matching bindings in priority order, after new registrations."""
+        flow = Flow()
+        flow.register(lambda e: None, on="task.*", name="low")
+        assert [b.reactor_id for b in flow._find_matching_bindings(Event(name="task.created"))] == ["low"]
+
+        flow.register(lambda e: None, on=["task.created", "task.?reated"], name="high", priority=5)
+        flow.register(lambda e: None, on="task.created", name="skipped", when=lambda e: False)
+
+        bindings = flow._find_matching_bindings(Event(name="task.created"))
+        assert [b.reactor_id for b in bindings] == ["high", "low"]
@@ -1,5 +1,6 @@
 """Tests for event store implementations."""
 
+import json
 import pytest
 import tempfile
 from pathlib import Path
@@ -172,3 +173,84 @@ class TestFileEventStore:
 
             assert len(events) == 1
             assert events[0].name == "e1"
+
+    @pytest.mark.asyncio
+    async def test_after_before_and_replay(self) -> None:
+        """Range queries seek via the offset index and match InMemoryEventStore."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = FileEventStore(base_dir=tmpdir)
+            events = [Event(name=f"e{i}", source="test") for i in range(6)]
+            for event in events:
+                await store.append(event, flow_id="flow-1")
+
+            after = await store.get_events("flow-1", after=events[1].id, before=events[4].id)
+            assert [e.name for e in after] == ["e2", "e3"]
+
+            limited = await store.get_events("flow-1", after=events[0].id, limit=2)
+            assert [e.name for e in limited] == ["e1", "e2"]
+
+            assert await store.get_events("flow-1", after="missing") == []
+
+            replayed = await store.replay("flow-1", to_event_id=events[2].id)
+            assert [e.name for e in replayed] == ["e0", "e1", "e2"]
+
+            streamed = [e.name async for e in store.stream_events("flow-1")]
+            assert streamed == [e.name for e in events]
+            store.close()
+
+    @pytest.mark.asyncio
+    async def test_index_rebuilt_for_legacy_segment(self) -> None:
+        """Segments without an index (or with a torn tail) are indexed on read."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            events = [Event(name=f"e{i}", source="test") for i in range(3)]
+            path = Path(tmpdir) / "flow-1.jsonl"
+            lines = [json.dumps(e.to_dict()) + "\n" for e in events]
+            path.write_text("".join(lines) + '{"partial')
+
+            store = FileEventStore(base_dir=tmpdir)
+            after = await store.get_events("flow-1", after=events[0].id)
+            assert [e.name for e in after] == ["e1", "e2"]
+            assert (Path(tmpdir) / "flow-1.idx").exists()
+
+            await store.append(Event(name="e3", source="test"), flow_id="flow-1")
+            store.close()
+
+            reopened = FileEventStore(base_dir=tmpdir)
+            names = [e.name for e in await reopened.get_events("flow-1")]
+            assert names == ["e0", "e1", "e2", "e3"]
+
+    @pytest.mark.asyncio
+    async def test_flow_ids_from_manifest(self) -> None:
+        """Flow IDs come back most recently written first, across instances."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = FileEventStore(base_dir=tmpdir, fsync_every=1)
+            for flow_id in ["a", "b", "c", "a"]:
+                await store.append(Event(name="e", source="test"), flow_id=flow_id)
+
+            assert await store.get_flow_ids() == ["a", "c", "b"]
+            assert await store.get_flow_ids(limit=1) == ["a"]
+
+            other = FileEventStore(base_dir=tmpdir)
+            await other.append(Event(name="e", source="test"), flow_id="b")
+            assert await store.get_flow_ids() == ["b", "a", "c"]
+            store.close()
+            other.close()
+
+    @pytest.mark.asyncio
+    async def test_manifest_stays_compact_with_interleaved_flows(self) -> None:
+        """Alternating writes to two flows don't grow the manifest per append."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = FileEventStore(base_dir=tmpdir)
+            reader = FileEventStore(base_dir=tmpdir)
+            for i in range(2000):
+                flow_id = "a" if i % 2 else "b"
+                await store.append(Event(name="e", source="test"), flow_id=flow_id)
+                if i % 500 == 0:
+                    await reader.get_flow_ids()
+
+            manifest = (Path(tmpdir) / ".manifest").read_text().splitlines()
+            assert len(manifest) <= 2 * 2 + 64
+            assert await store.get_flow_ids() == ["a", "b"]
+            assert await reader.get_flow_ids() == ["a", "b"]
+            assert await FileEventStore(base_dir=tmpdir).get_flow_ids() == ["a", "b"]
+            store.close()
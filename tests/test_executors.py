@@ -173,6 +173,39 @@ class TestNativeExecutor:
         assert executor.agent == mock_agent
         assert executor.max_iterations == 10
 
+    @pytest.mark.asyncio
+    async def test_cached_tool_runs_once(self, mock_agent: MagicMock) -> None:
+        """Test identical calls to a cached tool share one execution."""
+        from agenticflow.tools import tool
+
+        calls = 0
+
+        @tool(cache=True)
+        async def lookup(key: str, scope: str) -> str:
+            """Look up a key."""
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return f"{scope}/{key}"
+
+        mock_agent.all_tools = [lookup]
+        mock_agent.event_bus = MagicMock(publish=AsyncMock())
+        executor = NativeExecutor(mock_agent)
+
+        results = await executor._execute_tools_parallel([
+            {"name": "lookup", "args": {"key": "a", "scope": "s"}, "id": "1"},
+            {"name": "lookup", "args": {"scope": "s", "key": "a"}, "id": "2"},
+        ])
+        again = await executor._execute_tools_parallel([
+            {"name": "lookup", "args": {"key": "a", "scope": "s"}, "id": "3"},
+        ])
+
+        assert calls == 1
+        assert [m.content for m in results + again] == ["s/a"] * 3
+        published = [c.args[0] for c in mock_agent.event_bus.publish.call_args_list]
+        assert published.count("tool.cache.miss") == 1
+        assert published.count("tool.cache.hit") == 2
+
 
 class TestSequentialExecutor:
     """Tests for SequentialExecutor."""
@@ -300,6 +333,24 @@ class TestSearchNode:
         # Values should be updated
         assert grandchild.value == 0.8  # First visit, takes the value directly
 
+    def test_virtual_loss(self) -> None:
+        """In-flight rollouts lower a node's score until reverted."""
+        root = SearchNode(id="root", visits=10)
+        child = SearchNode(id="child", parent=root, value=0.7, visits=5)
+        fresh = SearchNode(id="fresh", parent=root)
+        score = child.ucb1_score()
+
+        child.add_virtual_loss()
+        fresh.add_virtual_loss()
+        assert root.pending == 2
+        assert child.ucb1_score() < score
+        assert fresh.ucb1_score() != float("inf")
+
+        child.revert_virtual_loss()
+        fresh.revert_virtual_loss()
+        assert root.pending == 0
+        assert child.ucb1_score() == score
+
     def test_get_path(self) -> None:
         """Test path from root to node."""
         root = SearchNode(id="root")
@@ -438,3 +489,89 @@ TOOL: process({"data": "input"})
         
         assert "search" in formatted
         assert "Found result" in formatted
+
+    @pytest.mark.asyncio
+    async def test_concurrent_children(self, mock_agent: MagicMock) -> None:
+        """Siblings are simulated in parallel up to max_concurrency."""
+        in_flight = peak = 0
+
+        async def act(tool_name: str, args: dict[str, Any]) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"result {args['q']}"
+
+        async def think(prompt: str, **kwargs: Any) -> str:
+            if "possible next actions" in prompt:
+                return "\n".join(
+                    f'ACTION {i}:\nTOOL: search({{"q": {i}}})' for i in range(1, 4)
+                )
+            if "Rate the progress" in prompt:
+                return "0.6"
+            return "best effort"
+
+        mock_agent.act = AsyncMock(side_effect=act)
+        mock_agent.think = AsyncMock(side_effect=think)
+
+        executor = TreeSearchExecutor(mock_agent)
+        executor.max_iterations = 1
+        executor.max_concurrency = 3
+        assert await executor.execute("task") == "best effort"
+        assert peak == 3
+
+        executor.max_concurrency = 1
+        peak = 0
+        await executor.execute("task")
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_evaluation(self, mock_agent: MagicMock) -> None:
+        """One call scores all siblings; unscored ones fall back."""
+        root = SearchNode(id="root", action={"type": "root"})
+        nodes = [
+            SearchNode(
+                id=f"c{i}",
+                parent=root,
+                action={"type": "tool_call", "tool": "search", "args": {"q": i}},
+                observation=f"result {i}",
+            )
+            for i in range(3)
+        ]
+        mock_agent.think = AsyncMock(side_effect=["1: 0.9\n2: 0.2", "0.5"])
+
+        executor = TreeSearchExecutor(mock_agent)
+        values = await executor._evaluate_batch(nodes, "task")
+
+        assert values == [0.9, 0.2, 0.5]
+        assert mock_agent.think.await_count == 2
+        assert "CANDIDATE 3" in mock_agent.think.await_args_list[0].args[0]
+
+    @pytest.mark.asyncio
+    async def test_parallel_rollouts_spread_over_branches(
+        self, mock_agent: MagicMock
+    ) -> None:
+        """Virtual loss makes concurrent rollouts expand different nodes."""
+        expanded: list[str] = []
+        executor = TreeSearchExecutor(mock_agent)
+        executor.max_iterations = 2
+        executor.parallel_rollouts = 2
+
+        async def expand(node: SearchNode, *args: Any) -> list[SearchNode]:
+            expanded.append(node.id)
+            assert root.pending == 2  # Both rollouts are in flight together
+            return []
+
+        root = SearchNode(id="root", visits=2, state=NodeState.EXPANDED)
+        root.children = [
+            SearchNode(id=f"c{i}", parent=root, value=0.5, visits=1) for i in range(2)
+        ]
+        mock_agent.think = AsyncMock(return_value="best effort")
+
+        with patch.object(executor, "_expand", side_effect=expand), \
+                patch("agenticflow.executors.tree_search.SearchNode", return_value=root):
+            await executor.execute("task")
+
+        assert sorted(expanded) == ["c0", "c1"]
+        assert all(child.pending == 0 for child in root.children)
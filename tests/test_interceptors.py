@@ -10,6 +10,8 @@ from agenticflow.interceptors.base import (
     Interceptor,
     InterceptContext,
     InterceptResult,
+    MessageLog,
+    MessageView,
     Phase,
     StopExecution,
     run_interceptors,
@@ -22,6 +24,7 @@ from agenticflow.interceptors.budget import (
 from agenticflow.interceptors.context import (
     ContextCompressor,
     TokenLimiter,
+    _estimate_message_tokens,
     _estimate_tokens,
     _messages_to_text,
 )
@@ -125,6 +128,64 @@ class TestInterceptContext:
         assert state["counter"] == 1  # Same dict
 
 
+class TestMessageView:
+    """Test shared, copy-on-write message views."""
+
+    def test_views_share_converted_dicts(self):
+        from agenticflow.core.messages import AIMessage, HumanMessage, SystemMessage
+
+        messages = [SystemMessage(content="sys"), HumanMessage(content="hi")]
+        log = MessageLog(messages)
+        first = log.view()
+        messages.append(AIMessage(content="hello"))
+        second = log.view()
+
+        assert len(first) == 2  # Fixed at creation time
+        assert second == [
+            {"role": "system", "content": "sys"},
+            {"role": "user", "content": "hi"},
+            {"role": "assistant", "content": "hello"},
+        ]
+        assert second[0] is first[0]
+        assert second[-1]["content"] == "hello"
+        assert second[1:] == [second[1], second[2]]
+
+    def test_copy_on_write(self):
+        from agenticflow.core.messages import HumanMessage, SystemMessage
+
+        messages = [HumanMessage(content="a")]
+        log = MessageLog(messages)
+        view = log.view()
+        sibling = log.view()
+        assert isinstance(view, MessageView)
+        view.append({"role": "user", "content": "local"})
+
+        assert len(view) == 2
+        assert len(log.view()) == 1  # Shared log untouched
+
+        sibling[0] = {"role": "user", "content": "edited"}
+        del view[0]
+        assert view == [{"role": "user", "content": "local"}]
+        assert sibling == [{"role": "user", "content": "edited"}]
+        assert log.view() == [{"role": "user", "content": "a"}]
+
+        messages[0] = SystemMessage(content="replaced")
+        log.reset()
+        assert log.view()[0] == {"role": "system", "content": "replaced"}
+
+    def test_token_estimate_matches_text(self):
+        from agenticflow.core.messages import AIMessage, HumanMessage
+
+        messages = [HumanMessage(content="x" * 37)]
+        log = MessageLog(messages)
+        for i in range(5):
+            messages.append(AIMessage(content="y" * (i * 11)))
+            view = log.view()
+            expected = _estimate_tokens(_messages_to_text(list(view)))
+            assert _estimate_message_tokens(view) == expected
+            assert _estimate_message_tokens(list(view)) == expected
+
+
 # =============================================================================
 # Test Phase Enum
 # =============================================================================
@@ -234,6 +234,49 @@ class TestMemoryWithCustomStore:
         assert await shared_store.get("m2:key") == "from m2"
 
 
+class TestMessageHistory:
+    """Tests for conversation history on the store's message log."""
+
+    @pytest.mark.asyncio
+    async def test_add_and_get_tail(self) -> None:
+        from agenticflow.core.messages import AIMessage, HumanMessage
+
+        memory = Memory()
+        await memory.add_messages([HumanMessage("hi"), AIMessage("hello")])
+        await memory.add_message(HumanMessage("bye"))
+
+        assert [m.content for m in await memory.get_messages()] == ["hi", "hello", "bye"]
+        assert [m.content for m in await memory.get_messages(limit=2)] == ["hello", "bye"]
+
+        await memory.trim_messages(1)
+        assert [m.content for m in await memory.get_messages()] == ["bye"]
+
+    @pytest.mark.asyncio
+    async def test_thread_messages_and_store_without_log_ops(self) -> None:
+        from agenticflow.core.messages import HumanMessage
+
+        class PlainStore:
+            """Key-value only store (no log operations)."""
+
+            def __init__(self) -> None:
+                self._inner = InMemoryStore()
+
+            async def get(self, key: str):
+                return await self._inner.get(key)
+
+            async def set(self, key: str, value, ttl: int | None = None) -> None:
+                await self._inner.set(key, value, ttl=ttl)
+
+        for store in (InMemoryStore(), PlainStore()):
+            memory = Memory(store=store)
+            await memory.add_thread_messages("t1", [HumanMessage("a"), HumanMessage("b")])
+            await memory.add_thread_message("t1", HumanMessage("c"))
+
+            messages = await memory.get_thread_messages("t1", limit=2)
+            assert [m.content for m in messages] == ["b", "c"]
+            assert await memory.get_thread_messages("t2") == []
+
+
 class TestMemoryTools:
     """Tests for memory tools integration."""
 
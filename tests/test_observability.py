@@ -13,6 +13,7 @@ from agenticflow.observability import (
     Counter,
     Gauge,
     Histogram,
+    QuantileSketch,
     Timer,
     ObservabilityLogger,
     LogLevel,
@@ -171,6 +172,57 @@ class TestMetrics:
         assert timer.histogram.count == 1
         assert timer.histogram.mean >= 10
 
+    def test_streaming_histogram_matches_exact(self):
+        """Test streaming histogram stays within sketch accuracy."""
+        exact = Histogram("latency")
+        streaming = Histogram("latency", streaming=True)
+        for i in range(1, 10001):
+            exact.observe(i)
+            streaming.observe(i)
+
+        assert streaming._values == []
+        assert streaming.count == exact.count
+        assert streaming.sum == exact.sum
+        assert streaming.mean == pytest.approx(exact.mean)
+        assert streaming.stddev == pytest.approx(exact.stddev)
+        assert streaming.get_buckets() == exact.get_buckets()
+        for p in (1, 50, 95, 99):
+            assert streaming.percentile(p) == pytest.approx(exact.percentile(p), rel=0.01)
+        assert streaming.percentile(100) == 10000
+
+    def test_streaming_histogram_merge(self):
+        """Test merging per-worker histograms equals one histogram."""
+        combined = Histogram("latency", streaming=True)
+        workers = [Histogram("latency", streaming=True) for _ in range(4)]
+        for i in range(1000):
+            workers[i % 4].observe(i - 100)
+            combined.observe(i - 100)
+
+        merged = Histogram("latency", streaming=True)
+        for worker in workers:
+            merged.merge(worker)
+
+        assert merged.count == combined.count
+        assert merged.min == -100 and merged.max == 899
+        assert merged.stddev == pytest.approx(combined.stddev)
+        assert merged.percentile(90) == combined.percentile(90)
+        assert merged.get_buckets() == combined.get_buckets()
+
+        with pytest.raises(ValueError):
+            Histogram("latency").merge(merged)
+        with pytest.raises(ValueError):
+            merged.merge(Histogram("latency", buckets=[1, 2]))
+
+    def test_quantile_sketch_bounded_bins(self):
+        """Test sketch collapses low buckets past its bin limit."""
+        sketch = QuantileSketch(relative_accuracy=0.01, max_bins=64)
+        for i in range(1, 100001):
+            sketch.add(float(i))
+
+        assert len(sketch._positive) <= 64
+        assert sketch.count == 100000
+        assert sketch.quantile(0.99) == pytest.approx(99000, rel=0.01)
+
 
 class TestMetricsCollector:
     """Tests for MetricsCollector."""
@@ -197,6 +249,32 @@ class TestMetricsCollector:
         assert snapshot["gauges"]["connections"] == 50
         assert snapshot["histograms"]["latency"]["count"] == 1
 
+    def test_prometheus_exposition(self):
+        """Test Prometheus text format output."""
+        collector = MetricsCollector(streaming=True)
+        collector.counter("requests_total", "Total requests").inc(3, {"method": "GET"})
+        collector.gauge("active.agents").set(2)
+        hist = collector.histogram("latency", buckets=[10, 100])
+        for value in (5, 50, 500):
+            hist.observe(value)
+        collector.timer("llm_call").record(12.5)
+
+        text = collector.export_prometheus()
+
+        assert hist.streaming
+        assert "# HELP requests_total Total requests" in text
+        assert "# TYPE requests_total counter" in text
+        assert 'requests_total{method="GET"} 3' in text
+        assert "active_agents 2" in text
+        assert 'latency_bucket{le="10"} 1' in text
+        assert 'latency_bucket{le="100"} 2' in text
+        assert 'latency_bucket{le="+Inf"} 3' in text
+        assert "latency_sum 555" in text
+        assert "latency_count 3" in text
+        assert 'latency_quantile{quantile="0.5"}' in text
+        assert "llm_call_ms_count 1" in text
+        assert text.endswith("\n")
+
 
 class TestObservabilityLogger:
     """Tests for ObservabilityLogger."""
@@ -338,6 +416,42 @@ class TestObserver:
         obs = Observer.tools_only()
         assert Channel.TOOLS in obs.config.channels
 
+    def test_production_bounded_history(self):
+        """Test production preset keeps a bounded ring but counts every event."""
+        from agenticflow.observability import Observer, ObservabilityLevel, Channel
+        from agenticflow.observability.trace_record import Trace, TraceType
+
+        obs = Observer.production(max_events=10)
+        assert obs.config.level == ObservabilityLevel.OFF
+
+        for i in range(25):
+            obs._handle_event(Trace(type=TraceType.TOOL_CALLED, data={"tool": f"t{i}"}))
+
+        assert len(obs.events()) == 10
+        assert obs.events(limit=3)[-1].data["tool"] == "t24"
+        metrics = obs.metrics()
+        assert metrics["total_events"] == 25
+        assert metrics["by_channel"] == {Channel.TOOLS.value: 25}
+
+    def test_trace_links_previous_completed_agent(self):
+        """Test agent graph edges come from the latest-created completed agent."""
+        from agenticflow.observability import Observer
+        from agenticflow.observability.trace_record import Trace, TraceType
+
+        obs = Observer.off()
+
+        def send(event_type, agent):
+            obs._handle_event(Trace(type=event_type, data={"agent_name": agent}))
+
+        send(TraceType.AGENT_INVOKED, "A")
+        send(TraceType.AGENT_INVOKED, "B")
+        send(TraceType.AGENT_RESPONDED, "B")
+        send(TraceType.AGENT_RESPONDED, "A")
+        send(TraceType.AGENT_INVOKED, "C")
+
+        ids = {node["name"]: node_id for node_id, node in obs._nodes.items()}
+        assert obs._edges == [(ids["B"], ids["C"], "→")]
+
     def test_custom_channels(self):
         """Test observer with custom channels."""
         from agenticflow.observability import Observer, ObservabilityLevel, Channel
@@ -0,0 +1,142 @@
+"""Tests for pipelined EventFlow execution."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from agenticflow.reactive import (
+    EventFlow,
+    EventFlowConfig,
+    react_to,
+)
+
+
+class _ReactingAgent:
+    """Agent stub that logs start/end of each reaction."""
+
+    def __init__(self, name: str, log: list[str], delay: float = 0.0) -> None:
+        self.name = name
+        self.log = log
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+
+    async def react(self, event, *, task, context, thread_id=None) -> str:
+        label = event.data.get("label", event.name)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.log.append(f"start {label}")
+        await asyncio.sleep(event.data.get("delay", self.delay))
+        self.log.append(f"end {label}")
+        self.active -= 1
+        return f"{self.name}: {label}"
+
+
+class TestPipelinedFlow:
+    """Tests for pipelined EventFlow execution."""
+
+    @pytest.mark.asyncio
+    async def test_slow_agent_does_not_block_other_events(self) -> None:
+        """Events triggered while a slow agent runs are processed right away."""
+        log: list[str] = []
+        flow = EventFlow(config=EventFlowConfig(pipelined=True, event_timeout=0.05))
+        flow.register(_ReactingAgent("slow", log, delay=0.2), [react_to("task.created")])
+        flow.register(_ReactingAgent("starter", log), [react_to("task.created")])
+        flow.register(_ReactingAgent("fast", log), [react_to("starter.completed")])
+
+        result = await flow.run("Task", initial_event="task.created")
+
+        # The slow agent finishes last, after the follow-up event completed
+        assert log[-1] == "end task.created"
+        assert log.index("end starter.completed") < len(log) - 1
+        assert len(result.reactions) == 3
+        assert {r.agent_name for r in result.reactions} == {"slow", "starter", "fast"}
+
+    @pytest.mark.asyncio
+    async def test_thread_order_and_global_worker_limit(self) -> None:
+        """Events of one thread run in order; the worker pool is flow-wide."""
+        log: list[str] = []
+        worker = _ReactingAgent("worker", log)
+        flow = EventFlow(
+            config=EventFlowConfig(pipelined=True, max_concurrent_agents=2, event_timeout=0.05)
+        ).thread_by_data("job")
+        flow.register(worker, [react_to("job.step")])
+
+        for job, n, delay in [("a", 1, 0.06), ("a", 2, 0.0), ("b", 1, 0.02), ("c", 1, 0.02)]:
+            await flow.emit("job.step", {"job": job, "label": f"{job}{n}", "delay": delay})
+        result = await flow.run("Jobs", initial_event="jobs.started")
+
+        assert log.index("end a1") < log.index("start a2")
+        assert log.index("start b1") < log.index("end a1")
+        assert worker.peak == 2
+        assert len(result.reactions) == 4
+        assert result.output == "worker: a2"
+
+    @pytest.mark.asyncio
+    async def test_emit_waits_for_queue_space(self) -> None:
+        """A running flow only dequeues for free workers, so emit() blocks."""
+        log: list[str] = []
+        worker = _ReactingAgent("worker", log, delay=0.02)
+        flow = EventFlow(
+            config=EventFlowConfig(
+                pipelined=True,
+                max_concurrent_agents=1,
+                max_pending_events=2,
+                event_timeout=0.2,
+            )
+        )
+        flow.register(worker, [react_to("job.step")])
+        started_when_done = -1
+
+        async def produce() -> None:
+            nonlocal started_when_done
+            await flow.emit("job.step", {"label": "first"})
+            while not flow.is_running:
+                await asyncio.sleep(0.001)
+            for i in range(8):
+                await flow.emit("job.step", {"label": f"s{i}"})
+                assert flow._pending_events.qsize() <= 2
+            started_when_done = sum(entry.startswith("start") for entry in log)
+
+        result, _ = await asyncio.gather(
+            flow.run("Jobs", initial_event="jobs.started"), produce()
+        )
+
+        # At most two events queued plus one being worked on
+        assert started_when_done >= 9 - 3
+        assert [r.output for r in result.reactions] == [
+            "worker: first", *(f"worker: s{i}" for i in range(8))
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stop_event_lets_dispatched_agents_finish(self) -> None:
+        """A stop event ends intake; agents of earlier events still complete."""
+        log: list[str] = []
+        flow = EventFlow(
+            config=EventFlowConfig(
+                pipelined=True,
+                event_timeout=0.05,
+                stop_events=frozenset({"starter.completed"}),
+            )
+        )
+        flow.register(_ReactingAgent("slow", log, delay=0.1), [react_to("slow.go")])
+        flow.register(_ReactingAgent("starter", log), [react_to("task.created")])
+
+        await flow.emit("slow.go")
+        result = await flow.run("Task", initial_event="task.created")
+
+        assert log[-1] == "end slow.go"
+        assert {r.agent_name for r in result.reactions} == {"slow", "starter"}
+        assert all(r.error is None for r in result.reactions)
+
+    @pytest.mark.asyncio
+    async def test_emit_does_not_wait_when_flow_is_not_running(self) -> None:
+        """Backpressure only applies while the flow runs."""
+        flow = EventFlow(config=EventFlowConfig(pipelined=True, max_pending_events=1))
+
+        await flow.emit("first")
+        await asyncio.wait_for(flow.emit("second"), timeout=1)
+
+        assert flow._pending_events.qsize() == 2
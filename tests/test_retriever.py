@@ -275,6 +275,50 @@ class TestDocumentLoader:
         assert "CUSTOM:" in docs[0].text
 
 
+    @pytest.mark.asyncio
+    async def test_aiter_directory_process_pool(self, temp_dir: Path) -> None:
+        """Files are loaded and split in worker processes and streamed."""
+        from agenticflow.document.splitters import CharacterSplitter
+
+        for i in range(6):
+            (temp_dir / f"file{i}.txt").write_text(f"part a{i}\n\npart b{i}")
+        (temp_dir / "skip.txt").write_text("excluded")
+
+        loader = DocumentLoader()
+        splitter = CharacterSplitter(chunk_size=10, chunk_overlap=0)
+        chunks = [
+            doc async for doc in loader.aiter_directory(
+                temp_dir, glob="*.txt", exclude=["skip"], splitter=splitter, max_workers=2,
+            )
+        ]
+
+        assert sorted(c.text for c in chunks) == sorted(
+            f"part {p}{i}" for i in range(6) for p in "ab"
+        )
+        assert all(c.metadata["filename"].startswith("file") for c in chunks)
+
+    @pytest.mark.asyncio
+    async def test_aiter_batches_with_thread_only_loader(self, temp_dir: Path) -> None:
+        """Unpicklable loaders fall back to threads; batches are bounded."""
+        for i in range(5):
+            (temp_dir / f"f{i}.local").write_text(str(i))
+        (temp_dir / "broken.local").write_text("x")
+
+        def local_loader(path: Path) -> list[Document]:
+            if path.stem == "broken":
+                raise ValueError("unparseable")
+            return [Document(text=path.read_text(), metadata={"source": str(path)})]
+
+        loader = DocumentLoader()
+        loader.register_loader(".local", local_loader)
+        batches = [
+            batch async for batch in loader.aiter_batches(temp_dir, batch_size=2, max_workers=2)
+        ]
+
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert sorted(d.text for b in batches for d in b) == ["0", "1", "2", "3", "4"]
+
+
 class TestLoadDocuments:
     """Tests for load_documents convenience function."""
 
@@ -963,6 +1007,50 @@ class TestDenseRetriever:
         assert all(r.retriever_name == "dense" for r in results)
 
 
+# ============================================================================
+# Test TF-IDF Retriever
+# ============================================================================
+
+
+class TestTFIDFRetriever:
+    """Tests for TFIDFRetriever (sparse retrieval)."""
+
+    @pytest.mark.asyncio
+    async def test_matrix_and_python_modes_agree(
+        self, sample_documents: list[Document]
+    ) -> None:
+        """Test that the CSR matrix mode matches the pure-Python fallback."""
+        pytest.importorskip("numpy")
+        from agenticflow.retriever.sparse import TFIDFRetriever
+
+        matrix = TFIDFRetriever(sample_documents, use_matrix=True)
+        python = TFIDFRetriever(sample_documents, use_matrix=False)
+
+        for query in ["Python programming language", "machine learning", "nothing here"]:
+            a = await matrix.retrieve_with_scores(query, k=5)
+            b = await python.retrieve_with_scores(query, k=5)
+            assert [r.document.text for r in a] == [r.document.text for r in b]
+            assert [r.score for r in a] == pytest.approx([r.score for r in b])
+
+    @pytest.mark.asyncio
+    async def test_incremental_add_refits_idf(
+        self, sample_documents: list[Document]
+    ) -> None:
+        """Test that adding documents later scores like a single bulk build."""
+        from agenticflow.retriever.sparse import TFIDFRetriever
+
+        bulk = TFIDFRetriever(sample_documents)
+        incremental = TFIDFRetriever(sample_documents[:2])
+        await incremental.retrieve_with_scores("Python")
+        incremental.add_documents(sample_documents[2:])
+
+        a = await bulk.retrieve_with_scores("Python programming", k=5)
+        b = await incremental.retrieve_with_scores("Python programming", k=5)
+        assert [r.document.text for r in a] == [r.document.text for r in b]
+        assert [r.score for r in a] == pytest.approx([r.score for r in b])
+        assert all(0 < r.score <= 1.0 + 1e-9 for r in a)
+
+
 # ============================================================================
 # Test BM25 Retriever
 # ============================================================================
@@ -1033,6 +1121,52 @@ class TestBM25Retriever:
         texts = [r.text.lower() for r in results]
         assert any("python" in t for t in texts)
     
+    def test_bm25_index_incremental_matches_bulk(self) -> None:
+        """Test that incremental adds score identically to a bulk build."""
+        import math
+        from collections import Counter
+
+        from agenticflow.retriever.sparse import BM25Index
+
+        docs = [
+            Document(text="python python code", metadata={"lang": "py"}),
+            Document(text="rust code is fast", metadata={"lang": "rs"}),
+            Document(text="python is readable and python is popular", metadata={"lang": "py"}),
+            Document(text="the quick brown fox"),
+        ]
+        bulk = BM25Index()
+        bulk.add_documents(docs)
+        incremental = BM25Index()
+        for doc in docs:
+            incremental.add_documents([doc])
+
+        assert bulk.search("python code", k=4) == incremental.search("python code", k=4)
+
+        # Reference Okapi BM25 score for the top document
+        tokenized = [bulk._tokenize(d.text) for d in docs]
+        avg = sum(map(len, tokenized)) / len(tokenized)
+
+        def reference(query: list[str], tokens: list[str]) -> float:
+            tfs = Counter(tokens)
+            score = 0.0
+            for term in query:
+                df = sum(1 for t in tokenized if term in t)
+                if not df:
+                    continue
+                idf = math.log((len(docs) - df + 0.5) / (df + 0.5) + 1)
+                tf = tfs[term]
+                score += idf * tf * 2.5 / (tf + 1.5 * (0.25 + 0.75 * len(tokens) / avg))
+            return score
+
+        results = bulk.search("python code", k=4)
+        expected = sorted(
+            (reference(["python", "code"], t) for t in tokenized), reverse=True
+        )
+        assert [s for _, s in results] == pytest.approx([e for e in expected if e > 0])
+
+        filtered = bulk.search("python code", k=4, filter={"lang": "rs"})
+        assert [d.text for d, _ in filtered] == ["rust code is fast"]
+
     @pytest.mark.asyncio
     async def test_bm25_as_tool_with_keywords(self, sample_documents: list[Document]) -> None:
         """Test BM25 as_tool() exposes keywords parameter."""
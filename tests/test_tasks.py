@@ -151,6 +151,75 @@ class TestTaskManager:
         assert ready[1].name == "Normal"
         assert ready[2].name == "Low"
 
+    async def test_get_ready_tasks_missing_dependency(
+        self, task_manager: TaskManager
+    ) -> None:
+        dep = await task_manager.create_task(name="Dep")
+        await task_manager.create_task(name="Task", depends_on=[dep.id, "missing"])
+
+        await task_manager.update_status(dep.id, TaskStatus.COMPLETED)
+
+        assert await task_manager.get_ready_tasks() == []
+
+    async def test_add_dependency(self, task_manager: TaskManager) -> None:
+        task_a = await task_manager.create_task(name="A")
+        task_b = await task_manager.create_task(name="B")
+
+        await task_manager.add_dependency(task_b.id, task_a.id)
+        await task_manager.add_dependency(task_b.id, task_a.id)  # No-op
+
+        assert task_b.depends_on == [task_a.id]
+        assert [t.name for t in await task_manager.get_ready_tasks()] == ["A"]
+
+        await task_manager.update_status(task_a.id, TaskStatus.COMPLETED)
+        assert [t.name for t in await task_manager.get_ready_tasks()] == ["B"]
+
+        # Depending on a completed task leaves the task ready
+        await task_manager.add_dependency(task_b.id, task_a.id)
+        task_c = await task_manager.create_task(name="C")
+        await task_manager.add_dependency(task_c.id, task_a.id)
+        assert [t.name for t in await task_manager.get_ready_tasks()] == ["B", "C"]
+
+        with pytest.raises(ValueError):
+            await task_manager.add_dependency("missing", task_a.id)
+
+    async def test_get_next_ready_task(self, task_manager: TaskManager) -> None:
+        assert await task_manager.get_next_ready_task() is None
+
+        first = await task_manager.create_task(name="First")
+        high = await task_manager.create_task(name="High", priority=Priority.HIGH)
+        second = await task_manager.create_task(name="Second")
+        assert await task_manager.get_next_ready_task() is high
+
+        await task_manager.update_status(high.id, TaskStatus.RUNNING)
+        assert await task_manager.get_next_ready_task() is first
+
+        await task_manager.update_status(first.id, TaskStatus.FAILED, error="boom")
+        assert await task_manager.get_next_ready_task() is second
+
+        # A retried task is ready again and keeps its creation order
+        await task_manager.retry_task(first.id)
+        assert await task_manager.get_next_ready_task() is first
+
+    async def test_get_tasks_by_status_and_agent(
+        self, task_manager: TaskManager
+    ) -> None:
+        task1 = await task_manager.create_task(name="Task 1")
+        task2 = await task_manager.create_task(name="Task 2")
+
+        await task_manager.assign_task(task2.id, "agent-a")
+        await task_manager.assign_task(task1.id, "agent-a")
+        await task_manager.update_status(task1.id, TaskStatus.COMPLETED)
+
+        assert await task_manager.get_tasks_by_agent("agent-a") == [task1, task2]
+        assert await task_manager.get_tasks_by_status(TaskStatus.SCHEDULED) == [task2]
+        assert await task_manager.get_tasks_by_status(TaskStatus.COMPLETED) == [task1]
+        assert await task_manager.get_tasks_by_status(TaskStatus.PENDING) == []
+
+        await task_manager.clear()
+        assert await task_manager.get_tasks_by_agent("agent-a") == []
+        assert await task_manager.get_ready_tasks() == []
+
     async def test_retry_task(self, task_manager: TaskManager) -> None:
         task = await task_manager.create_task(name="Test", max_retries=2)
         await task_manager.update_status(
@@ -0,0 +1,102 @@
+"""
+Tests for tool result caching.
+"""
+
+import asyncio
+
+import pytest
+
+from agenticflow.memory import InMemoryStore
+from agenticflow.tools import ToolCache, tool
+
+
+class TestToolCache:
+    """Tests for ToolCache."""
+
+    def test_key_is_canonical_per_tool(self) -> None:
+        key = ToolCache.make_key("search", {"a": 1, "b": [1, 2]})
+        assert key == ToolCache.make_key("search", {"b": [1, 2], "a": 1})
+        assert key != ToolCache.make_key("fetch", {"a": 1, "b": [1, 2]})
+        assert key != ToolCache.make_key("search", {"a": 2, "b": [1, 2]})
+
+    @pytest.mark.asyncio
+    async def test_lru_and_ttl(self) -> None:
+        cache = ToolCache(max_size=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")  # a is now most recent
+        await cache.set("c", 3)
+
+        assert await cache.get("a") == (True, 1)
+        assert await cache.get("b") == (False, None)
+
+        expiring = ToolCache(ttl=0.01)
+        await expiring.set("k", "v")
+        assert await expiring.get("k") == (True, "v")
+        await asyncio.sleep(0.02)
+        assert await expiring.get("k") == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_single_flight(self) -> None:
+        cache = ToolCache()
+        calls = 0
+
+        async def slow() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(
+            *(cache.get_or_call("fetch", {"url": "x"}, slow) for _ in range(5))
+        )
+
+        assert calls == 1
+        assert [r for r, _ in results] == ["result"] * 5
+        assert [hit for _, hit in results].count(False) == 1
+        assert (cache.hits, cache.misses) == (4, 1)
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self) -> None:
+        cache = ToolCache()
+
+        async def boom() -> str:
+            raise RuntimeError("down")
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_call("fetch", {}, boom)
+
+        async def ok() -> str:
+            return "up"
+
+        assert await cache.get_or_call("fetch", {}, ok) == ("up", False)
+
+    @pytest.mark.asyncio
+    async def test_store_backend(self) -> None:
+        store = InMemoryStore()
+        cache = ToolCache(ttl=60, store=store)
+
+        async def none_result() -> None:
+            return None
+
+        await cache.get_or_call("lookup", {"k": 1}, none_result)
+        assert await cache.get_or_call("lookup", {"k": 1}, none_result) == (None, True)
+        assert len(await store.keys(prefix="tool_cache:")) == 1
+
+
+class TestToolCacheDeclaration:
+    """Tests for declaring caches on tools."""
+
+    def test_tool_decorator_cache_option(self) -> None:
+        @tool(cache=True)
+        def lookup(key: str) -> str:
+            """Look up a key."""
+            return key
+
+        @tool
+        def plain(key: str) -> str:
+            """No cache."""
+            return key
+
+        assert isinstance(lookup.cache, ToolCache)
+        assert plain.cache is None
@@ -2,6 +2,8 @@
 Tests for TraceBus.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, AsyncMock
 
@@ -125,6 +127,38 @@ class TestTraceBus:
 
         assert bus.history_size == 5
 
+    async def test_history_ring_buffer_keeps_newest(self) -> None:
+        bus = TraceBus(max_history=3)
+
+        for i in range(7):
+            await bus.publish(Trace(type=TraceType.TASK_CREATED, data={"i": i}))
+
+        assert [e.data["i"] for e in bus.get_history()] == [4, 5, 6]
+        assert [e.data["i"] for e in bus.get_history(limit=2)] == [5, 6]
+
+    async def test_background_dispatch(self) -> None:
+        bus = TraceBus(background=True)
+        seen: list[Trace] = []
+
+        async def slow_handler(trace: Trace) -> None:
+            await asyncio.sleep(0.01)
+            seen.append(trace)
+
+        bus.subscribe_all(slow_handler)
+        events = [Trace(type=TraceType.TASK_CREATED) for _ in range(3)]
+        for event in events:
+            await bus.publish(event)
+
+        # publish returns before handlers run; history is already recorded
+        assert seen == []
+        assert bus.history_size == 3
+
+        await bus.flush()
+        assert seen == events
+
+        await bus.close()
+        assert bus.get_stats()["pending_dispatch"] == 0
+
     def test_clear_history(self, trace_bus: TraceBus) -> None:
         trace_bus._event_history.append(Trace(type=TraceType.TASK_CREATED))
         trace_bus.clear_history()
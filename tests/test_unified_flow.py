@@ -1,5 +1,8 @@
 """Tests for the unified Flow orchestration engine."""
 
+import asyncio
+import time
+
 import pytest
 from datetime import datetime
 
@@ -237,6 +240,176 @@ class TestFlow:
         assert cloned is not flow
 
 
+class _FanOut:
+    """Reactor that emits several events at once."""
+
+    def __init__(self, make: object) -> None:
+        self.make = make
+
+    async def handle(self, event: Event, ctx: object) -> list[Event]:
+        result = self.make(event)  # type: ignore[operator]
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
+
+class TestFlowConcurrency:
+    """Tests for concurrent reactor scheduling in Flow.run."""
+
+    @pytest.mark.asyncio
+    async def test_fan_out_runs_in_parallel(self) -> None:
+        """Reactors on one event overlap up to max_concurrent."""
+        async def work(event: Event) -> None:
+            await asyncio.sleep(0.05)
+
+        async def timed(max_concurrent: int) -> tuple[float, FlowResult]:
+            flow = Flow(config=FlowConfig(max_concurrent=max_concurrent, event_timeout=0.01))
+            for i in range(6):
+                flow.register(work, on="task.created", name=f"worker{i}")
+            start = time.perf_counter()
+            result = await flow.run(task="fan out")
+            return time.perf_counter() - start, result
+
+        parallel, result = await timed(6)
+        limited, _ = await timed(2)
+
+        assert result.success
+        assert result.events_processed == 1
+        assert parallel < 0.15
+        assert limited >= 0.14  # Three waves of two
+
+    @pytest.mark.asyncio
+    async def test_independent_branches_overlap(self) -> None:
+        """Events from different branches are processed concurrently."""
+        flow = Flow(config=FlowConfig(event_timeout=0.01))
+
+        fan_out = _FanOut(
+            lambda event: [Event(name="step", data={"branch": b, "stage": 0}) for b in "abc"]
+        )
+
+        async def stage(event: Event) -> Event:
+            await asyncio.sleep(0.03)
+            data = {**event.data, "stage": event.data["stage"] + 1}
+            return Event(name="step" if data["stage"] < 3 else "branch.done", data=data)
+
+        flow.register(fan_out, on="task.created", name="fan_out")
+        flow.register(stage, on="step")
+
+        start = time.perf_counter()
+        result = await flow.run(task="branches")
+
+        assert time.perf_counter() - start < 0.2  # Critical path is 3 x 30ms
+        assert result.events_processed == 13
+
+    @pytest.mark.asyncio
+    async def test_priority_and_correlation_order(self) -> None:
+        """Reactions start by priority; a correlation ID serializes its events."""
+        flow = Flow(config=FlowConfig(event_timeout=0.01))
+        log: list[str] = []
+
+        fan_out = _FanOut(
+            lambda event: [
+                Event(name="msg", data={"n": n}, correlation_id="session")
+                for n in range(3)
+            ]
+        )
+
+        async def handle(event: Event) -> None:
+            log.append(f"start {event.data['n']}")
+            await asyncio.sleep(0.01 * (3 - event.data["n"]))
+            log.append(f"end {event.data['n']}")
+
+        def low(event: Event) -> None:
+            log.append("low")
+
+        def high(event: Event) -> None:
+            log.append("high")
+
+        flow.register(low, on="task.created", priority=0)
+        flow.register(high, on="task.created", priority=10)
+        flow.register(fan_out, on="task.created", name="fan_out", priority=5)
+        flow.register(handle, on="msg")
+
+        result = await flow.run(task="ordered")
+
+        assert result.success
+        assert log[:2] == ["high", "low"]
+        assert log[2:] == ["start 0", "end 0", "start 1", "end 1", "start 2", "end 2"]
+
+    @pytest.mark.asyncio
+    async def test_stop_event_drains_dispatched_reactions(self) -> None:
+        """A stop event ends the flow after reactions already dispatched finish."""
+        log: list[str] = []
+
+        def finish(event: Event) -> Event:
+            log.append("finish")
+            return Event(name="flow.done", data={"output": "finished"})
+
+        async def second(event: Event) -> Event:
+            log.append("second start")
+            await asyncio.sleep(0.05)
+            log.append("second end")
+            return Event(name="second.done", data={"output": "late"})
+
+        async def after_stop(event: Event) -> None:
+            log.append("after stop")
+
+        for max_concurrent in (1, 10):
+            log.clear()
+            flow = Flow(config=FlowConfig(max_concurrent=max_concurrent))
+            flow.register(finish, on="task.created", priority=10)
+            flow.register(second, on="task.created")
+            flow.register(after_stop, on="second.done")
+
+            result = await flow.run(task="stop")
+
+            assert log == ["finish", "second start", "second end"]
+            assert result.output == "finished"
+            assert result.final_event.name == "flow.done"
+
+    @pytest.mark.asyncio
+    async def test_single_slot_matches_sequential_order(self) -> None:
+        """max_concurrent=1 handles each event's reactions before the next event."""
+        log: list[str] = []
+
+        async def react(event: Event) -> list[Event]:
+            depth = event.data.get("depth", 0)
+            log.append(f"start {event.name}:{depth}")
+            await asyncio.sleep(0.001)
+            log.append(f"end {event.name}:{depth}")
+            if depth < 2:
+                return [Event(name=n, data={"depth": depth + 1}) for n in ("left", "right")]
+            return []
+
+        flow = Flow(config=FlowConfig(max_concurrent=1, event_timeout=0.01))
+        flow.register(_FanOut(react), on="task.created", name="root")
+        flow.register(_FanOut(react), on="left", name="left")
+        flow.register(_FanOut(react), on="right", name="right")
+
+        result = await flow.run(task="sequential")
+
+        # Breadth-first, one reaction at a time
+        expected = ["task.created:0", "left:1", "right:1", "left:2", "right:2", "left:2", "right:2"]
+        assert log == [f"{phase} {step}" for step in expected for phase in ("start", "end")]
+        assert result.events_processed == 7
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_reports_error(self) -> None:
+        """fail_fast returns the first reactor error."""
+        flow = Flow(config=FlowConfig(event_timeout=0.01))
+
+        async def boom(event: Event) -> None:
+            raise ValueError("broken")
+
+        flow.register(boom, on="task.created")
+
+        result = await flow.run(task="fail")
+
+        assert not result.success
+        assert result.error == "broken"
+        assert result.events_processed == 1
+
+
 class TestFlowPatternMatching:
     """Tests for event pattern matching."""
 
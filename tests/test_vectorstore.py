@@ -342,6 +342,65 @@ class TestInMemoryBackend:
             )
 
 
+    @pytest.mark.asyncio
+    async def test_search_after_delete_and_compaction(
+        self, backend: InMemoryBackend
+    ) -> None:
+        """Test that deleted rows never surface and compaction keeps ids aligned."""
+        ids = [f"doc-{i}" for i in range(20)]
+        embeddings = [[float(i), 1.0, 0.0] for i in range(20)]
+        docs = [Document(text=f"Doc {i}") for i in range(20)]
+        await backend.add(ids, embeddings, docs)
+
+        await backend.delete([f"doc-{i}" for i in range(0, 20, 2)])
+        assert backend.count() == 10
+
+        results = await backend.search([19.0, 1.0, 0.0], k=20)
+        assert len(results) == 10
+        assert {r.id for r in results} == {f"doc-{i}" for i in range(1, 20, 2)}
+        assert all(r.document.text == f"Doc {r.id.split('-')[1]}" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_add_existing_id_overwrites(self, backend: InMemoryBackend) -> None:
+        """Test that re-adding an id replaces its embedding and document."""
+        await backend.add(["a", "b"], [[1, 0, 0], [0, 1, 0]], [Document(text="A"), Document(text="B")])
+        await backend.add(["a"], [[0, 0, 1]], [Document(text="A2")])
+
+        assert backend.count() == 2
+        results = await backend.search([0, 0, 1], k=1)
+        assert results[0].id == "a"
+        assert results[0].document.text == "A2"
+
+    @pytest.mark.asyncio
+    async def test_top_k_matches_full_sort(self, backend: InMemoryBackend) -> None:
+        """Test partial top-k selection against a brute-force ranking."""
+        import random
+
+        rng = random.Random(0)
+        embeddings = [[rng.uniform(-1, 1) for _ in range(8)] for _ in range(500)]
+        ids = [f"doc-{i}" for i in range(500)]
+        await backend.add(ids, embeddings, [Document(text=i) for i in ids])
+
+        query = [rng.uniform(-1, 1) for _ in range(8)]
+        results = await backend.search(query, k=10)
+
+        q = InMemoryBackend._normalize_vector(query)
+        expected = sorted(
+            ids,
+            key=lambda i: -InMemoryBackend._dot_product(
+                q, InMemoryBackend._normalize_vector(embeddings[int(i.split("-")[1])])
+            ),
+        )[:10]
+        assert [r.id for r in results] == expected
+
+    @pytest.mark.asyncio
+    async def test_dimension_mismatch_raises(self, backend: InMemoryBackend) -> None:
+        """Test that embeddings of a different dimension are rejected."""
+        await backend.add(["a"], [[1.0, 0.0, 0.0]], [Document(text="A")])
+        with pytest.raises(ValueError, match="dimension"):
+            await backend.add(["b"], [[1.0, 0.0]], [Document(text="B")])
+
+
 # ============================================================
 # Similarity Metric Tests
 # ============================================================
@@ -692,6 +751,39 @@ class TestVectorStoreWithMockEmbeddings:
         assert len(results) == 3
         assert results[0].score >= results[1].score >= results[2].score
     
+    @pytest.mark.asyncio
+    async def test_search_many_matches_search(self) -> None:
+        """Test that batched search embeds once and matches single searches."""
+        store = VectorStore.with_mock_embeddings()
+        await store.add_texts(
+            ["The quick brown fox", "A fast brown fox", "Hello world", "Rust is fast"],
+            metadatas=[{"kind": "fox"}, {"kind": "fox"}, {"kind": "greeting"}, {"kind": "lang"}],
+        )
+
+        calls: list[list[str]] = []
+        original = store.embeddings.aembed_texts
+
+        async def counting(texts: list[str]) -> list[list[float]]:
+            calls.append(texts)
+            return await original(texts)
+
+        store.embeddings.aembed_texts = counting  # type: ignore[method-assign]
+
+        queries = ["brown fox", "hello", "brown fox"]
+        batches = await store.search_many(queries, k=2)
+        assert calls == [["brown fox", "hello"]]
+
+        for query, batch in zip(queries, batches, strict=True):
+            single = await store.search(query, k=2)
+            assert [r.id for r in batch] == [r.id for r in single]
+            assert [r.score for r in batch] == pytest.approx([r.score for r in single], abs=1e-5)
+
+        filtered = await store.search_many(
+            ["brown fox", "brown fox"], k=4, filter=[{"kind": "fox"}, {"kind": "lang"}]
+        )
+        assert {r.document.metadata["kind"] for r in filtered[0]} == {"fox"}
+        assert [r.document.text for r in filtered[1]] == ["Rust is fast"]
+
     @pytest.mark.asyncio
     async def test_as_retriever(self) -> None:
         """Test converting VectorStore to DenseRetriever."""